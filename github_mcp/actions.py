@@ -5,63 +5,73 @@ Converted from github-mcp-server/pkg/github/actions.go
 
 import json
 import base64
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
 from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 from mcp.types import Tool, CallToolRequest, CallToolResult
 from mcp.server.fastmcp import FastMCP
 from .server import (
-    GetClientFn, TranslationHelperFunc, required_param, optional_param,
-    optional_bool_param_with_default, optional_pagination_params,
-    to_bool_ptr, marshalled_text_result
+    GetClientFn, TranslationHelperFunc, default_translator, Fields, get_field, compile_params, required, optional,
+    optional_int_array, pagination, tool_handler, error_result, run_in_thread,
+    get_repository, marshalled_text_result
 )
 from .clients import GraphQLClient
 import logging
 
 logger = logging.getLogger(__name__)
 
+_WORKFLOW_FIELDS = Fields(
+    ('id', 0), ('name', ''), ('path', ''), ('state', ''),
+    ('created_at', None), ('updated_at', None), ('html_url', '')
+)
+
+_RUN_FIELDS = Fields(
+    ('id', 0), ('name', ''), ('head_branch', ''), ('head_sha', ''), ('run_number', 0),
+    ('event', ''), ('status', ''), ('conclusion', ''),
+    ('created_at', None), ('updated_at', None), ('html_url', '')
+)
+
+_JOB_FIELDS = Fields(
+    ('id', 0), ('run_id', 0), ('name', ''), ('status', ''), ('conclusion', ''),
+    ('started_at', None), ('completed_at', None), ('html_url', '')
+)
+
+_STEP_FIELDS = Fields(
+    ('name', ''), ('status', ''), ('conclusion', ''), ('number', 0),
+    ('started_at', None), ('completed_at', None)
+)
+
+_ARTIFACT_FIELDS = Fields(
+    ('id', 0), ('name', ''), ('size_in_bytes', 0), ('created_at', None),
+    ('expired', False), ('expires_at', None)
+)
+
+_ACTOR_FIELDS = Fields(('login', ''), ('id', 0), ('html_url', ''))
+
+_MISSING = object()
+
+
 # Type definitions for GitHub API responses
 def convert_to_workflow(workflow: Any) -> Dict[str, Any]:
-    """Convert GitHub workflow to dictionary format."""
+    """Convert a GitHub workflow, or its raw JSON, to dictionary format."""
     if not workflow:
         return {}
 
-    return {
-        'id': getattr(workflow, 'id', 0),
-        'name': getattr(workflow, 'name', ''),
-        'path': getattr(workflow, 'path', ''),
-        'state': getattr(workflow, 'state', ''),
-        'created_at': getattr(workflow, 'created_at', '').isoformat() if hasattr(workflow, 'created_at') and workflow.created_at else None,
-        'updated_at': getattr(workflow, 'updated_at', '').isoformat() if hasattr(workflow, 'updated_at') and workflow.updated_at else None,
-        'html_url': getattr(workflow, 'html_url', ''),
-    }
+    return _WORKFLOW_FIELDS.extract(workflow)
 
 
 def convert_to_workflow_run(run: Any) -> Dict[str, Any]:
-    """Convert GitHub workflow run to dictionary format."""
+    """Convert a GitHub workflow run, or its raw JSON, to dictionary format."""
     if not run:
         return {}
 
-    result = {
-        'id': getattr(run, 'id', 0),
-        'name': getattr(run, 'name', ''),
-        'head_branch': getattr(run, 'head_branch', ''),
-        'head_sha': getattr(run, 'head_sha', ''),
-        'run_number': getattr(run, 'run_number', 0),
-        'event': getattr(run, 'event', ''),
-        'status': getattr(run, 'status', ''),
-        'conclusion': getattr(run, 'conclusion', ''),
-        'created_at': getattr(run, 'created_at', '').isoformat() if hasattr(run, 'created_at') and run.created_at else None,
-        'updated_at': getattr(run, 'updated_at', '').isoformat() if hasattr(run, 'updated_at') and run.updated_at else None,
-        'html_url': getattr(run, 'html_url', ''),
-    }
+    result = _RUN_FIELDS.extract(run)
 
     # Extract trigger actor information
-    if hasattr(run, 'triggering_actor') and run.triggering_actor:
-        result['triggering_actor'] = {
-            'login': getattr(run.triggering_actor, 'login', ''),
-            'id': getattr(run.triggering_actor, 'id', 0),
-            'html_url': getattr(run.triggering_actor, 'html_url', ''),
-        }
+    actor = get_field(run, 'triggering_actor')
+    if actor:
+        result['triggering_actor'] = _ACTOR_FIELDS.extract(actor)
 
     return result
 
@@ -71,29 +81,15 @@ def convert_to_workflow_job(job: Any) -> Dict[str, Any]:
     if not job:
         return {}
 
-    result = {
-        'id': getattr(job, 'id', 0),
-        'run_id': getattr(job, 'run_id', 0),
-        'name': getattr(job, 'name', ''),
-        'status': getattr(job, 'status', ''),
-        'conclusion': getattr(job, 'conclusion', ''),
-        'started_at': getattr(job, 'started_at', '').isoformat() if hasattr(job, 'started_at') and job.started_at else None,
-        'completed_at': getattr(job, 'completed_at', '').isoformat() if hasattr(job, 'completed_at') and job.completed_at else None,
-        'html_url': getattr(job, 'html_url', ''),
-    }
+    result = _JOB_FIELDS.extract(job)
 
     # Extract steps information
-    if hasattr(job, 'steps'):
-        result['steps'] = []
-        for step in job.steps or []:
-            result['steps'].append({
-                'name': getattr(step, 'name', ''),
-                'status': getattr(step, 'status', ''),
-                'conclusion': getattr(step, 'conclusion', ''),
-                'number': getattr(step, 'number', 0),
-                'started_at': getattr(step, 'started_at', '').isoformat() if hasattr(step, 'started_at') and step.started_at else None,
-                'completed_at': getattr(step, 'completed_at', '').isoformat() if hasattr(step, 'completed_at') and step.completed_at else None,
-            })
+    steps = getattr(job, 'steps', _MISSING)
+    if steps is not _MISSING:
+        result['steps'] = [
+            _STEP_FIELDS.extract(step)
+            for step in steps or []
+        ]
 
     return result
 
@@ -103,448 +99,416 @@ def convert_to_artifact(artifact: Any) -> Dict[str, Any]:
     if not artifact:
         return {}
 
-    return {
-        'id': getattr(artifact, 'id', 0),
-        'name': getattr(artifact, 'name', ''),
-        'size_in_bytes': getattr(artifact, 'size_in_bytes', 0),
-        'created_at': getattr(artifact, 'created_at', '').isoformat() if hasattr(artifact, 'created_at') and artifact.created_at else None,
-        'expired': getattr(artifact, 'expired', False),
-        'expires_at': getattr(artifact, 'expires_at', '').isoformat() if hasattr(artifact, 'expires_at') and artifact.expires_at else None,
-    }
+    return _ARTIFACT_FIELDS.extract(artifact)
+
+
+_LIST_WORKFLOWS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "owner": {
+            "type": "string",
+            "description": "Repository owner"
+        },
+        "repo": {
+            "type": "string",
+            "description": "Repository name"
+        },
+        "page": {
+            "type": "number",
+            "description": "Page number for pagination (min 1)",
+            "minimum": 1
+        },
+        "perPage": {
+            "type": "number",
+            "description": "Results per page for pagination (min 1, max 100)",
+            "minimum": 1,
+            "maximum": 100
+        }
+    },
+    "required": ["owner", "repo"]
+}
+
+_LIST_WORKFLOWS_PARAMS = compile_params(required("owner", str), required("repo", str), pagination())
 
 
 def list_workflows_tool(get_client: GetClientFn, translator: TranslationHelperFunc) -> Tuple[Tool, Callable]:
     """Create the list_workflows tool."""
 
+    @run_in_thread
+    @tool_handler("list_workflows")
     def handler(ctx: Any, request: CallToolRequest) -> CallToolResult:
-        try:
-            # Extract parameters
-            owner, err = required_param(request, "owner", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            repo, err = required_param(request, "repo", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            pagination, err = optional_pagination_params(request)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            # Get GitHub client
-            client = get_client(ctx)
+        # Extract parameters
+        args, err = _LIST_WORKFLOWS_PARAMS(request)
+        if err:
+            return error_result(str(err))
+        owner, repo, pagination = args
 
-            try:
-                # Get workflows
-                repository = client.get_repo(f"{owner}/{repo}")
-                workflows = repository.get_workflows()
+        # Get GitHub client
+        client = get_client(ctx)
 
-                # Convert to list of workflows
-                result = []
-                for workflow in workflows:
-                    result.append(convert_to_workflow(workflow))
-
-                return marshalled_text_result(result)
+        try:
+            # Fetch exactly the requested page as raw JSON
+            repository = get_repository(client, owner, repo)
+            _, data = client.requester.requestJsonAndCheck(
+                "GET", f"{repository.url}/actions/workflows",
+                parameters={'page': pagination.page, 'per_page': pagination.per_page}
+            )
 
-            except Exception as e:
-                logger.error(f"Failed to list workflows: {e}")
-                return CallToolResult(type="error", error={"message": f"Failed to list workflows: {str(e)}"})
+            return marshalled_text_result([convert_to_workflow(workflow) for workflow in data.get('workflows', [])])
 
         except Exception as e:
-            logger.error(f"Error in list_workflows handler: {e}")
-            return CallToolResult(type="error", error={"message": str(e)})
+            logger.error("Failed to list workflows: %s", e)
+            return error_result(f"Failed to list workflows: {str(e)}")
 
     tool = Tool(
         name="list_workflows",
         description=translator("TOOL_LIST_WORKFLOWS_DESCRIPTION", "List GitHub Actions workflows for a repository"),
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "owner": {
-                    "type": "string",
-                    "description": "Repository owner"
-                },
-                "repo": {
-                    "type": "string",
-                    "description": "Repository name"
-                },
-                "page": {
-                    "type": "number",
-                    "description": "Page number for pagination (min 1)",
-                    "minimum": 1
-                },
-                "perPage": {
-                    "type": "number",
-                    "description": "Results per page for pagination (min 1, max 100)",
-                    "minimum": 1,
-                    "maximum": 100
-                }
-            },
-            "required": ["owner", "repo"]
-        }
+        inputSchema=_LIST_WORKFLOWS_SCHEMA
     )
 
     return tool, handler
 
 
+_LIST_WORKFLOW_RUNS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "owner": {
+            "type": "string",
+            "description": "Repository owner"
+        },
+        "repo": {
+            "type": "string",
+            "description": "Repository name"
+        },
+        "workflow_id": {
+            "type": "string",
+            "description": "Workflow ID or filename to filter by"
+        },
+        "branch": {
+            "type": "string",
+            "description": "Branch name to filter runs by"
+        },
+        "event": {
+            "type": "string",
+            "description": "Event type to filter runs by"
+        },
+        "status": {
+            "type": "string",
+            "description": "Run status to filter by",
+            "enum": ["completed", "in_progress", "queued"]
+        },
+        "page": {
+            "type": "number",
+            "description": "Page number for pagination (min 1)",
+            "minimum": 1
+        },
+        "perPage": {
+            "type": "number",
+            "description": "Results per page for pagination (min 1, max 100)",
+            "minimum": 1,
+            "maximum": 100
+        }
+    },
+    "required": ["owner", "repo"]
+}
+
+_LIST_WORKFLOW_RUNS_PARAMS = compile_params(
+    required("owner", str), required("repo", str), optional("workflow_id", str),
+    optional("branch", str), optional("event", str), optional("status", str), pagination()
+)
+
+
 def list_workflow_runs_tool(get_client: GetClientFn, translator: TranslationHelperFunc) -> Tuple[Tool, Callable]:
     """Create the list_workflow_runs tool."""
 
+    @run_in_thread
+    @tool_handler("list_workflow_runs")
     def handler(ctx: Any, request: CallToolRequest) -> CallToolResult:
+        # Extract parameters
+        args, err = _LIST_WORKFLOW_RUNS_PARAMS(request)
+        if err:
+            return error_result(str(err))
+        owner, repo, workflow_id, branch, event, status, pagination = args
+
+        # Get GitHub client
+        client = get_client(ctx)
+
         try:
-            # Extract parameters
-            owner, err = required_param(request, "owner", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            repo, err = required_param(request, "repo", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            workflow_id, err = optional_param(request, "workflow_id", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            branch, err = optional_param(request, "branch", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            event, err = optional_param(request, "event", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            status, err = optional_param(request, "status", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            pagination, err = optional_pagination_params(request)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            # Get GitHub client
-            client = get_client(ctx)
-
-            try:
-                # Get workflow runs
-                repository = client.get_repo(f"{owner}/{repo}")
-
-                if workflow_id:
-                    # Get runs for specific workflow
-                    workflow = repository.get_workflow(workflow_id)
-                    runs = workflow.get_runs()
-                else:
-                    # Get all runs for repository
-                    runs = repository.get_workflow_runs()
-
-                # Apply filters if provided
-                filtered_runs = []
-                for run in runs:
-                    if branch and getattr(run, 'head_branch', '') != branch:
-                        continue
-                    if event and getattr(run, 'event', '') != event:
-                        continue
-                    if status and getattr(run, 'status', '') != status:
-                        continue
-                    filtered_runs.append(run)
-
-                # Convert to list of runs
-                result = []
-                for run in filtered_runs[:pagination.per_page]:
-                    result.append(convert_to_workflow_run(run))
-
-                return marshalled_text_result(result)
-
-            except Exception as e:
-                logger.error(f"Failed to list workflow runs: {e}")
-                return CallToolResult(type="error", error={"message": f"Failed to list workflow runs: {str(e)}"})
+            # Fetch exactly the requested page as raw JSON, letting the API
+            # apply the filters
+            repository = get_repository(client, owner, repo)
+            params = {'page': pagination.page, 'per_page': pagination.per_page}
+            params.update((k, v) for k, v in (('branch', branch), ('event', event), ('status', status)) if v)
+
+            if workflow_id:
+                # Runs of one workflow, by ID or file name
+                url = f"{repository.url}/actions/workflows/{quote(workflow_id, safe='')}/runs"
+            else:
+                url = f"{repository.url}/actions/runs"
+            _, data = client.requester.requestJsonAndCheck("GET", url, parameters=params)
+
+            return marshalled_text_result([convert_to_workflow_run(run) for run in data.get('workflow_runs', [])])
 
         except Exception as e:
-            logger.error(f"Error in list_workflow_runs handler: {e}")
-            return CallToolResult(type="error", error={"message": str(e)})
+            logger.error("Failed to list workflow runs: %s", e)
+            return error_result(f"Failed to list workflow runs: {str(e)}")
 
     tool = Tool(
         name="list_workflow_runs",
         description=translator("TOOL_LIST_WORKFLOW_RUNS_DESCRIPTION", "List GitHub Actions workflow runs for a repository"),
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "owner": {
-                    "type": "string",
-                    "description": "Repository owner"
-                },
-                "repo": {
-                    "type": "string",
-                    "description": "Repository name"
-                },
-                "workflow_id": {
-                    "type": "string",
-                    "description": "Workflow ID or filename to filter by"
-                },
-                "branch": {
-                    "type": "string",
-                    "description": "Branch name to filter runs by"
-                },
-                "event": {
-                    "type": "string",
-                    "description": "Event type to filter runs by"
-                },
-                "status": {
-                    "type": "string",
-                    "description": "Run status to filter by",
-                    "enum": ["completed", "in_progress", "queued"]
-                },
-                "page": {
-                    "type": "number",
-                    "description": "Page number for pagination (min 1)",
-                    "minimum": 1
-                },
-                "perPage": {
-                    "type": "number",
-                    "description": "Results per page for pagination (min 1, max 100)",
-                    "minimum": 1,
-                    "maximum": 100
-                }
-            },
-            "required": ["owner", "repo"]
-        }
+        inputSchema=_LIST_WORKFLOW_RUNS_SCHEMA
     )
 
     return tool, handler
 
 
-def get_workflow_run_tool(get_client: GetClientFn, translator: TranslationHelperFunc) -> Tuple[Tool, Callable]:
-    """Create the get_workflow_run tool."""
+_GET_WORKFLOW_RUN_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "owner": {
+            "type": "string",
+            "description": "Repository owner"
+        },
+        "repo": {
+            "type": "string",
+            "description": "Repository name"
+        },
+        "run_id": {
+            "type": "integer",
+            "description": "Workflow run ID"
+        }
+    },
+    "required": ["owner", "repo", "run_id"]
+}
 
-    def handler(ctx: Any, request: CallToolRequest) -> CallToolResult:
-        try:
-            # Extract parameters
-            owner, err = required_param(request, "owner", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
+_GET_WORKFLOW_RUN_PARAMS = compile_params(required("owner", str), required("repo", str), required("run_id", int))
 
-            repo, err = required_param(request, "repo", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
 
-            run_id, err = required_param(request, "run_id", int)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
+def get_workflow_run_tool(get_client: GetClientFn, translator: TranslationHelperFunc) -> Tuple[Tool, Callable]:
+    """Create the get_workflow_run tool."""
 
-            # Get GitHub client
-            client = get_client(ctx)
+    @run_in_thread
+    @tool_handler("get_workflow_run")
+    def handler(ctx: Any, request: CallToolRequest) -> CallToolResult:
+        # Extract parameters
+        args, err = _GET_WORKFLOW_RUN_PARAMS(request)
+        if err:
+            return error_result(str(err))
+        owner, repo, run_id = args
 
-            try:
-                # Get workflow run
-                repository = client.get_repo(f"{owner}/{repo}")
-                run = repository.get_workflow_run(run_id)
-                run_dict = convert_to_workflow_run(run)
-                return marshalled_text_result(run_dict)
+        # Get GitHub client
+        client = get_client(ctx)
 
-            except Exception as e:
-                logger.error(f"Failed to get workflow run {run_id}: {e}")
-                return CallToolResult(type="error", error={"message": f"Failed to get workflow run {run_id}: {str(e)}"})
+        try:
+            # Get workflow run
+            repository = get_repository(client, owner, repo)
+            run = repository.get_workflow_run(run_id)
+            run_dict = convert_to_workflow_run(run)
+            return marshalled_text_result(run_dict)
 
         except Exception as e:
-            logger.error(f"Error in get_workflow_run handler: {e}")
-            return CallToolResult(type="error", error={"message": str(e)})
+            logger.error("Failed to get workflow run %s: %s", run_id, e)
+            return error_result(f"Failed to get workflow run {run_id}: {str(e)}")
 
     tool = Tool(
         name="get_workflow_run",
         description=translator("TOOL_GET_WORKFLOW_RUN_DESCRIPTION", "Get details for a GitHub Actions workflow run"),
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "owner": {
-                    "type": "string",
-                    "description": "Repository owner"
-                },
-                "repo": {
-                    "type": "string",
-                    "description": "Repository name"
-                },
-                "run_id": {
-                    "type": "integer",
-                    "description": "Workflow run ID"
-                }
-            },
-            "required": ["owner", "repo", "run_id"]
-        }
+        inputSchema=_GET_WORKFLOW_RUN_SCHEMA
     )
 
     return tool, handler
 
 
-def run_workflow_tool(get_client: GetClientFn, translator: TranslationHelperFunc) -> Tuple[Tool, Callable]:
-    """Create the run_workflow tool."""
-
-    def handler(ctx: Any, request: CallToolRequest) -> CallToolResult:
-        try:
-            # Extract parameters
-            owner, err = required_param(request, "owner", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            repo, err = required_param(request, "repo", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
+_RUN_WORKFLOW_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "owner": {
+            "type": "string",
+            "description": "Repository owner"
+        },
+        "repo": {
+            "type": "string",
+            "description": "Repository name"
+        },
+        "workflow_id": {
+            "type": "string",
+            "description": "Workflow ID or filename"
+        },
+        "ref": {
+            "type": "string",
+            "description": "Git reference (branch, tag, or SHA) to run the workflow on"
+        },
+        "inputs": {
+            "type": "object",
+            "description": "Input parameters for the workflow",
+            "additionalProperties": {"type": "string"}
+        }
+    },
+    "required": ["owner", "repo", "workflow_id", "ref"]
+}
 
-            workflow_id, err = required_param(request, "workflow_id", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
+_RUN_WORKFLOW_PARAMS = compile_params(
+    required("owner", str), required("repo", str), required("workflow_id", str),
+    required("ref", str), optional("inputs", dict)
+)
 
-            ref, err = required_param(request, "ref", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
 
-            inputs, err = optional_param(request, "inputs", dict)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
+def run_workflow_tool(get_client: GetClientFn, translator: TranslationHelperFunc) -> Tuple[Tool, Callable]:
+    """Create the run_workflow tool."""
 
-            # Get GitHub client
-            client = get_client(ctx)
+    @run_in_thread
+    @tool_handler("run_workflow")
+    def handler(ctx: Any, request: CallToolRequest) -> CallToolResult:
+        # Extract parameters
+        args, err = _RUN_WORKFLOW_PARAMS(request)
+        if err:
+            return error_result(str(err))
+        owner, repo, workflow_id, ref, inputs = args
 
-            try:
-                # Run workflow
-                repository = client.get_repo(f"{owner}/{repo}")
-                workflow = repository.get_workflow(workflow_id)
+        # Get GitHub client
+        client = get_client(ctx)
 
-                # Prepare dispatch parameters
-                dispatch_params = {
-                    'ref': ref,
-                }
+        try:
+            # Run workflow
+            repository = get_repository(client, owner, repo)
+            workflow = repository.get_workflow(workflow_id)
 
-                if inputs:
-                    dispatch_params['inputs'] = inputs
+            # Prepare dispatch parameters
+            dispatch_params = {
+                'ref': ref,
+            }
 
-                result = workflow.create_dispatch(**dispatch_params)
+            if inputs:
+                dispatch_params['inputs'] = inputs
 
-                return marshalled_text_result({
-                    'message': 'Workflow dispatched successfully',
-                    'workflow_id': workflow_id,
-                    'ref': ref
-                })
+            result = workflow.create_dispatch(**dispatch_params)
 
-            except Exception as e:
-                logger.error(f"Failed to run workflow {workflow_id}: {e}")
-                return CallToolResult(type="error", error={"message": f"Failed to run workflow {workflow_id}: {str(e)}"})
+            return marshalled_text_result({
+                'message': 'Workflow dispatched successfully',
+                'workflow_id': workflow_id,
+                'ref': ref
+            })
 
         except Exception as e:
-            logger.error(f"Error in run_workflow handler: {e}")
-            return CallToolResult(type="error", error={"message": str(e)})
+            logger.error("Failed to run workflow %s: %s", workflow_id, e)
+            return error_result(f"Failed to run workflow {workflow_id}: {str(e)}")
 
     tool = Tool(
         name="run_workflow",
         description=translator("TOOL_RUN_WORKFLOW_DESCRIPTION", "Trigger a GitHub Actions workflow run"),
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "owner": {
-                    "type": "string",
-                    "description": "Repository owner"
-                },
-                "repo": {
-                    "type": "string",
-                    "description": "Repository name"
-                },
-                "workflow_id": {
-                    "type": "string",
-                    "description": "Workflow ID or filename"
-                },
-                "ref": {
-                    "type": "string",
-                    "description": "Git reference (branch, tag, or SHA) to run the workflow on"
-                },
-                "inputs": {
-                    "type": "object",
-                    "description": "Input parameters for the workflow",
-                    "additionalProperties": {"type": "string"}
-                }
-            },
-            "required": ["owner", "repo", "workflow_id", "ref"]
-        }
+        inputSchema=_RUN_WORKFLOW_SCHEMA
     )
 
     return tool, handler
 
 
-def list_workflow_run_artifacts_tool(get_client: GetClientFn, translator: TranslationHelperFunc) -> Tuple[Tool, Callable]:
-    """Create the list_workflow_run_artifacts tool."""
+# Number of workflow runs whose artifacts are fetched concurrently
+ARTIFACT_FETCH_WORKERS = 8
 
-    def handler(ctx: Any, request: CallToolRequest) -> CallToolResult:
-        try:
-            # Extract parameters
-            owner, err = required_param(request, "owner", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
+# Most additional run IDs accepted by one list_workflow_run_artifacts call
+MAX_ARTIFACT_RUNS = 20
 
-            repo, err = required_param(request, "repo", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
 
-            run_id, err = required_param(request, "run_id", int)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
+def list_run_artifacts(client: Any, repository: Any, run_id: int, pagination: Any) -> List[Dict[str, Any]]:
+    """Fetch and convert one page of a workflow run's artifacts."""
+    _, data = client.requester.requestJsonAndCheck(
+        "GET", f"{repository.url}/actions/runs/{run_id}/artifacts",
+        parameters={'page': pagination.page, 'per_page': pagination.per_page}
+    )
+    return [convert_to_artifact(artifact) for artifact in data.get('artifacts', [])]
+
+
+def list_artifacts_for_runs(client: Any, repository: Any, run_ids: List[int], pagination: Any) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Fetch and convert the same page of artifacts for several workflow runs
+    concurrently. The work is network-bound, so threads overlap the API
+    round-trips. Results are keyed by run ID.
+    """
+    def fetch(run_id: int) -> List[Dict[str, Any]]:
+        return list_run_artifacts(client, repository, run_id, pagination)
+
+    with ThreadPoolExecutor(max_workers=min(ARTIFACT_FETCH_WORKERS, len(run_ids))) as executor:
+        return {str(run_id): artifacts for run_id, artifacts in zip(run_ids, executor.map(fetch, run_ids))}
+
+
+_LIST_WORKFLOW_RUN_ARTIFACTS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "owner": {
+            "type": "string",
+            "description": "Repository owner"
+        },
+        "repo": {
+            "type": "string",
+            "description": "Repository name"
+        },
+        "run_id": {
+            "type": "integer",
+            "description": "Workflow run ID"
+        },
+        "run_ids": {
+            "type": "array",
+            "items": {
+                "type": "integer"
+            },
+            "maxItems": MAX_ARTIFACT_RUNS,
+            "description": "Additional workflow run IDs. When set, the requested page of artifacts for run_id and each of these runs is fetched concurrently and returned keyed by run ID"
+        },
+        "page": {
+            "type": "number",
+            "description": "Page number for pagination (min 1)",
+            "minimum": 1
+        },
+        "perPage": {
+            "type": "number",
+            "description": "Results per page for pagination (min 1, max 100)",
+            "minimum": 1,
+            "maximum": 100
+        }
+    },
+    "required": ["owner", "repo", "run_id"]
+}
 
-            pagination, err = optional_pagination_params(request)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
+_LIST_WORKFLOW_RUN_ARTIFACTS_PARAMS = compile_params(
+    required("owner", str), required("repo", str), required("run_id", int),
+    optional_int_array("run_ids", MAX_ARTIFACT_RUNS), pagination()
+)
+
+
+def list_workflow_run_artifacts_tool(get_client: GetClientFn, translator: TranslationHelperFunc) -> Tuple[Tool, Callable]:
+    """Create the list_workflow_run_artifacts tool."""
 
-            # Get GitHub client
-            client = get_client(ctx)
+    @run_in_thread
+    @tool_handler("list_workflow_run_artifacts")
+    def handler(ctx: Any, request: CallToolRequest) -> CallToolResult:
+        # Extract parameters
+        args, err = _LIST_WORKFLOW_RUN_ARTIFACTS_PARAMS(request)
+        if err:
+            return error_result(str(err))
+        owner, repo, run_id, run_ids, pagination = args
 
-            try:
-                # Get workflow run artifacts
-                repository = client.get_repo(f"{owner}/{repo}")
-                run = repository.get_workflow_run(run_id)
-                artifacts = run.get_artifacts()
+        # Get GitHub client
+        client = get_client(ctx)
 
-                # Convert to list of artifacts
-                result = []
-                for artifact in artifacts:
-                    result.append(convert_to_artifact(artifact))
+        try:
+            # Get workflow run artifacts
+            repository = get_repository(client, owner, repo)
 
-                return marshalled_text_result(result)
+            if run_ids:
+                # Fetch the extra runs alongside run_id, keyed by run ID
+                ids = list(dict.fromkeys((run_id, *run_ids)))
+                return marshalled_text_result(list_artifacts_for_runs(client, repository, ids, pagination))
 
-            except Exception as e:
-                logger.error(f"Failed to list workflow run artifacts for {run_id}: {e}")
-                return CallToolResult(type="error", error={"message": f"Failed to list workflow run artifacts for {run_id}: {str(e)}"})
+            return marshalled_text_result(list_run_artifacts(client, repository, run_id, pagination))
 
         except Exception as e:
-            logger.error(f"Error in list_workflow_run_artifacts handler: {e}")
-            return CallToolResult(type="error", error={"message": str(e)})
+            logger.error("Failed to list workflow run artifacts for %s: %s", run_id, e)
+            return error_result(f"Failed to list workflow run artifacts for {run_id}: {str(e)}")
 
     tool = Tool(
         name="list_workflow_run_artifacts",
         description=translator("TOOL_LIST_WORKFLOW_RUN_ARTIFACTS_DESCRIPTION", "List artifacts for a GitHub Actions workflow run"),
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "owner": {
-                    "type": "string",
-                    "description": "Repository owner"
-                },
-                "repo": {
-                    "type": "string",
-                    "description": "Repository name"
-                },
-                "run_id": {
-                    "type": "integer",
-                    "description": "Workflow run ID"
-                },
-                "page": {
-                    "type": "number",
-                    "description": "Page number for pagination (min 1)",
-                    "minimum": 1
-                },
-                "perPage": {
-                    "type": "number",
-                    "description": "Results per page for pagination (min 1, max 100)",
-                    "minimum": 1,
-                    "maximum": 100
-                }
-            },
-            "required": ["owner", "repo", "run_id"]
-        }
+        inputSchema=_LIST_WORKFLOW_RUN_ARTIFACTS_SCHEMA
     )
 
     return tool, handler
@@ -554,7 +518,7 @@ def list_workflow_run_artifacts_tool(get_client: GetClientFn, translator: Transl
 def get_actions_tools(get_client: GetClientFn, translator: Optional[TranslationHelperFunc] = None) -> List[Tuple[Tool, Callable]]:
     """Get all GitHub Actions-related tools."""
     if translator is None:
-        translator = lambda key, default: default
+        translator = default_translator
 
     tools = [
         list_workflows_tool(get_client, translator),
@@ -4,17 +4,250 @@ Converted from github-mcp-server internal client creation logic
 """
 
 import os
-from typing import Any, Optional
-from urllib.parse import urlparse, urljoin
+import functools
+import hashlib
+import json
+import re
+from collections import OrderedDict
+from concurrent.futures import Future
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import quote
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from requests.structures import CaseInsensitiveDict
 from github import Github
+from github.Requester import HTTPRequestsConnectionClass, HTTPSRequestsConnectionClass
 import logging
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Connection pool sizing for the shared HTTP sessions
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 100
+
+# Shared HTTP sessions keyed by (endpoint, token, user agent). Each entry holds
+# the session and the number of clients currently using it.
+_sessions: Dict[Tuple[str, str, str], List[Any]] = {}
+_sessions_lock = threading.Lock()
+
+# Number of GraphQL responses kept for conditional (If-None-Match) requests
+GRAPHQL_ETAG_CACHE_SIZE = 256
+
+_MUTATION_RE = re.compile(r'^\s*mutation\b')
+
+# Number of REST GET responses kept for conditional (If-None-Match) requests
+REST_ETAG_CACHE_SIZE = 1024
+
+# Total body bytes the REST ETag cache may hold, and the largest single
+# body it keeps; bigger responses (large diffs, file pages) are not cached
+REST_ETAG_CACHE_MAX_BYTES = 64 * 1024 * 1024
+REST_ETAG_CACHE_MAX_ENTRY_BYTES = 1024 * 1024
+
+
+class ETagCache:
+    """
+    Thread-safe LRU of (ETag, body, headers) entries for conditional GETs.
+    Bounded both by entry count and by the total size of the cached bodies.
+    """
+
+    def __init__(self, maxsize: int, max_bytes: Optional[int] = None, max_entry_bytes: Optional[int] = None):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self._entries: "OrderedDict[Tuple[str, str, str], Tuple[str, bytes, Dict[str, str], Optional[str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple[str, str, str]):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: Tuple[str, str, str], entry) -> None:
+        size = len(entry[1])
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old[1])
+            if self.max_entry_bytes is not None and size > self.max_entry_bytes:
+                return
+            self._entries[key] = entry
+            self._bytes += size
+            while len(self._entries) > self.maxsize or (self.max_bytes is not None and self._bytes > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted[1])
+
+    def record(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters, the current number of entries and their total body size."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries), 'bytes': self._bytes}
+
+
+# Shared by every REST session so that short-lived clients still benefit
+_rest_etag_cache = ETagCache(REST_ETAG_CACHE_SIZE, REST_ETAG_CACHE_MAX_BYTES, REST_ETAG_CACHE_MAX_ENTRY_BYTES)
+
+# Headers that describe the original encoded body and no longer apply to a
+# replayed, already-decoded one
+_REPLAY_SKIP_HEADERS = frozenset(('content-encoding', 'content-length', 'transfer-encoding'))
+
+
+class CachingHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that revalidates GET responses with If-None-Match.
+
+    Successful GETs carrying an ETag are remembered per URL, credentials and
+    Accept header. Later identical GETs send the ETag, and a 304 reply is
+    turned back into a 200 with the cached body and the fresh response
+    headers (including rate limit headers). 304s do not count against the
+    primary rate limit.
+    """
+
+    def __init__(self, *args, cache: Optional[ETagCache] = None, **kwargs):
+        self.cache = cache if cache is not None else _rest_etag_cache
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, stream=False, **kwargs):
+        if request.method != 'GET' or stream or 'If-None-Match' in request.headers:
+            return super().send(request, stream=stream, **kwargs)
+
+        auth = request.headers.get('Authorization', '')
+        key = (
+            request.url,
+            hashlib.blake2b(auth.encode(), digest_size=16).hexdigest(),
+            request.headers.get('Accept', '')
+        )
+        cached = self.cache.get(key)
+        if cached is not None:
+            request.headers['If-None-Match'] = cached[0]
+
+        response = super().send(request, stream=stream, **kwargs)
+
+        if response.status_code == 304 and cached is not None:
+            self.cache.record(True)
+            return self._replay(request, response, cached)
+
+        self.cache.record(False)
+        etag = response.headers.get('ETag')
+        if response.status_code == 200 and etag:
+            headers = {k: v for k, v in response.headers.items() if k.lower() not in _REPLAY_SKIP_HEADERS}
+            self.cache.put(key, (etag, response.content, headers, response.encoding))
+        return response
+
+    def _replay(self, request, not_modified: requests.Response, cached) -> requests.Response:
+        _, body, headers, encoding = cached
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response._content = body
+        response.headers = CaseInsensitiveDict(headers)
+        for name, value in not_modified.headers.items():
+            if name.lower() not in _REPLAY_SKIP_HEADERS:
+                response.headers[name] = value
+        response.encoding = encoding
+        response.url = not_modified.url
+        response.request = request
+        response.connection = self
+        response.elapsed = not_modified.elapsed
+        not_modified.close()
+        return response
+
+
+def rest_cache_stats() -> Dict[str, int]:
+    """Return hit/miss counters for the shared REST ETag cache."""
+    return _rest_etag_cache.stats()
+
+
+def _per_thread(name: str) -> property:
+    """Property stored in the instance's threading.local instead of its __dict__."""
+    def get(self):
+        return getattr(self._pending, name)
+
+    def set(self, value):
+        setattr(self._pending, name, value)
+
+    return property(get, set)
+
+
+class _ThreadSafeConnectionMixin:
+    """
+    Make a PyGithub connection safe to share between threads.
+
+    PyGithub keeps one persistent connection per Requester. Its request()
+    stores the verb, url, body and headers on the connection and
+    getresponse() reads them back, so two threads using one client could
+    send each other's requests. Keeping that pending request per thread
+    leaves only the requests.Session shared, whose connection pool is
+    thread-safe.
+    """
+    verb = _per_thread('verb')
+    url = _per_thread('url')
+    input = _per_thread('input')
+    headers = _per_thread('headers')
+    stream = _per_thread('stream')
+
+    def __init__(self, *args, **kwargs):
+        self._pending = threading.local()
+        super().__init__(*args, **kwargs)
+
+
+class _CachingHTTPSConnection(_ThreadSafeConnectionMixin, HTTPSRequestsConnectionClass):
+    """PyGithub HTTPS connection whose session revalidates GETs by ETag."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.adapter = CachingHTTPAdapter(
+            max_retries=self.retry,
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size
+        )
+        self.session.mount("https://", self.adapter)
+
+
+class _CachingHTTPConnection(_ThreadSafeConnectionMixin, HTTPRequestsConnectionClass):
+    """PyGithub HTTP connection whose session revalidates GETs by ETag."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.adapter = CachingHTTPAdapter(
+            max_retries=self.retry,
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size
+        )
+        self.session.mount("http://", self.adapter)
+
+
+def _install_etag_cache(client: Github, base_url: str) -> None:
+    """
+    Route a PyGithub client's requests through CachingHTTPAdapter, on a
+    connection that tool handlers on worker threads can share.
+    PyGithub has no public hook for this that keeps its persistent
+    connection, so the requester's connection class is replaced directly.
+    """
+    connection_class = _CachingHTTPSConnection if base_url.startswith("https") else _CachingHTTPConnection
+    client.requester._Requester__connectionClass = connection_class
+
 
 class GitHubClientConfig:
     """Configuration for GitHub client creation."""
+    __slots__ = ('token', 'host', 'version', 'client_name', 'client_version', 'tokens')
 
     def __init__(
         self,
@@ -22,62 +255,93 @@ class GitHubClientConfig:
         host: str = "github.com",
         version: str = "1.0.0",
         client_name: Optional[str] = None,
-        client_version: Optional[str] = None
+        client_version: Optional[str] = None,
+        tokens: Optional[List[str]] = None
     ):
         self.token = token
         self.host = host
         self.version = version
         self.client_name = client_name
         self.client_version = client_version
+        # Additional tokens spread requests across several rate limit budgets
+        self.tokens = list(tokens) if tokens else [token]
+
+    def with_token(self, token: str) -> "GitHubClientConfig":
+        """Return a copy of this configuration using a single token."""
+        return GitHubClientConfig(
+            token=token,
+            host=self.host,
+            version=self.version,
+            client_name=self.client_name,
+            client_version=self.client_version
+        )
+
+
+class APIHost(NamedTuple):
+    """API endpoints for a GitHub host."""
+    base_url: str
+    graphql_url: str
+    upload_url: str
+    raw_url: str
 
 
-def _parse_api_host(host: str) -> dict:
+_GITHUB_COM_URLS = APIHost(
+    base_url="https://api.github.com/",
+    graphql_url="https://api.github.com/graphql",
+    upload_url="https://uploads.github.com/",
+    raw_url="https://raw.githubusercontent.com/"
+)
+
+# Hosts (bare or as URLs) that always mean github.com
+_DOTCOM_HOSTS = frozenset((
+    "github.com", "api.github.com",
+    "https://github.com", "https://api.github.com",
+    "https://github.com/", "https://api.github.com/"
+))
+
+# Optional scheme, then the hostname up to any port, path, query or fragment
+_HOST_RE = re.compile(r'^(?:([A-Za-z][A-Za-z0-9+.-]*)://)?([^/:?#]*)')
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_api_host(host: str) -> APIHost:
     """
     Parse the GitHub host and return API URLs.
     Similar to the Go implementation's parseAPIHost function.
+
+    Results are cached per host and returned as immutable APIHost tuples,
+    since the same value is shared by every client created for that host.
     """
-    if not host or host == "github.com":
+    if not host or host in _DOTCOM_HOSTS:
         # GitHub.com (dotcom)
-        return {
-            'base_url': "https://api.github.com/",
-            'graphql_url': "https://api.github.com/graphql",
-            'upload_url': "https://uploads.github.com/",
-            'raw_url': "https://raw.githubusercontent.com/"
-        }
+        return _GITHUB_COM_URLS
 
     # Parse the host URL
-    from urllib.parse import urlparse
     try:
-        parsed = urlparse(host if "://" in host else f"https://{host}")
+        scheme, hostname = _HOST_RE.match(host).groups()
+        scheme = (scheme or "https").lower()
+        hostname = hostname.lower()
+        if not hostname:
+            raise ValueError("missing hostname")
 
         # Ensure HTTPS for GitHub Enterprise Cloud
-        if parsed.hostname and parsed.hostname.endswith("ghe.com"):
-            if parsed.scheme != "https":
-                raise ValueError("GitHub Enterprise Cloud URLs must use HTTPS")
+        if hostname.endswith("ghe.com") and scheme != "https":
+            raise ValueError("GitHub Enterprise Cloud URLs must use HTTPS")
 
-        # GitHub Enterprise Server
-        if parsed.hostname and parsed.hostname.endswith("github.com"):
+        if hostname in _DOTCOM_HOSTS or hostname.endswith("github.com"):
             # This is still dotcom
-            return {
-                'base_url': "https://api.github.com/",
-                'graphql_url': "https://api.github.com/graphql",
-                'upload_url': "https://uploads.github.com/",
-                'raw_url': "https://raw.githubusercontent.com/"
-            }
+            return _GITHUB_COM_URLS
 
         # GitHub Enterprise Server
-        scheme = parsed.scheme or "https"
-        hostname = parsed.hostname
-
-        return {
-            'base_url': f"{scheme}://{hostname}/api/v3/",
-            'graphql_url': f"{scheme}://{hostname}/api/graphql",
-            'upload_url': f"{scheme}://{hostname}/api/uploads/",
-            'raw_url': f"{scheme}://{hostname}/raw/"
-        }
+        return APIHost(
+            base_url=f"{scheme}://{hostname}/api/v3/",
+            graphql_url=f"{scheme}://{hostname}/api/graphql",
+            upload_url=f"{scheme}://{hostname}/api/uploads/",
+            raw_url=f"{scheme}://{hostname}/raw/"
+        )
 
     except Exception as e:
-        logger.error(f"Failed to parse GitHub host '{host}': {e}")
+        logger.error("Failed to parse GitHub host '%s': %s", host, e)
         raise ValueError(f"Invalid GitHub host format: {host}")
 
 
@@ -89,12 +353,20 @@ def create_rest_client(config: GitHubClientConfig) -> Github:
         # Parse the API host
         api_urls = _parse_api_host(config.host)
 
-        # Create the client
+        # Create the client. In lazy mode, objects built from a URL rather
+        # than a response (e.g. issue.repository) only hit the API when an
+        # attribute is read. get_repo needs its own lazy=True for this, which
+        # get_repository passes.
         client = Github(
             login_or_token=config.token,
-            base_url=api_urls['base_url']
+            base_url=api_urls.base_url,
+            pool_size=POOL_MAXSIZE,
+            lazy=True
         )
 
+        # Revalidate repeated GETs by ETag, on a thread-safe connection
+        _install_etag_cache(client, api_urls.base_url)
+
         # Set user agent
         user_agent = f"github-mcp-server/{config.version}"
         if config.client_name and config.client_version:
@@ -103,11 +375,11 @@ def create_rest_client(config: GitHubClientConfig) -> Github:
         # Note: PyGithub doesn't expose direct user agent setting like go-github
         # We'll handle this through custom transport if needed
 
-        logger.info(f"Created GitHub REST client for {config.host}")
+        logger.info("Created GitHub REST client for %s", config.host)
         return client
 
     except Exception as e:
-        logger.error(f"Failed to create GitHub REST client: {e}")
+        logger.exception("Failed to create GitHub REST client: %s", e)
         raise
 
 
@@ -119,66 +391,352 @@ def create_graphql_client(config: GitHubClientConfig) -> Any:
     try:
         api_urls = _parse_api_host(config.host)
 
-        # Create a session with authentication
-        session = requests.Session()
-        session.headers.update({
-            'Authorization': f'Bearer {config.token}',
-            'Content-Type': 'application/json'
-        })
-
         # Set user agent
         user_agent = f"github-mcp-server/{config.version}"
         if config.client_name and config.client_version:
             user_agent = f"{user_agent} ({config.client_name}/{config.client_version})"
 
-        session.headers.update({'User-Agent': user_agent})
+        # Reuse the pooled session for these credentials if one exists
+        key = (api_urls.graphql_url, config.token, user_agent)
+        session = _acquire_session(key, config.token, user_agent)
 
         # Return a simple wrapper that can execute GraphQL queries
-        return GraphQLClient(session, api_urls['graphql_url'])
+        return GraphQLClient(session, api_urls.graphql_url, session_key=key)
 
     except Exception as e:
-        logger.error(f"Failed to create GitHub GraphQL client: {e}")
+        logger.exception("Failed to create GitHub GraphQL client: %s", e)
         raise
 
 
+def _new_session(token: str, user_agent: str) -> requests.Session:
+    """Create an authenticated session with a pooled, retrying, ETag-caching adapter."""
+    session = requests.Session()
+    adapter = CachingHTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504]),
+        pool_block=False
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    session.headers.update({
+        'Authorization': f'Bearer {token}',
+        'Content-Type': 'application/json',
+        'User-Agent': user_agent
+    })
+    return session
+
+
+def _encode_payload(payload: dict) -> bytes:
+    """Encode a GraphQL payload with sorted keys so equal requests encode equally."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(payload, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+
+@functools.lru_cache(maxsize=128)
+def _encode_query(query: str) -> bytes:
+    """Encode and cache the payload of a query without variables."""
+    return _encode_payload({'query': query})
+
+
+def _decode_json(content: bytes) -> Any:
+    """Decode a JSON response body into fresh Python objects."""
+    return orjson.loads(content) if orjson is not None else json.loads(content)
+
+
+def _acquire_session(key: Tuple[str, str, str], token: str, user_agent: str) -> requests.Session:
+    """Return the shared session for key, creating it on first use."""
+    with _sessions_lock:
+        entry = _sessions.get(key)
+        if entry is None:
+            entry = _sessions[key] = [_new_session(token, user_agent), 0]
+        entry[1] += 1
+        return entry[0]
+
+
+def _release_session(key: Tuple[str, str, str]) -> None:
+    """Drop one reference to a shared session, closing it when unused."""
+    with _sessions_lock:
+        entry = _sessions.get(key)
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del _sessions[key]
+            entry[0].close()
+
+
+def close_sessions() -> None:
+    """Close every shared session, e.g. at server shutdown."""
+    with _sessions_lock:
+        entries = list(_sessions.values())
+        _sessions.clear()
+    for session, _ in entries:
+        session.close()
+
+
 class GraphQLClient:
     """Simple GraphQL client wrapper."""
+    __slots__ = (
+        'session', 'endpoint', 'session_key', '_cache', '_cache_lock',
+        '_inflight', '_inflight_lock', 'rate_limit_remaining'
+    )
 
-    def __init__(self, session: requests.Session, endpoint: str):
+    def __init__(self, session: requests.Session, endpoint: str, session_key: Optional[Tuple[str, str, str]] = None):
         self.session = session
         self.endpoint = endpoint
+        self.session_key = session_key
+        self._cache: "OrderedDict[str, Tuple[str, bytes]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Identical queries already on the wire, so concurrent callers share one request
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self.rate_limit_remaining = -1
+
+    def close(self) -> None:
+        """Release this client's hold on its session."""
+        if self.session_key is not None:
+            _release_session(self.session_key)
+            self.session_key = None
+        else:
+            self.session.close()
 
     def execute(self, query: str, variables: Optional[dict] = None) -> dict:
-        """Execute a GraphQL query."""
-        payload = {'query': query}
+        """
+        Execute a GraphQL query.
+        Identical concurrent queries share one request and repeated ones are
+        revalidated by ETag, but every caller decodes its own copy of the
+        response, so the returned dict is safe to modify.
+        """
         if variables:
-            payload['variables'] = variables
-
-        response = self.session.post(self.endpoint, json=payload)
+            body = _encode_payload({'query': query, 'variables': variables})
+        else:
+            body = _encode_query(query)
+
+        # Mutations are never shared or served from the cache
+        if _MUTATION_RE.match(query):
+            return self._post(body, None)[1]
+
+        key = hashlib.blake2b(body, digest_size=16).hexdigest()
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+
+        if not leader:
+            return _decode_json(future.result())
+
+        try:
+            content, result = self._post(body, key)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(content)
+            return result if result is not None else _decode_json(content)
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    def _post(self, body: bytes, key: Optional[str]) -> Tuple[bytes, Optional[dict]]:
+        """
+        POST an encoded payload, revalidating against the ETag cache when key
+        is set. Returns the response body and, unless it was replayed from
+        the cache, its decoded result.
+        """
+        cached = None
+        if key is not None:
+            with self._cache_lock:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+
+        headers = {'If-None-Match': cached[0]} if cached else None
+        response = self.session.post(self.endpoint, data=body, headers=headers)
+        mark_response(self, response)
+        if response.status_code == 304 and cached:
+            return cached[1], None
         response.raise_for_status()
 
-        result = response.json()
+        content = response.content
+        result = _decode_json(content)
         if 'errors' in result:
             raise Exception(f"GraphQL errors: {result['errors']}")
 
-        return result
+        etag = response.headers.get('ETag')
+        if key is not None and etag:
+            with self._cache_lock:
+                self._cache[key] = (etag, content)
+                self._cache.move_to_end(key)
+                while len(self._cache) > GRAPHQL_ETAG_CACHE_SIZE:
+                    self._cache.popitem(last=False)
+
+        return content, result
+
+
+def create_raw_client(config: GitHubClientConfig) -> "RawClient":
+    """
+    Create a client for the raw content host on the shared session pool.
+    Used to fetch file bytes without the contents API's base64 JSON.
+    """
+    try:
+        api_urls = _parse_api_host(config.host)
+
+        # Set user agent
+        user_agent = f"github-mcp-server/{config.version}"
+        if config.client_name and config.client_version:
+            user_agent = f"{user_agent} ({config.client_name}/{config.client_version})"
+
+        key = (api_urls.raw_url, config.token, user_agent)
+        session = _acquire_session(key, config.token, user_agent)
+
+        return RawClient(session, api_urls.raw_url, session_key=key)
+
+    except Exception as e:
+        logger.exception("Failed to create GitHub raw content client: %s", e)
+        raise
+
+
+class RawClient:
+    """Minimal client that downloads file contents from the raw content host."""
+    __slots__ = ('session', 'raw_url', 'session_key')
+
+    def __init__(self, session: requests.Session, raw_url: str, session_key: Optional[Tuple[str, str, str]] = None):
+        self.session = session
+        self.raw_url = raw_url
+        self.session_key = session_key
+
+    def close(self) -> None:
+        """Release this client's hold on its session."""
+        if self.session_key is not None:
+            _release_session(self.session_key)
+            self.session_key = None
+        else:
+            self.session.close()
+
+    def get_raw(self, owner: str, repo: str, path: str, ref: Optional[str] = None) -> Optional[requests.Response]:
+        """
+        Download a file at ref (the default branch if not given).
+        Returns None when there is no file at path, e.g. for a directory.
+        """
+        url = f"{self.raw_url}{quote(owner)}/{quote(repo)}/{quote(ref or 'HEAD')}/{quote(path.lstrip('/'))}"
+        # Streamed so file bodies stay out of the shared ETag cache
+        response = self.session.get(url, stream=True)
+        if response.status_code == 404:
+            response.close()
+            return None
+        response.raise_for_status()
+        return response
+
+
+def mark_response(client: Any, response: requests.Response) -> None:
+    """Record the rate limit budget reported by a response on its client."""
+    remaining = response.headers.get('X-RateLimit-Remaining')
+    if remaining is not None:
+        try:
+            client.rate_limit_remaining = int(float(remaining))
+        except ValueError:
+            pass
+
+
+def _remaining(client: Any) -> int:
+    """Return the last known remaining rate limit budget, or -1 if unknown."""
+    if isinstance(client, Github):
+        return client.requester.rate_limiting[0]
+    return getattr(client, 'rate_limit_remaining', -1)
+
+
+def pick_by_remaining(clients: List[Any], start: int = 0) -> Any:
+    """
+    Pick the client with the most remaining rate limit budget.
+    Clients that have not made a request yet count as having a full budget.
+    Ties go to the first client at or after start.
+    """
+    best = None
+    best_remaining = -2
+    count = len(clients)
+    for i in range(count):
+        client = clients[(start + i) % count]
+        remaining = _remaining(client)
+        if remaining < 0:
+            return client
+        if remaining > best_remaining:
+            best, best_remaining = client, remaining
+    return best
+
+
+class _ClientFactory:
+    """
+    Callable that creates its client on first use and then reuses it.
+    Tool handlers call the factory on every invocation, so memoizing keeps
+    one PyGithub Requester (or pooled GraphQL session) alive instead of
+    rebuilding it per call.
+    """
+    __slots__ = ('config', 'create', '_client', '_lock')
+
+    def __init__(self, config: GitHubClientConfig, create):
+        self.config = config
+        self.create = create
+        self._client = None
+        self._lock = threading.Lock()
+
+    def __call__(self, ctx=None):
+        client = self._client
+        if client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = self.create(self.config)
+                client = self._client
+        return client
+
+
+class _PooledClientFactory:
+    """Callable that rotates over pre-built clients, one per token."""
+    __slots__ = ('clients', '_counter', '_lock')
+
+    def __init__(self, clients: List[Any]):
+        self.clients = clients
+        self._counter = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, ctx=None):
+        with self._lock:
+            start = self._counter
+            self._counter = (start + 1) % len(self.clients)
+        return pick_by_remaining(self.clients, start)
 
 
 def get_rest_client_factory(config: GitHubClientConfig):
     """
     Return a factory function for creating REST clients.
+    With several tokens, clients are built once per token and shared.
     """
-    def factory(ctx=None) -> Github:
-        return create_rest_client(config)
+    if len(config.tokens) > 1:
+        return _PooledClientFactory([create_rest_client(config.with_token(t)) for t in config.tokens])
 
-    return factory
+    return _ClientFactory(config, create_rest_client)
 
 
 def get_graphql_client_factory(config: GitHubClientConfig):
     """
     Return a factory function for creating GraphQL clients.
+    With several tokens, clients are built once per token and shared.
+    """
+    if len(config.tokens) > 1:
+        return _PooledClientFactory([create_graphql_client(config.with_token(t)) for t in config.tokens])
+
+    return _ClientFactory(config, create_graphql_client)
+
+
+def get_raw_client_factory(config: GitHubClientConfig):
+    """
+    Return a factory function for creating raw content clients.
+    With several tokens, clients are built once per token and shared.
     """
-    def factory(ctx=None) -> GraphQLClient:
-        return create_graphql_client(config)
+    if len(config.tokens) > 1:
+        return _PooledClientFactory([create_raw_client(config.with_token(t)) for t in config.tokens])
 
-    return factory
+    return _ClientFactory(config, create_raw_client)
@@ -4,14 +4,15 @@ Converted from github-mcp-server/pkg/github/issues.go
 """
 
 import json
+from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 from mcp.types import Tool, CallToolRequest, CallToolResult
 from mcp.server.fastmcp import FastMCP
 from .server import (
-    GetClientFn, GetGQLClientFn, TranslationHelperFunc, required_param, optional_param,
-    optional_bool_param_with_default, optional_pagination_params, optional_string_array_param,
-    to_bool_ptr, marshalled_text_result, CursorPaginationParams
+    GetClientFn, GetGQLClientFn, TranslationHelperFunc, default_translator, compile_params, required,
+    optional, optional_string_array, pagination, tool_handler, error_result, run_in_thread,
+    marshalled_text_result, get_repository, CursorPaginationParams
 )
 from .clients import GraphQLClient
 import logging
@@ -19,648 +20,604 @@ import logging
 logger = logging.getLogger(__name__)
 
 # Type definitions for GitHub API responses
+@dataclass(slots=True)
 class IssueFragment:
     """Represents a fragment of an issue from GraphQL API."""
-    def __init__(self, number: int = 0, title: str = "", body: str = "", state: str = "",
-                 database_id: int = 0, author: Optional[Dict] = None,
-                 created_at: Optional[datetime] = None, updated_at: Optional[datetime] = None,
-                 labels: Optional[List[Dict]] = None, comments_count: int = 0):
-        self.number = number
-        self.title = title
-        self.body = body
-        self.state = state
-        self.database_id = database_id
-        self.author = author
-        self.created_at = created_at
-        self.updated_at = updated_at
-        self.labels = labels or []
-        self.comments_count = comments_count
-
-
+    number: int = 0
+    title: str = ""
+    body: str = ""
+    state: str = ""
+    database_id: int = 0
+    author: Optional[Dict] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    labels: List[Dict] = field(default_factory=list)
+    comments_count: int = 0
+
+
+@dataclass(slots=True)
 class IssueQueryFragment:
     """Fragment containing issues and pagination info."""
-    def __init__(self, nodes: Optional[List[IssueFragment]] = None,
-                 page_info: Optional[Dict] = None, total_count: int = 0):
-        self.nodes = nodes or []
-        self.page_info = page_info or {}
-        self.total_count = total_count
+    nodes: List[IssueFragment] = field(default_factory=list)
+    page_info: Dict = field(default_factory=dict)
+    total_count: int = 0
+
+
+def _raw(obj: Any) -> Dict[str, Any]:
+    """Return the JSON object behind a PyGithub object, or obj if it is already a dict."""
+    if isinstance(obj, dict):
+        return obj
+    return obj.raw_data
 
 
 def convert_to_issue(issue: Any) -> Dict[str, Any]:
-    """Convert GitHub issue to dictionary format."""
+    """
+    Convert GitHub issue to dictionary format.
+    Accepts a PyGithub Issue or the raw issue JSON; fields are projected
+    straight from the JSON, so timestamps keep GitHub's ISO-8601 form.
+    """
     if not issue:
         return {}
 
+    data = _raw(issue)
+    get = data.get
+
     # Extract basic issue information
     result = {
-        'id': getattr(issue, 'id', 0),
-        'number': getattr(issue, 'number', 0),
-        'title': getattr(issue, 'title', ''),
-        'body': getattr(issue, 'body', ''),
-        'state': getattr(issue, 'state', ''),
-        'html_url': getattr(issue, 'html_url', ''),
-        'created_at': getattr(issue, 'created_at', '').isoformat() if hasattr(issue, 'created_at') and issue.created_at else None,
-        'updated_at': getattr(issue, 'updated_at', '').isoformat() if hasattr(issue, 'updated_at') and issue.updated_at else None,
-        'closed_at': getattr(issue, 'closed_at', '').isoformat() if hasattr(issue, 'closed_at') and issue.closed_at else None,
+        'id': get('id', 0),
+        'number': get('number', 0),
+        'title': get('title', ''),
+        'body': get('body', ''),
+        'state': get('state', ''),
+        'html_url': get('html_url', ''),
+        'created_at': get('created_at'),
+        'updated_at': get('updated_at'),
+        'closed_at': get('closed_at'),
     }
 
     # Extract user information
-    if hasattr(issue, 'user') and issue.user:
+    user = get('user')
+    if user:
         result['user'] = {
-            'login': getattr(issue.user, 'login', ''),
-            'id': getattr(issue.user, 'id', 0),
-            'html_url': getattr(issue.user, 'html_url', ''),
-            'type': getattr(issue.user, 'type', ''),
+            'login': user.get('login', ''),
+            'id': user.get('id', 0),
+            'html_url': user.get('html_url', ''),
+            'type': user.get('type', ''),
         }
 
     # Extract labels
-    if hasattr(issue, 'labels'):
-        result['labels'] = []
-        for label in issue.labels or []:
-            result['labels'].append({
-                'name': getattr(label, 'name', ''),
-                'color': getattr(label, 'color', ''),
-                'description': getattr(label, 'description', ''),
-            })
+    result['labels'] = [
+        {
+            'name': label.get('name', ''),
+            'color': label.get('color', ''),
+            'description': label.get('description', ''),
+        }
+        for label in get('labels') or ()
+    ]
 
     # Extract assignee information
-    if hasattr(issue, 'assignee') and issue.assignee:
+    assignee = get('assignee')
+    if assignee:
         result['assignee'] = {
-            'login': getattr(issue.assignee, 'login', ''),
-            'id': getattr(issue.assignee, 'id', 0),
-            'html_url': getattr(issue.assignee, 'html_url', ''),
+            'login': assignee.get('login', ''),
+            'id': assignee.get('id', 0),
+            'html_url': assignee.get('html_url', ''),
         }
 
     # Extract assignees list
-    if hasattr(issue, 'assignees'):
-        result['assignees'] = []
-        for assignee in issue.assignees or []:
-            result['assignees'].append({
-                'login': getattr(assignee, 'login', ''),
-                'id': getattr(assignee, 'id', 0),
-                'html_url': getattr(assignee, 'html_url', ''),
-            })
+    result['assignees'] = [
+        {
+            'login': assignee.get('login', ''),
+            'id': assignee.get('id', 0),
+            'html_url': assignee.get('html_url', ''),
+        }
+        for assignee in get('assignees') or ()
+    ]
 
     # Extract milestone information
-    if hasattr(issue, 'milestone') and issue.milestone:
+    milestone = get('milestone')
+    if milestone:
         result['milestone'] = {
-            'title': getattr(issue.milestone, 'title', ''),
-            'number': getattr(issue.milestone, 'number', 0),
-            'state': getattr(issue.milestone, 'state', ''),
+            'title': milestone.get('title', ''),
+            'number': milestone.get('number', 0),
+            'state': milestone.get('state', ''),
         }
 
     return result
 
 
 def convert_to_issue_comment(comment: Any) -> Dict[str, Any]:
-    """Convert GitHub issue comment to dictionary format."""
+    """
+    Convert GitHub issue comment to dictionary format.
+    Accepts a PyGithub IssueComment or the raw comment JSON.
+    """
     if not comment:
         return {}
 
+    data = _raw(comment)
+    get = data.get
+
     result = {
-        'id': getattr(comment, 'id', 0),
-        'body': getattr(comment, 'body', ''),
-        'html_url': getattr(comment, 'html_url', ''),
-        'created_at': getattr(comment, 'created_at', '').isoformat() if hasattr(comment, 'created_at') and comment.created_at else None,
-        'updated_at': getattr(comment, 'updated_at', '').isoformat() if hasattr(comment, 'updated_at') and comment.updated_at else None,
+        'id': get('id', 0),
+        'body': get('body', ''),
+        'html_url': get('html_url', ''),
+        'created_at': get('created_at'),
+        'updated_at': get('updated_at'),
     }
 
     # Extract user information
-    if hasattr(comment, 'user') and comment.user:
+    user = get('user')
+    if user:
         result['user'] = {
-            'login': getattr(comment.user, 'login', ''),
-            'id': getattr(comment.user, 'id', 0),
-            'html_url': getattr(comment.user, 'html_url', ''),
-            'type': getattr(comment.user, 'type', ''),
+            'login': user.get('login', ''),
+            'id': user.get('id', 0),
+            'html_url': user.get('html_url', ''),
+            'type': user.get('type', ''),
         }
 
     return result
 
 
-def get_issue_tool(get_client: GetClientFn, translator: TranslationHelperFunc) -> Tuple[Tool, Callable]:
-    """Create the get_issue tool."""
+_GET_ISSUE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "owner": {
+            "type": "string",
+            "description": "Repository owner"
+        },
+        "repo": {
+            "type": "string",
+            "description": "Repository name"
+        },
+        "issue_number": {
+            "type": "integer",
+            "description": "Issue number"
+        }
+    },
+    "required": ["owner", "repo", "issue_number"]
+}
 
-    def handler(ctx: Any, request: CallToolRequest) -> CallToolResult:
-        try:
-            # Extract parameters
-            owner, err = required_param(request, "owner", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
+_GET_ISSUE_PARAMS = compile_params(required("owner", str), required("repo", str), required("issue_number", int))
 
-            repo, err = required_param(request, "repo", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
 
-            issue_number, err = required_param(request, "issue_number", int)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
+def get_issue_tool(get_client: GetClientFn, translator: TranslationHelperFunc) -> Tuple[Tool, Callable]:
+    """Create the get_issue tool."""
 
-            # Get GitHub client
-            client = get_client(ctx)
+    @run_in_thread
+    @tool_handler("get_issue")
+    def handler(ctx: Any, request: CallToolRequest) -> CallToolResult:
+        # Extract parameters
+        args, err = _GET_ISSUE_PARAMS(request)
+        if err:
+            return error_result(str(err))
+        owner, repo, issue_number = args
 
-            try:
-                # Get the issue
-                issue = client.get_repo(f"{owner}/{repo}").get_issue(issue_number)
-                issue_dict = convert_to_issue(issue)
-                return marshalled_text_result(issue_dict)
+        # Get GitHub client
+        client = get_client(ctx)
 
-            except Exception as e:
-                logger.error(f"Failed to get issue {issue_number}: {e}")
-                return CallToolResult(type="error", error={"message": f"Failed to get issue {issue_number}: {str(e)}"})
+        try:
+            # Get the issue
+            issue = get_repository(client, owner, repo).get_issue(issue_number)
+            issue_dict = convert_to_issue(issue)
+            return marshalled_text_result(issue_dict)
 
         except Exception as e:
-            logger.error(f"Error in get_issue handler: {e}")
-            return CallToolResult(type="error", error={"message": str(e)})
+            logger.error("Failed to get issue %s: %s", issue_number, e)
+            return error_result(f"Failed to get issue {issue_number}: {str(e)}")
 
     tool = Tool(
         name="get_issue",
         description=translator("TOOL_GET_ISSUE_DESCRIPTION", "Get details for a GitHub issue"),
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "owner": {
-                    "type": "string",
-                    "description": "Repository owner"
-                },
-                "repo": {
-                    "type": "string",
-                    "description": "Repository name"
-                },
-                "issue_number": {
-                    "type": "integer",
-                    "description": "Issue number"
-                }
-            },
-            "required": ["owner", "repo", "issue_number"]
-        }
+        inputSchema=_GET_ISSUE_SCHEMA
     )
 
     return tool, handler
 
 
+_SEARCH_ISSUES_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "query": {
+            "type": "string",
+            "description": "Search query (supports GitHub search syntax)"
+        },
+        "sort": {
+            "type": "string",
+            "description": "Sort field",
+            "enum": ["best-match", "comments", "created", "updated"]
+        },
+        "order": {
+            "type": "string",
+            "description": "Sort order",
+            "enum": ["asc", "desc"]
+        },
+        "page": {
+            "type": "number",
+            "description": "Page number for pagination (min 1)",
+            "minimum": 1
+        },
+        "perPage": {
+            "type": "number",
+            "description": "Results per page for pagination (min 1, max 100)",
+            "minimum": 1,
+            "maximum": 100
+        }
+    },
+    "required": ["query"]
+}
+
+_SEARCH_ISSUES_PARAMS = compile_params(required("query", str), optional("sort", str), optional("order", str), pagination())
+
+
 def search_issues_tool(get_client: GetClientFn, translator: TranslationHelperFunc) -> Tuple[Tool, Callable]:
     """Create the search_issues tool."""
 
+    @run_in_thread
+    @tool_handler("search_issues")
     def handler(ctx: Any, request: CallToolRequest) -> CallToolResult:
+        # Extract parameters
+        args, err = _SEARCH_ISSUES_PARAMS(request)
+        if err:
+            return error_result(str(err))
+        query, sort, order, pagination = args
+
+        # Get GitHub client
+        client = get_client(ctx)
+
         try:
-            # Extract parameters
-            query, err = required_param(request, "query", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            sort, err = optional_param(request, "sort", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            order, err = optional_param(request, "order", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            pagination, err = optional_pagination_params(request)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            # Get GitHub client
-            client = get_client(ctx)
-
-            try:
-                # Search issues
-                issues = client.search_issues(
-                    query=query,
-                    sort=sort or "best-match",
-                    order=order or "desc",
-                    page=pagination.page,
-                    per_page=pagination.per_page
-                )
-
-                # Convert to list of issues
-                result = []
-                for issue in issues:
-                    result.append(convert_to_issue(issue))
-
-                return marshalled_text_result(result)
-
-            except Exception as e:
-                logger.error(f"Failed to search issues: {e}")
-                return CallToolResult(type="error", error={"message": f"Failed to search issues: {str(e)}"})
+            # Search issues
+            issues = client.search_issues(
+                query=query,
+                sort=sort or "best-match",
+                order=order or "desc",
+                page=pagination.page,
+                per_page=pagination.per_page
+            )
+
+            # Convert to list of issues
+            result = [convert_to_issue(issue) for issue in issues]
+
+            return marshalled_text_result(result)
 
         except Exception as e:
-            logger.error(f"Error in search_issues handler: {e}")
-            return CallToolResult(type="error", error={"message": str(e)})
+            logger.error("Failed to search issues: %s", e)
+            return error_result(f"Failed to search issues: {str(e)}")
 
     tool = Tool(
         name="search_issues",
         description=translator("TOOL_SEARCH_ISSUES_DESCRIPTION", "Search for GitHub issues using keywords, qualifiers, and operators"),
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "query": {
-                    "type": "string",
-                    "description": "Search query (supports GitHub search syntax)"
-                },
-                "sort": {
-                    "type": "string",
-                    "description": "Sort field",
-                    "enum": ["best-match", "comments", "created", "updated"]
-                },
-                "order": {
-                    "type": "string",
-                    "description": "Sort order",
-                    "enum": ["asc", "desc"]
-                },
-                "page": {
-                    "type": "number",
-                    "description": "Page number for pagination (min 1)",
-                    "minimum": 1
-                },
-                "perPage": {
-                    "type": "number",
-                    "description": "Results per page for pagination (min 1, max 100)",
-                    "minimum": 1,
-                    "maximum": 100
-                }
-            },
-            "required": ["query"]
-        }
+        inputSchema=_SEARCH_ISSUES_SCHEMA
     )
 
     return tool, handler
 
 
+_CREATE_ISSUE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "owner": {
+            "type": "string",
+            "description": "Repository owner"
+        },
+        "repo": {
+            "type": "string",
+            "description": "Repository name"
+        },
+        "title": {
+            "type": "string",
+            "description": "Issue title"
+        },
+        "body": {
+            "type": "string",
+            "description": "Issue body (optional)"
+        },
+        "labels": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "List of label names to assign to the issue"
+        },
+        "assignees": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "List of usernames to assign to the issue"
+        }
+    },
+    "required": ["owner", "repo", "title"]
+}
+
+_CREATE_ISSUE_PARAMS = compile_params(
+    required("owner", str), required("repo", str), required("title", str), optional("body", str),
+    optional_string_array("labels"), optional_string_array("assignees")
+)
+
+
 def create_issue_tool(get_client: GetClientFn, translator: TranslationHelperFunc) -> Tuple[Tool, Callable]:
     """Create the create_issue tool."""
 
+    @run_in_thread
+    @tool_handler("create_issue")
     def handler(ctx: Any, request: CallToolRequest) -> CallToolResult:
+        # Extract parameters
+        args, err = _CREATE_ISSUE_PARAMS(request)
+        if err:
+            return error_result(str(err))
+        owner, repo, title, body, labels, assignees = args
+
+        # Get GitHub client
+        client = get_client(ctx)
+
         try:
-            # Extract parameters
-            owner, err = required_param(request, "owner", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            repo, err = required_param(request, "repo", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            title, err = required_param(request, "title", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            body, err = optional_param(request, "body", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            labels, err = optional_string_array_param(request, "labels")
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            assignees, err = optional_string_array_param(request, "assignees")
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            # Get GitHub client
-            client = get_client(ctx)
-
-            try:
-                # Create the issue
-                repository = client.get_repo(f"{owner}/{repo}")
-
-                # Prepare issue data
-                issue_data = {
-                    'title': title,
-                    'body': body or '',
-                }
-
-                if labels:
-                    issue_data['labels'] = labels
-                if assignees:
-                    issue_data['assignees'] = assignees
-
-                issue = repository.create_issue(**issue_data)
-                issue_dict = convert_to_issue(issue)
-                return marshalled_text_result(issue_dict)
+            # Create the issue
+            repository = get_repository(client, owner, repo)
+
+            # Prepare issue data
+            issue_data = {
+                'title': title,
+                'body': body or '',
+            }
+
+            if labels:
+                issue_data['labels'] = labels
+            if assignees:
+                issue_data['assignees'] = assignees
 
-            except Exception as e:
-                logger.error(f"Failed to create issue: {e}")
-                return CallToolResult(type="error", error={"message": f"Failed to create issue: {str(e)}"})
+            issue = repository.create_issue(**issue_data)
+            issue_dict = convert_to_issue(issue)
+            return marshalled_text_result(issue_dict)
 
         except Exception as e:
-            logger.error(f"Error in create_issue handler: {e}")
-            return CallToolResult(type="error", error={"message": str(e)})
+            logger.error("Failed to create issue: %s", e)
+            return error_result(f"Failed to create issue: {str(e)}")
 
     tool = Tool(
         name="create_issue",
         description=translator("TOOL_CREATE_ISSUE_DESCRIPTION", "Create a new GitHub issue"),
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "owner": {
-                    "type": "string",
-                    "description": "Repository owner"
-                },
-                "repo": {
-                    "type": "string",
-                    "description": "Repository name"
-                },
-                "title": {
-                    "type": "string",
-                    "description": "Issue title"
-                },
-                "body": {
-                    "type": "string",
-                    "description": "Issue body (optional)"
-                },
-                "labels": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "List of label names to assign to the issue"
-                },
-                "assignees": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "List of usernames to assign to the issue"
-                }
-            },
-            "required": ["owner", "repo", "title"]
-        }
+        inputSchema=_CREATE_ISSUE_SCHEMA
     )
 
     return tool, handler
 
 
+_UPDATE_ISSUE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "owner": {
+            "type": "string",
+            "description": "Repository owner"
+        },
+        "repo": {
+            "type": "string",
+            "description": "Repository name"
+        },
+        "issue_number": {
+            "type": "integer",
+            "description": "Issue number"
+        },
+        "title": {
+            "type": "string",
+            "description": "New issue title"
+        },
+        "body": {
+            "type": "string",
+            "description": "New issue body"
+        },
+        "state": {
+            "type": "string",
+            "description": "New issue state",
+            "enum": ["open", "closed"]
+        },
+        "labels": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "List of label names to assign to the issue"
+        },
+        "assignees": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "List of usernames to assign to the issue"
+        }
+    },
+    "required": ["owner", "repo", "issue_number"]
+}
+
+_UPDATE_ISSUE_PARAMS = compile_params(
+    required("owner", str), required("repo", str), required("issue_number", int),
+    optional("title", str), optional("body", str), optional("state", str),
+    optional_string_array("labels"), optional_string_array("assignees")
+)
+
+
 def update_issue_tool(get_client: GetClientFn, translator: TranslationHelperFunc) -> Tuple[Tool, Callable]:
     """Create the update_issue tool."""
 
+    @run_in_thread
+    @tool_handler("update_issue")
     def handler(ctx: Any, request: CallToolRequest) -> CallToolResult:
+        # Extract parameters
+        args, err = _UPDATE_ISSUE_PARAMS(request)
+        if err:
+            return error_result(str(err))
+        owner, repo, issue_number, title, body, state, labels, assignees = args
+
+        # Get GitHub client
+        client = get_client(ctx)
+
         try:
-            # Extract parameters
-            owner, err = required_param(request, "owner", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            repo, err = required_param(request, "repo", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            issue_number, err = required_param(request, "issue_number", int)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            title, err = optional_param(request, "title", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            body, err = optional_param(request, "body", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            state, err = optional_param(request, "state", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            labels, err = optional_string_array_param(request, "labels")
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            assignees, err = optional_string_array_param(request, "assignees")
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            # Get GitHub client
-            client = get_client(ctx)
-
-            try:
-                # Get and update the issue
-                repository = client.get_repo(f"{owner}/{repo}")
-                issue = repository.get_issue(issue_number)
-
-                # Prepare update data
-                update_data = {}
-                if title is not None:
-                    update_data['title'] = title
-                if body is not None:
-                    update_data['body'] = body
-                if state is not None:
-                    update_data['state'] = state
-                if labels is not None:
-                    update_data['labels'] = labels
-                if assignees is not None:
-                    update_data['assignees'] = assignees
-
-                if update_data:
-                    issue.edit(**update_data)
-
-                # Get updated issue
-                updated_issue = repository.get_issue(issue_number)
-                issue_dict = convert_to_issue(updated_issue)
-                return marshalled_text_result(issue_dict)
-
-            except Exception as e:
-                logger.error(f"Failed to update issue {issue_number}: {e}")
-                return CallToolResult(type="error", error={"message": f"Failed to update issue {issue_number}: {str(e)}"})
+            # Get and update the issue (lazy handles, no request yet)
+            repository = get_repository(client, owner, repo)
+            issue = repository.get_issue(issue_number)
+
+            # Prepare update data
+            update_data = {}
+            if title is not None:
+                update_data['title'] = title
+            if body is not None:
+                update_data['body'] = body
+            if state is not None:
+                update_data['state'] = state
+            # The array fields default to [] when absent, so check presence to
+            # avoid clearing labels/assignees that weren't asked about
+            if 'labels' in request.arguments:
+                update_data['labels'] = labels
+            if 'assignees' in request.arguments:
+                update_data['assignees'] = assignees
+
+            # The PATCH response is the updated issue, so no second fetch
+            # is needed; without changes the issue is just read
+            if update_data:
+                _, data = client.requester.requestJsonAndCheck("PATCH", issue.url, input=update_data)
+                issue_dict = convert_to_issue(data)
+            else:
+                issue_dict = convert_to_issue(issue)
+            return marshalled_text_result(issue_dict)
 
         except Exception as e:
-            logger.error(f"Error in update_issue handler: {e}")
-            return CallToolResult(type="error", error={"message": str(e)})
+            logger.error("Failed to update issue %s: %s", issue_number, e)
+            return error_result(f"Failed to update issue {issue_number}: {str(e)}")
 
     tool = Tool(
         name="update_issue",
         description=translator("TOOL_UPDATE_ISSUE_DESCRIPTION", "Update an existing GitHub issue"),
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "owner": {
-                    "type": "string",
-                    "description": "Repository owner"
-                },
-                "repo": {
-                    "type": "string",
-                    "description": "Repository name"
-                },
-                "issue_number": {
-                    "type": "integer",
-                    "description": "Issue number"
-                },
-                "title": {
-                    "type": "string",
-                    "description": "New issue title"
-                },
-                "body": {
-                    "type": "string",
-                    "description": "New issue body"
-                },
-                "state": {
-                    "type": "string",
-                    "description": "New issue state",
-                    "enum": ["open", "closed"]
-                },
-                "labels": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "List of label names to assign to the issue"
-                },
-                "assignees": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "List of usernames to assign to the issue"
-                }
-            },
-            "required": ["owner", "repo", "issue_number"]
-        }
+        inputSchema=_UPDATE_ISSUE_SCHEMA
     )
 
     return tool, handler
 
 
-def get_issue_comments_tool(get_client: GetClientFn, translator: TranslationHelperFunc) -> Tuple[Tool, Callable]:
-    """Create the get_issue_comments tool."""
-
-    def handler(ctx: Any, request: CallToolRequest) -> CallToolResult:
-        try:
-            # Extract parameters
-            owner, err = required_param(request, "owner", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
+_GET_ISSUE_COMMENTS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "owner": {
+            "type": "string",
+            "description": "Repository owner"
+        },
+        "repo": {
+            "type": "string",
+            "description": "Repository name"
+        },
+        "issue_number": {
+            "type": "integer",
+            "description": "Issue number"
+        },
+        "page": {
+            "type": "number",
+            "description": "Page number for pagination (min 1)",
+            "minimum": 1
+        },
+        "perPage": {
+            "type": "number",
+            "description": "Results per page for pagination (min 1, max 100)",
+            "minimum": 1,
+            "maximum": 100
+        }
+    },
+    "required": ["owner", "repo", "issue_number"]
+}
 
-            repo, err = required_param(request, "repo", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
+_GET_ISSUE_COMMENTS_PARAMS = compile_params(
+    required("owner", str), required("repo", str), required("issue_number", int), pagination()
+)
 
-            issue_number, err = required_param(request, "issue_number", int)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
 
-            pagination, err = optional_pagination_params(request)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
+def get_issue_comments_tool(get_client: GetClientFn, translator: TranslationHelperFunc) -> Tuple[Tool, Callable]:
+    """Create the get_issue_comments tool."""
 
-            # Get GitHub client
-            client = get_client(ctx)
+    @run_in_thread
+    @tool_handler("get_issue_comments")
+    def handler(ctx: Any, request: CallToolRequest) -> CallToolResult:
+        # Extract parameters
+        args, err = _GET_ISSUE_COMMENTS_PARAMS(request)
+        if err:
+            return error_result(str(err))
+        owner, repo, issue_number, pagination = args
 
-            try:
-                # Get issue comments
-                repository = client.get_repo(f"{owner}/{repo}")
-                issue = repository.get_issue(issue_number)
-                comments = issue.get_comments(page=pagination.page, per_page=pagination.per_page)
+        # Get GitHub client
+        client = get_client(ctx)
 
-                # Convert to list of comments
-                result = []
-                for comment in comments:
-                    result.append(convert_to_issue_comment(comment))
+        try:
+            # Get issue comments
+            repository = get_repository(client, owner, repo)
+            issue = repository.get_issue(issue_number)
+            comments = issue.get_comments(page=pagination.page, per_page=pagination.per_page)
 
-                return marshalled_text_result(result)
+            # Convert to list of comments
+            result = [convert_to_issue_comment(comment) for comment in comments]
 
-            except Exception as e:
-                logger.error(f"Failed to get issue comments for {issue_number}: {e}")
-                return CallToolResult(type="error", error={"message": f"Failed to get issue comments for {issue_number}: {str(e)}"})
+            return marshalled_text_result(result)
 
         except Exception as e:
-            logger.error(f"Error in get_issue_comments handler: {e}")
-            return CallToolResult(type="error", error={"message": str(e)})
+            logger.error("Failed to get issue comments for %s: %s", issue_number, e)
+            return error_result(f"Failed to get issue comments for {issue_number}: {str(e)}")
 
     tool = Tool(
         name="get_issue_comments",
         description=translator("TOOL_GET_ISSUE_COMMENTS_DESCRIPTION", "Get comments for a GitHub issue"),
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "owner": {
-                    "type": "string",
-                    "description": "Repository owner"
-                },
-                "repo": {
-                    "type": "string",
-                    "description": "Repository name"
-                },
-                "issue_number": {
-                    "type": "integer",
-                    "description": "Issue number"
-                },
-                "page": {
-                    "type": "number",
-                    "description": "Page number for pagination (min 1)",
-                    "minimum": 1
-                },
-                "perPage": {
-                    "type": "number",
-                    "description": "Results per page for pagination (min 1, max 100)",
-                    "minimum": 1,
-                    "maximum": 100
-                }
-            },
-            "required": ["owner", "repo", "issue_number"]
-        }
+        inputSchema=_GET_ISSUE_COMMENTS_SCHEMA
     )
 
     return tool, handler
 
 
-def add_issue_comment_tool(get_client: GetClientFn, translator: TranslationHelperFunc) -> Tuple[Tool, Callable]:
-    """Create the add_issue_comment tool."""
-
-    def handler(ctx: Any, request: CallToolRequest) -> CallToolResult:
-        try:
-            # Extract parameters
-            owner, err = required_param(request, "owner", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
+_ADD_ISSUE_COMMENT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "owner": {
+            "type": "string",
+            "description": "Repository owner"
+        },
+        "repo": {
+            "type": "string",
+            "description": "Repository name"
+        },
+        "issue_number": {
+            "type": "integer",
+            "description": "Issue number"
+        },
+        "body": {
+            "type": "string",
+            "description": "Comment body"
+        }
+    },
+    "required": ["owner", "repo", "issue_number", "body"]
+}
 
-            repo, err = required_param(request, "repo", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
+_ADD_ISSUE_COMMENT_PARAMS = compile_params(
+    required("owner", str), required("repo", str), required("issue_number", int), required("body", str)
+)
 
-            issue_number, err = required_param(request, "issue_number", int)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
 
-            body, err = required_param(request, "body", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
+def add_issue_comment_tool(get_client: GetClientFn, translator: TranslationHelperFunc) -> Tuple[Tool, Callable]:
+    """Create the add_issue_comment tool."""
 
-            # Get GitHub client
-            client = get_client(ctx)
+    @run_in_thread
+    @tool_handler("add_issue_comment")
+    def handler(ctx: Any, request: CallToolRequest) -> CallToolResult:
+        # Extract parameters
+        args, err = _ADD_ISSUE_COMMENT_PARAMS(request)
+        if err:
+            return error_result(str(err))
+        owner, repo, issue_number, body = args
 
-            try:
-                # Add comment to issue
-                repository = client.get_repo(f"{owner}/{repo}")
-                issue = repository.get_issue(issue_number)
-                comment = issue.create_comment(body)
+        # Get GitHub client
+        client = get_client(ctx)
 
-                comment_dict = convert_to_issue_comment(comment)
-                return marshalled_text_result(comment_dict)
+        try:
+            # Add comment to issue
+            repository = get_repository(client, owner, repo)
+            issue = repository.get_issue(issue_number)
+            comment = issue.create_comment(body)
 
-            except Exception as e:
-                logger.error(f"Failed to add comment to issue {issue_number}: {e}")
-                return CallToolResult(type="error", error={"message": f"Failed to add comment to issue {issue_number}: {str(e)}"})
+            comment_dict = convert_to_issue_comment(comment)
+            return marshalled_text_result(comment_dict)
 
         except Exception as e:
-            logger.error(f"Error in add_issue_comment handler: {e}")
-            return CallToolResult(type="error", error={"message": str(e)})
+            logger.error("Failed to add comment to issue %s: %s", issue_number, e)
+            return error_result(f"Failed to add comment to issue {issue_number}: {str(e)}")
 
     tool = Tool(
         name="add_issue_comment",
         description=translator("TOOL_ADD_ISSUE_COMMENT_DESCRIPTION", "Add a comment to a GitHub issue"),
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "owner": {
-                    "type": "string",
-                    "description": "Repository owner"
-                },
-                "repo": {
-                    "type": "string",
-                    "description": "Repository name"
-                },
-                "issue_number": {
-                    "type": "integer",
-                    "description": "Issue number"
-                },
-                "body": {
-                    "type": "string",
-                    "description": "Comment body"
-                }
-            },
-            "required": ["owner", "repo", "issue_number", "body"]
-        }
+        inputSchema=_ADD_ISSUE_COMMENT_SCHEMA
     )
 
     return tool, handler
@@ -670,7 +627,7 @@ def add_issue_comment_tool(get_client: GetClientFn, translator: TranslationHelpe
 def get_issue_tools(get_client: GetClientFn, get_gql_client: Optional[GetGQLClientFn] = None, translator: Optional[TranslationHelperFunc] = None) -> List[Tuple[Tool, Callable]]:
     """Get all issue-related tools."""
     if translator is None:
-        translator = lambda key, default: default
+        translator = default_translator
 
     tools = [
         get_issue_tool(get_client, translator),
@@ -3,444 +3,410 @@ GitHub Miscellaneous Tools
 Converted from github-mcp-server/pkg/github/ (notifications.go, gists.go, discussions.go)
 """
 
+import functools
 import json
 from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 from mcp.types import Tool, CallToolRequest, CallToolResult
 from mcp.server.fastmcp import FastMCP
 from .server import (
-    GetClientFn, GetGQLClientFn, TranslationHelperFunc, required_param, optional_param,
-    optional_bool_param_with_default, optional_pagination_params,
-    to_bool_ptr, marshalled_text_result
+    GetClientFn, GetGQLClientFn, TranslationHelperFunc, default_translator, Fields, get_field,
+    compile_params, required, optional, optional_bool, pagination, tool_handler, run_in_thread,
+    error_result, to_bool_ptr, marshalled_text_result
 )
 from .clients import GraphQLClient
 import logging
 
 logger = logging.getLogger(__name__)
 
+_NOTIFICATION_FIELDS = Fields(
+    ('id', ''), ('unread', True), ('reason', ''), ('updated_at', None),
+    ('last_read_at', None), ('url', '')
+)
+
+_SUBJECT_FIELDS = Fields(('title', ''), ('url', ''), ('latest_comment_url', ''), ('type', ''))
+
+_NOTIFICATION_REPO_FIELDS = Fields(('id', 0), ('name', ''), ('full_name', ''), ('html_url', ''))
+
+_GIST_FIELDS = Fields(
+    ('id', ''), ('html_url', ''), ('public', True), ('created_at', None),
+    ('updated_at', None), ('description', ''), ('comments', 0)
+)
+
+_GIST_OWNER_FIELDS = Fields(('login', ''), ('id', 0), ('html_url', ''))
+
+_GIST_FILE_FIELDS = Fields(('filename', ''), ('type', ''), ('language', ''), ('raw_url', ''), ('size', 0))
+
+_DISCUSSION_FIELDS = Fields(
+    ('id', ''), ('number', 0), ('title', ''), ('body', ''), ('html_url', ''),
+    ('created_at', None), ('updated_at', None), ('upvote_count', 0),
+    ('comments_count', 0), ('locked', False), ('state', '')
+)
+
+_DISCUSSION_AUTHOR_FIELDS = Fields(('login', ''), ('id', ''), ('url', ''))
+
+_DISCUSSION_CATEGORY_FIELDS = Fields(('id', ''), ('name', ''), ('description', ''), ('emoji', ''))
+
+_MISSING = object()
+
+
 # Type definitions for GitHub API responses
 def convert_to_notification(notification: Any) -> Dict[str, Any]:
-    """Convert GitHub notification to dictionary format."""
-    if not notification:
-        return {}
-
-    result = {
-        'id': getattr(notification, 'id', ''),
-        'unread': getattr(notification, 'unread', True),
-        'reason': getattr(notification, 'reason', ''),
-        'updated_at': getattr(notification, 'updated_at', '').isoformat() if hasattr(notification, 'updated_at') and notification.updated_at else None,
-        'last_read_at': getattr(notification, 'last_read_at', '').isoformat() if hasattr(notification, 'last_read_at') and notification.last_read_at else None,
-        'url': getattr(notification, 'url', ''),
-    }
+    """Convert a GitHub notification, or its raw JSON, to dictionary format."""
+    result = _NOTIFICATION_FIELDS.extract(notification)
 
     # Extract subject information
-    if hasattr(notification, 'subject') and notification.subject:
-        result['subject'] = {
-            'title': getattr(notification.subject, 'title', ''),
-            'url': getattr(notification.subject, 'url', ''),
-            'latest_comment_url': getattr(notification.subject, 'latest_comment_url', ''),
-            'type': getattr(notification.subject, 'type', ''),
-        }
+    subject = get_field(notification, 'subject')
+    if subject:
+        result['subject'] = _SUBJECT_FIELDS.extract(subject)
 
     # Extract repository information
-    if hasattr(notification, 'repository') and notification.repository:
-        result['repository'] = {
-            'id': getattr(notification.repository, 'id', 0),
-            'name': getattr(notification.repository, 'name', ''),
-            'full_name': getattr(notification.repository, 'full_name', ''),
-            'html_url': getattr(notification.repository, 'html_url', ''),
-        }
+    repository = get_field(notification, 'repository')
+    if repository:
+        result['repository'] = _NOTIFICATION_REPO_FIELDS.extract(repository)
 
     return result
 
 
 def convert_to_gist(gist: Any) -> Dict[str, Any]:
-    """Convert GitHub gist to dictionary format."""
-    if not gist:
-        return {}
-
-    result = {
-        'id': getattr(gist, 'id', ''),
-        'html_url': getattr(gist, 'html_url', ''),
-        'public': getattr(gist, 'public', True),
-        'created_at': getattr(gist, 'created_at', '').isoformat() if hasattr(gist, 'created_at') and gist.created_at else None,
-        'updated_at': getattr(gist, 'updated_at', '').isoformat() if hasattr(gist, 'updated_at') and gist.updated_at else None,
-        'description': getattr(gist, 'description', ''),
-        'comments': getattr(gist, 'comments', 0),
-    }
+    """Convert a GitHub gist, or its raw JSON, to dictionary format."""
+    result = _GIST_FIELDS.extract(gist)
 
     # Extract owner information
-    if hasattr(gist, 'owner') and gist.owner:
-        result['owner'] = {
-            'login': getattr(gist.owner, 'login', ''),
-            'id': getattr(gist.owner, 'id', 0),
-            'html_url': getattr(gist.owner, 'html_url', ''),
-        }
+    owner = get_field(gist, 'owner')
+    if owner:
+        result['owner'] = _GIST_OWNER_FIELDS.extract(owner)
 
     # Extract files information
-    if hasattr(gist, 'files'):
-        result['files'] = {}
-        for filename, file_info in gist.files.items():
-            result['files'][filename] = {
-                'filename': getattr(file_info, 'filename', ''),
-                'type': getattr(file_info, 'type', ''),
-                'language': getattr(file_info, 'language', ''),
-                'raw_url': getattr(file_info, 'raw_url', ''),
-                'size': getattr(file_info, 'size', 0),
-            }
+    files = get_field(gist, 'files', _MISSING)
+    if files is not _MISSING:
+        result['files'] = {
+            filename: _GIST_FILE_FIELDS.extract(file_info)
+            for filename, file_info in files.items()
+        }
 
     return result
 
 
 def convert_to_discussion(discussion: Any) -> Dict[str, Any]:
     """Convert GitHub discussion to dictionary format."""
-    if not discussion:
-        return {}
-
-    result = {
-        'id': getattr(discussion, 'id', ''),
-        'number': getattr(discussion, 'number', 0),
-        'title': getattr(discussion, 'title', ''),
-        'body': getattr(discussion, 'body', ''),
-        'html_url': getattr(discussion, 'html_url', ''),
-        'created_at': getattr(discussion, 'created_at', '').isoformat() if hasattr(discussion, 'created_at') and discussion.created_at else None,
-        'updated_at': getattr(discussion, 'updated_at', '').isoformat() if hasattr(discussion, 'updated_at') and discussion.updated_at else None,
-        'upvote_count': getattr(discussion, 'upvote_count', 0),
-        'comments_count': getattr(discussion, 'comments_count', 0),
-        'locked': getattr(discussion, 'locked', False),
-        'state': getattr(discussion, 'state', ''),
-    }
+    result = _DISCUSSION_FIELDS.extract(discussion)
 
     # Extract author information
-    if hasattr(discussion, 'author') and discussion.author:
-        result['author'] = {
-            'login': getattr(discussion.author, 'login', ''),
-            'id': getattr(discussion.author, 'id', ''),
-            'url': getattr(discussion.author, 'url', ''),
-        }
+    author = get_field(discussion, 'author')
+    if author:
+        result['author'] = _DISCUSSION_AUTHOR_FIELDS.extract(author)
 
     # Extract category information
-    if hasattr(discussion, 'category') and discussion.category:
-        result['category'] = {
-            'id': getattr(discussion.category, 'id', ''),
-            'name': getattr(discussion.category, 'name', ''),
-            'description': getattr(discussion.category, 'description', ''),
-            'emoji': getattr(discussion.category, 'emoji', ''),
-        }
+    category = get_field(discussion, 'category')
+    if category:
+        result['category'] = _DISCUSSION_CATEGORY_FIELDS.extract(category)
 
     return result
 
 
+_LIST_NOTIFICATIONS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "all": {
+            "type": "boolean",
+            "description": "Include all notifications, not just unread ones",
+            "default": False
+        },
+        "participating": {
+            "type": "boolean",
+            "description": "Only include notifications in which the user is directly participating",
+            "default": False
+        },
+        "since": {
+            "type": "string",
+            "description": "Only show notifications updated after this timestamp (ISO 8601 format)"
+        },
+        "before": {
+            "type": "string",
+            "description": "Only show notifications updated before this timestamp (ISO 8601 format)"
+        },
+        "page": {
+            "type": "number",
+            "description": "Page number for pagination (min 1)",
+            "minimum": 1
+        },
+        "perPage": {
+            "type": "number",
+            "description": "Results per page for pagination (min 1, max 100)",
+            "minimum": 1,
+            "maximum": 100
+        }
+    }
+}
+
+_LIST_NOTIFICATIONS_PARAMS = compile_params(
+    optional_bool("all", False), optional_bool("participating", False),
+    optional("since", str), optional("before", str), pagination()
+)
+
+
 def list_notifications_tool(get_client: GetClientFn, translator: TranslationHelperFunc) -> Tuple[Tool, Callable]:
     """Create the list_notifications tool."""
 
+    @run_in_thread
+    @tool_handler("list_notifications")
     def handler(ctx: Any, request: CallToolRequest) -> CallToolResult:
+        # Extract parameters
+        args, err = _LIST_NOTIFICATIONS_PARAMS(request)
+        if err:
+            return error_result(str(err))
+        all_notifications, participating, since, before, pagination = args
+
+        # Get GitHub client
+        client = get_client(ctx)
+
         try:
-            # Extract parameters
-            all_notifications, err = optional_bool_param_with_default(request, "all", False)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            participating, err = optional_bool_param_with_default(request, "participating", False)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            since, err = optional_param(request, "since", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            before, err = optional_param(request, "before", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            pagination, err = optional_pagination_params(request)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            # Get GitHub client
-            client = get_client(ctx)
-
-            try:
-                # Get notifications
-                notifications = client.get_user().get_notifications(
-                    all=all_notifications,
-                    participating=participating,
-                    since=since,
-                    before=before,
-                    page=pagination.page,
-                    per_page=pagination.per_page
-                )
-
-                # Convert to list of notifications
-                result = []
-                for notification in notifications:
-                    result.append(convert_to_notification(notification))
-
-                return marshalled_text_result(result)
-
-            except Exception as e:
-                logger.error(f"Failed to list notifications: {e}")
-                return CallToolResult(type="error", error={"message": f"Failed to list notifications: {str(e)}"})
+            # Get the requested page of notifications as raw JSON
+            params = {
+                'all': 'true' if all_notifications else 'false',
+                'participating': 'true' if participating else 'false',
+                'page': pagination.page,
+                'per_page': pagination.per_page,
+            }
+            if since:
+                params['since'] = since
+            if before:
+                params['before'] = before
+            _, notifications = client.requester.requestJsonAndCheck("GET", "/notifications", parameters=params)
+
+            # Convert to list of notifications
+            result = list(map(convert_to_notification, filter(None, notifications)))
+
+            return marshalled_text_result(result)
 
         except Exception as e:
-            logger.error(f"Error in list_notifications handler: {e}")
-            return CallToolResult(type="error", error={"message": str(e)})
+            logger.error("Failed to list notifications: %s", e)
+            return error_result(f"Failed to list notifications: {str(e)}")
 
     tool = Tool(
         name="list_notifications",
         description=translator("TOOL_LIST_NOTIFICATIONS_DESCRIPTION", "List GitHub notifications for the authenticated user"),
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "all": {
-                    "type": "boolean",
-                    "description": "Include all notifications, not just unread ones",
-                    "default": False
-                },
-                "participating": {
-                    "type": "boolean",
-                    "description": "Only include notifications in which the user is directly participating",
-                    "default": False
-                },
-                "since": {
-                    "type": "string",
-                    "description": "Only show notifications updated after this timestamp (ISO 8601 format)"
-                },
-                "before": {
-                    "type": "string",
-                    "description": "Only show notifications updated before this timestamp (ISO 8601 format)"
-                },
-                "page": {
-                    "type": "number",
-                    "description": "Page number for pagination (min 1)",
-                    "minimum": 1
-                },
-                "perPage": {
-                    "type": "number",
-                    "description": "Results per page for pagination (min 1, max 100)",
-                    "minimum": 1,
-                    "maximum": 100
-                }
-            }
-        }
+        inputSchema=_LIST_NOTIFICATIONS_SCHEMA
     )
 
     return tool, handler
 
 
+_LIST_GISTS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "since": {
+            "type": "string",
+            "description": "Only show gists updated after this timestamp (ISO 8601 format)"
+        },
+        "page": {
+            "type": "number",
+            "description": "Page number for pagination (min 1)",
+            "minimum": 1
+        },
+        "perPage": {
+            "type": "number",
+            "description": "Results per page for pagination (min 1, max 100)",
+            "minimum": 1,
+            "maximum": 100
+        }
+    }
+}
+
+_LIST_GISTS_PARAMS = compile_params(optional("since", str), pagination())
+
+
 def list_gists_tool(get_client: GetClientFn, translator: TranslationHelperFunc) -> Tuple[Tool, Callable]:
     """Create the list_gists tool."""
 
+    @run_in_thread
+    @tool_handler("list_gists")
     def handler(ctx: Any, request: CallToolRequest) -> CallToolResult:
-        try:
-            # Extract parameters
-            since, err = optional_param(request, "since", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
+        # Extract parameters
+        args, err = _LIST_GISTS_PARAMS(request)
+        if err:
+            return error_result(str(err))
+        since, pagination = args
 
-            pagination, err = optional_pagination_params(request)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
+        # Get GitHub client
+        client = get_client(ctx)
 
-            # Get GitHub client
-            client = get_client(ctx)
-
-            try:
-                # Get gists
-                gists = client.get_user().get_gists(since=since)
-
-                # Convert to list of gists
-                result = []
-                for gist in gists:
-                    result.append(convert_to_gist(gist))
+        try:
+            # Get the requested page of gists as raw JSON
+            params = {'page': pagination.page, 'per_page': pagination.per_page}
+            if since:
+                params['since'] = since
+            _, gists = client.requester.requestJsonAndCheck("GET", "/gists", parameters=params)
 
-                return marshalled_text_result(result)
+            # Convert to list of gists
+            result = list(map(convert_to_gist, filter(None, gists)))
 
-            except Exception as e:
-                logger.error(f"Failed to list gists: {e}")
-                return CallToolResult(type="error", error={"message": f"Failed to list gists: {str(e)}"})
+            return marshalled_text_result(result)
 
         except Exception as e:
-            logger.error(f"Error in list_gists handler: {e}")
-            return CallToolResult(type="error", error={"message": str(e)})
+            logger.error("Failed to list gists: %s", e)
+            return error_result(f"Failed to list gists: {str(e)}")
 
     tool = Tool(
         name="list_gists",
         description=translator("TOOL_LIST_GISTS_DESCRIPTION", "List GitHub gists for the authenticated user"),
-        inputSchema={
+        inputSchema=_LIST_GISTS_SCHEMA
+    )
+
+    return tool, handler
+
+
+_CREATE_GIST_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "files": {
             "type": "object",
-            "properties": {
-                "since": {
-                    "type": "string",
-                    "description": "Only show gists updated after this timestamp (ISO 8601 format)"
-                },
-                "page": {
-                    "type": "number",
-                    "description": "Page number for pagination (min 1)",
-                    "minimum": 1
-                },
-                "perPage": {
-                    "type": "number",
-                    "description": "Results per page for pagination (min 1, max 100)",
-                    "minimum": 1,
-                    "maximum": 100
-                }
+            "description": "Files to include in the gist",
+            "additionalProperties": {
+                "type": "string"
             }
+        },
+        "description": {
+            "type": "string",
+            "description": "Description of the gist"
+        },
+        "public": {
+            "type": "boolean",
+            "description": "Whether the gist should be public",
+            "default": False
         }
-    )
+    },
+    "required": ["files"]
+}
 
-    return tool, handler
+_CREATE_GIST_PARAMS = compile_params(required("files", dict), optional("description", str), optional_bool("public", False))
 
 
 def create_gist_tool(get_client: GetClientFn, translator: TranslationHelperFunc) -> Tuple[Tool, Callable]:
     """Create the create_gist tool."""
 
+    @run_in_thread
+    @tool_handler("create_gist")
     def handler(ctx: Any, request: CallToolRequest) -> CallToolResult:
-        try:
-            # Extract parameters
-            files, err = required_param(request, "files", dict)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            description, err = optional_param(request, "description", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            public, err = optional_bool_param_with_default(request, "public", False)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            # Get GitHub client
-            client = get_client(ctx)
+        # Extract parameters
+        args, err = _CREATE_GIST_PARAMS(request)
+        if err:
+            return error_result(str(err))
+        files, description, public = args
 
-            try:
-                # Create the gist
-                gist = client.get_user().create_gist(
-                    public=public,
-                    files=files,
-                    description=description or ''
-                )
+        # Get GitHub client
+        client = get_client(ctx)
 
-                gist_dict = convert_to_gist(gist)
-                return marshalled_text_result(gist_dict)
+        try:
+            # Create the gist
+            gist = client.get_user().create_gist(
+                public=public,
+                files=files,
+                description=description or ''
+            )
 
-            except Exception as e:
-                logger.error(f"Failed to create gist: {e}")
-                return CallToolResult(type="error", error={"message": f"Failed to create gist: {str(e)}"})
+            gist_dict = convert_to_gist(gist)
+            return marshalled_text_result(gist_dict)
 
         except Exception as e:
-            logger.error(f"Error in create_gist handler: {e}")
-            return CallToolResult(type="error", error={"message": str(e)})
+            logger.error("Failed to create gist: %s", e)
+            return error_result(f"Failed to create gist: {str(e)}")
 
     tool = Tool(
         name="create_gist",
         description=translator("TOOL_CREATE_GIST_DESCRIPTION", "Create a new GitHub gist"),
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "files": {
-                    "type": "object",
-                    "description": "Files to include in the gist",
-                    "additionalProperties": {
-                        "type": "string"
-                    }
-                },
-                "description": {
-                    "type": "string",
-                    "description": "Description of the gist"
-                },
-                "public": {
-                    "type": "boolean",
-                    "description": "Whether the gist should be public",
-                    "default": False
-                }
-            },
-            "required": ["files"]
-        }
+        inputSchema=_CREATE_GIST_SCHEMA
     )
 
     return tool, handler
 
 
+_GET_DISCUSSION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "owner": {
+            "type": "string",
+            "description": "Repository owner"
+        },
+        "repo": {
+            "type": "string",
+            "description": "Repository name"
+        },
+        "discussion_number": {
+            "type": "integer",
+            "description": "Discussion number"
+        }
+    },
+    "required": ["owner", "repo", "discussion_number"]
+}
+
+_GET_DISCUSSION_PARAMS = compile_params(required("owner", str), required("repo", str), required("discussion_number", int))
+
+
 def get_discussion_tool(get_gql_client: GetGQLClientFn, translator: TranslationHelperFunc) -> Tuple[Tool, Callable]:
     """Create the get_discussion tool."""
 
+    @run_in_thread
+    @tool_handler("get_discussion")
     def handler(ctx: Any, request: CallToolRequest) -> CallToolResult:
+        # Extract parameters
+        args, err = _GET_DISCUSSION_PARAMS(request)
+        if err:
+            return error_result(str(err))
+        owner, repo, discussion_number = args
+
+        # Get GraphQL client
+        gql_client = get_gql_client(ctx)
+
         try:
-            # Extract parameters
-            owner, err = required_param(request, "owner", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            repo, err = required_param(request, "repo", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            discussion_number, err = required_param(request, "discussion_number", int)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            # Get GraphQL client
-            gql_client = get_gql_client(ctx)
-
-            try:
-                # This would need GraphQL implementation
-                # For now, return a placeholder response
-                return marshalled_text_result({
-                    'message': 'Discussion retrieval requires GraphQL implementation',
-                    'owner': owner,
-                    'repo': repo,
-                    'discussion_number': discussion_number
-                })
-
-            except Exception as e:
-                logger.error(f"Failed to get discussion {discussion_number}: {e}")
-                return CallToolResult(type="error", error={"message": f"Failed to get discussion {discussion_number}: {str(e)}"})
+            # This would need GraphQL implementation
+            # For now, return a placeholder response
+            return marshalled_text_result({
+                'message': 'Discussion retrieval requires GraphQL implementation',
+                'owner': owner,
+                'repo': repo,
+                'discussion_number': discussion_number
+            })
 
         except Exception as e:
-            logger.error(f"Error in get_discussion handler: {e}")
-            return CallToolResult(type="error", error={"message": str(e)})
+            logger.error("Failed to get discussion %s: %s", discussion_number, e)
+            return error_result(f"Failed to get discussion {discussion_number}: {str(e)}")
 
     tool = Tool(
         name="get_discussion",
         description=translator("TOOL_GET_DISCUSSION_DESCRIPTION", "Get details for a GitHub discussion"),
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "owner": {
-                    "type": "string",
-                    "description": "Repository owner"
-                },
-                "repo": {
-                    "type": "string",
-                    "description": "Repository name"
-                },
-                "discussion_number": {
-                    "type": "integer",
-                    "description": "Discussion number"
-                }
-            },
-            "required": ["owner", "repo", "discussion_number"]
-        }
+        inputSchema=_GET_DISCUSSION_SCHEMA
     )
 
     return tool, handler
 
 
-# Export the main functions for tool registration
-def get_misc_tools(get_client: GetClientFn, get_gql_client: Optional[GetGQLClientFn] = None, translator: Optional[TranslationHelperFunc] = None) -> List[Tuple[Tool, Callable]]:
-    """Get all miscellaneous tools."""
+# REST-backed tool factories, in registration order
+_REST_TOOL_FACTORIES = (list_notifications_tool, list_gists_tool, create_gist_tool)
+
+
+@functools.lru_cache(maxsize=32)
+def _build_misc_tools(get_client: GetClientFn, get_gql_client: Optional[GetGQLClientFn],
+                      translator: Optional[TranslationHelperFunc]) -> Tuple[Tuple[Tool, Callable], ...]:
+    """Build the miscellaneous tools once per (get_client, get_gql_client, translator)."""
     if translator is None:
-        translator = lambda key, default: default
+        translator = default_translator
 
-    tools = [
-        list_notifications_tool(get_client, translator),
-        list_gists_tool(get_client, translator),
-        create_gist_tool(get_client, translator),
-    ]
+    tools = [factory(get_client, translator) for factory in _REST_TOOL_FACTORIES]
 
     # Add GraphQL-based tools if GraphQL client is available
     if get_gql_client:
         tools.append(get_discussion_tool(get_gql_client, translator))
 
-    return tools
+    return tuple(tools)
+
+
+# Export the main functions for tool registration
+def get_misc_tools(get_client: GetClientFn, get_gql_client: Optional[GetGQLClientFn] = None, translator: Optional[TranslationHelperFunc] = None) -> List[Tuple[Tool, Callable]]:
+    """
+    Get all miscellaneous tools.
+    Repeated calls with the same callables reuse the tools built the first
+    time; each call gets its own list.
+    """
+    return list(_build_misc_tools(get_client, get_gql_client, translator))
@@ -3,15 +3,16 @@ GitHub Pull Request Tools
 Converted from github-mcp-server/pkg/github/pullrequests.go
 """
 
+import functools
 import json
 from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 from mcp.types import Tool, CallToolRequest, CallToolResult
 from mcp.server.fastmcp import FastMCP
 from .server import (
-    GetClientFn, GetGQLClientFn, TranslationHelperFunc, required_param, optional_param,
-    optional_bool_param_with_default, optional_pagination_params,
-    to_bool_ptr, marshalled_text_result
+    GetClientFn, GetGQLClientFn, TranslationHelperFunc, default_translator, Fields, compile_params,
+    required, optional, optional_bool, pagination, tool_handler, error_result, run_in_thread,
+    to_bool_ptr, marshalled_text_result, get_repository, get_field
 )
 from .clients import GraphQLClient
 import logging
@@ -31,593 +32,521 @@ class PullRequestFile:
         self.patch = patch
 
 
+_PR_FIELDS = Fields(
+    ('id', 0), ('number', 0), ('title', ''), ('body', ''), ('state', ''), ('html_url', ''),
+    ('created_at', None), ('updated_at', None), ('closed_at', None), ('merged_at', None),
+    ('mergeable', None), ('mergeable_state', ''), ('merged', False),
+    ('merge_commit_sha', ''), ('draft', False)
+)
+
+_BRANCH_FIELDS = Fields(('ref', ''), ('sha', ''))
+
+_BRANCH_REPO_FIELDS = Fields(('name', ''), ('full_name', ''))
+
+_USER_FIELDS = Fields(('login', ''), ('id', 0), ('html_url', ''), ('type', ''))
+
+_LABEL_FIELDS = Fields(('name', ''), ('color', ''), ('description', ''))
+
+_PR_FILE_FIELDS = Fields(
+    ('filename', ''), ('status', ''), ('additions', 0), ('deletions', 0), ('changes', 0),
+    ('patch', None), ('blob_url', ''), ('raw_url', '')
+)
+
+_MISSING = object()
+
+
+def _convert_branch(branch: Any) -> Dict[str, Any]:
+    """Convert the head or base of a pull request to dictionary format."""
+    result = _BRANCH_FIELDS.extract(branch)
+    repo = get_field(branch, 'repo')
+    result['repo'] = _BRANCH_REPO_FIELDS.extract(repo) if repo else {}
+    return result
+
+
 def convert_to_pull_request(pr: Any) -> Dict[str, Any]:
-    """Convert GitHub pull request to dictionary format."""
+    """Convert a GitHub pull request, or its raw JSON, to dictionary format."""
     if not pr:
         return {}
 
-    result = {
-        'id': getattr(pr, 'id', 0),
-        'number': getattr(pr, 'number', 0),
-        'title': getattr(pr, 'title', ''),
-        'body': getattr(pr, 'body', ''),
-        'state': getattr(pr, 'state', ''),
-        'html_url': getattr(pr, 'html_url', ''),
-        'created_at': getattr(pr, 'created_at', '').isoformat() if hasattr(pr, 'created_at') and pr.created_at else None,
-        'updated_at': getattr(pr, 'updated_at', '').isoformat() if hasattr(pr, 'updated_at') and pr.updated_at else None,
-        'closed_at': getattr(pr, 'closed_at', '').isoformat() if hasattr(pr, 'closed_at') and pr.closed_at else None,
-        'merged_at': getattr(pr, 'merged_at', '').isoformat() if hasattr(pr, 'merged_at') and pr.merged_at else None,
-        'mergeable': getattr(pr, 'mergeable', None),
-        'mergeable_state': getattr(pr, 'mergeable_state', ''),
-        'merged': getattr(pr, 'merged', False),
-        'merge_commit_sha': getattr(pr, 'merge_commit_sha', ''),
-        'draft': getattr(pr, 'draft', False),
-    }
+    result = _PR_FIELDS.extract(pr)
 
     # Extract head and base branch information
-    if hasattr(pr, 'head') and pr.head:
-        result['head'] = {
-            'ref': getattr(pr.head, 'ref', ''),
-            'sha': getattr(pr.head, 'sha', ''),
-            'repo': {
-                'name': getattr(pr.head.repo, 'name', '') if pr.head.repo else '',
-                'full_name': getattr(pr.head.repo, 'full_name', '') if pr.head.repo else '',
-            } if pr.head.repo else {}
-        }
+    head = get_field(pr, 'head')
+    if head:
+        result['head'] = _convert_branch(head)
 
-    if hasattr(pr, 'base') and pr.base:
-        result['base'] = {
-            'ref': getattr(pr.base, 'ref', ''),
-            'sha': getattr(pr.base, 'sha', ''),
-            'repo': {
-                'name': getattr(pr.base.repo, 'name', '') if pr.base.repo else '',
-                'full_name': getattr(pr.base.repo, 'full_name', '') if pr.base.repo else '',
-            } if pr.base.repo else {}
-        }
+    base = get_field(pr, 'base')
+    if base:
+        result['base'] = _convert_branch(base)
 
     # Extract user information
-    if hasattr(pr, 'user') and pr.user:
-        result['user'] = {
-            'login': getattr(pr.user, 'login', ''),
-            'id': getattr(pr.user, 'id', 0),
-            'html_url': getattr(pr.user, 'html_url', ''),
-            'type': getattr(pr.user, 'type', ''),
-        }
+    user = get_field(pr, 'user')
+    if user:
+        result['user'] = _USER_FIELDS.extract(user)
 
     # Extract labels
-    if hasattr(pr, 'labels'):
-        result['labels'] = []
-        for label in pr.labels or []:
-            result['labels'].append({
-                'name': getattr(label, 'name', ''),
-                'color': getattr(label, 'color', ''),
-                'description': getattr(label, 'description', ''),
-            })
+    labels = get_field(pr, 'labels', _MISSING)
+    if labels is not _MISSING:
+        result['labels'] = [_LABEL_FIELDS.extract(label) for label in labels or []]
 
     return result
 
 
 def convert_to_pr_file(file: Any) -> Dict[str, Any]:
-    """Convert GitHub pull request file to dictionary format."""
+    """Convert a GitHub pull request file, or its raw JSON, to dictionary format."""
     if not file:
         return {}
 
-    return {
-        'filename': getattr(file, 'filename', ''),
-        'status': getattr(file, 'status', ''),
-        'additions': getattr(file, 'additions', 0),
-        'deletions': getattr(file, 'deletions', 0),
-        'changes': getattr(file, 'changes', 0),
-        'patch': getattr(file, 'patch', '') if hasattr(file, 'patch') else None,
-        'blob_url': getattr(file, 'blob_url', ''),
-        'raw_url': getattr(file, 'raw_url', ''),
-    }
+    return _PR_FILE_FIELDS.extract(file)
+
+
+_GET_PULL_REQUEST_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "owner": {
+            "type": "string",
+            "description": "Repository owner"
+        },
+        "repo": {
+            "type": "string",
+            "description": "Repository name"
+        },
+        "pull_number": {
+            "type": "integer",
+            "description": "Pull request number"
+        }
+    },
+    "required": ["owner", "repo", "pull_number"]
+}
+
+_GET_PULL_REQUEST_PARAMS = compile_params(required("owner", str), required("repo", str), required("pull_number", int))
 
 
 def get_pull_request_tool(get_client: GetClientFn, translator: TranslationHelperFunc) -> Tuple[Tool, Callable]:
     """Create the get_pull_request tool."""
 
+    @run_in_thread
+    @tool_handler("get_pull_request")
     def handler(ctx: Any, request: CallToolRequest) -> CallToolResult:
-        try:
-            # Extract parameters
-            owner, err = required_param(request, "owner", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            repo, err = required_param(request, "repo", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            pull_number, err = required_param(request, "pull_number", int)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            # Get GitHub client
-            client = get_client(ctx)
+        # Extract parameters
+        args, err = _GET_PULL_REQUEST_PARAMS(request)
+        if err:
+            return error_result(str(err))
+        owner, repo, pull_number = args
 
-            try:
-                # Get the pull request
-                repository = client.get_repo(f"{owner}/{repo}")
-                pr = repository.get_pull(pull_number)
-                pr_dict = convert_to_pull_request(pr)
-                return marshalled_text_result(pr_dict)
+        # Get GitHub client
+        client = get_client(ctx)
 
-            except Exception as e:
-                logger.error(f"Failed to get pull request {pull_number}: {e}")
-                return CallToolResult(type="error", error={"message": f"Failed to get pull request {pull_number}: {str(e)}"})
+        try:
+            # Get the pull request
+            repository = get_repository(client, owner, repo)
+            pr = repository.get_pull(pull_number)
+            pr_dict = convert_to_pull_request(pr)
+            return marshalled_text_result(pr_dict)
 
         except Exception as e:
-            logger.error(f"Error in get_pull_request handler: {e}")
-            return CallToolResult(type="error", error={"message": str(e)})
+            logger.error("Failed to get pull request %s: %s", pull_number, e)
+            return error_result(f"Failed to get pull request {pull_number}: {str(e)}")
 
     tool = Tool(
         name="get_pull_request",
         description=translator("TOOL_GET_PULL_REQUEST_DESCRIPTION", "Get details for a GitHub pull request"),
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "owner": {
-                    "type": "string",
-                    "description": "Repository owner"
-                },
-                "repo": {
-                    "type": "string",
-                    "description": "Repository name"
-                },
-                "pull_number": {
-                    "type": "integer",
-                    "description": "Pull request number"
-                }
-            },
-            "required": ["owner", "repo", "pull_number"]
-        }
+        inputSchema=_GET_PULL_REQUEST_SCHEMA
     )
 
     return tool, handler
 
 
+_LIST_PULL_REQUESTS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "owner": {
+            "type": "string",
+            "description": "Repository owner"
+        },
+        "repo": {
+            "type": "string",
+            "description": "Repository name"
+        },
+        "state": {
+            "type": "string",
+            "description": "Pull request state",
+            "enum": ["open", "closed", "all"]
+        },
+        "head": {
+            "type": "string",
+            "description": "Filter by head branch"
+        },
+        "base": {
+            "type": "string",
+            "description": "Filter by base branch"
+        },
+        "sort": {
+            "type": "string",
+            "description": "Sort field",
+            "enum": ["created", "updated", "popularity", "long-running"]
+        },
+        "direction": {
+            "type": "string",
+            "description": "Sort direction",
+            "enum": ["asc", "desc"]
+        },
+        "page": {
+            "type": "number",
+            "description": "Page number for pagination (min 1)",
+            "minimum": 1
+        },
+        "perPage": {
+            "type": "number",
+            "description": "Results per page for pagination (min 1, max 100)",
+            "minimum": 1,
+            "maximum": 100
+        }
+    },
+    "required": ["owner", "repo"]
+}
+
+_LIST_PULL_REQUESTS_PARAMS = compile_params(
+    required("owner", str), required("repo", str), optional("state", str), optional("head", str),
+    optional("base", str), optional("sort", str), optional("direction", str), pagination()
+)
+
+
 def list_pull_requests_tool(get_client: GetClientFn, translator: TranslationHelperFunc) -> Tuple[Tool, Callable]:
     """Create the list_pull_requests tool."""
 
+    @run_in_thread
+    @tool_handler("list_pull_requests")
     def handler(ctx: Any, request: CallToolRequest) -> CallToolResult:
+        # Extract parameters
+        args, err = _LIST_PULL_REQUESTS_PARAMS(request)
+        if err:
+            return error_result(str(err))
+        owner, repo, state, head, base, sort, direction, pagination = args
+
+        # Get GitHub client
+        client = get_client(ctx)
+
         try:
-            # Extract parameters
-            owner, err = required_param(request, "owner", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            repo, err = required_param(request, "repo", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            state, err = optional_param(request, "state", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            head, err = optional_param(request, "head", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            base, err = optional_param(request, "base", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            sort, err = optional_param(request, "sort", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            direction, err = optional_param(request, "direction", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            pagination, err = optional_pagination_params(request)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            # Get GitHub client
-            client = get_client(ctx)
-
-            try:
-                # Get pull requests
-                repository = client.get_repo(f"{owner}/{repo}")
-
-                # Prepare parameters
-                params = {}
-                if state:
-                    params['state'] = state
-                if head:
-                    params['head'] = head
-                if base:
-                    params['base'] = base
-                if sort:
-                    params['sort'] = sort
-                if direction:
-                    params['direction'] = direction
-
-                pulls = repository.get_pulls(**params)
-                paginated_pulls = pulls.get_page(pagination.page - 1) if pagination.page > 1 else list(pulls[:pagination.per_page])
-
-                # Convert to list of pull requests
-                result = []
-                for pr in paginated_pulls:
-                    result.append(convert_to_pull_request(pr))
-
-                return marshalled_text_result(result)
-
-            except Exception as e:
-                logger.error(f"Failed to list pull requests: {e}")
-                return CallToolResult(type="error", error={"message": f"Failed to list pull requests: {str(e)}"})
+            # Get pull requests
+            repository = get_repository(client, owner, repo)
+
+            # Prepare parameters
+            params = {}
+            if state:
+                params['state'] = state
+            if head:
+                params['head'] = head
+            if base:
+                params['base'] = base
+            if sort:
+                params['sort'] = sort
+            if direction:
+                params['direction'] = direction
+
+            # Fetch exactly the requested page as raw JSON
+            params['page'] = pagination.page
+            params['per_page'] = pagination.per_page
+            _, paginated_pulls = client.requester.requestJsonAndCheck(
+                "GET", f"{repository.url}/pulls", parameters=params
+            )
+
+            # Convert to list of pull requests
+            result = []
+            for pr in paginated_pulls:
+                result.append(convert_to_pull_request(pr))
+
+            return marshalled_text_result(result)
 
         except Exception as e:
-            logger.error(f"Error in list_pull_requests handler: {e}")
-            return CallToolResult(type="error", error={"message": str(e)})
+            logger.error("Failed to list pull requests: %s", e)
+            return error_result(f"Failed to list pull requests: {str(e)}")
 
     tool = Tool(
         name="list_pull_requests",
         description=translator("TOOL_LIST_PULL_REQUESTS_DESCRIPTION", "List pull requests for a GitHub repository"),
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "owner": {
-                    "type": "string",
-                    "description": "Repository owner"
-                },
-                "repo": {
-                    "type": "string",
-                    "description": "Repository name"
-                },
-                "state": {
-                    "type": "string",
-                    "description": "Pull request state",
-                    "enum": ["open", "closed", "all"]
-                },
-                "head": {
-                    "type": "string",
-                    "description": "Filter by head branch"
-                },
-                "base": {
-                    "type": "string",
-                    "description": "Filter by base branch"
-                },
-                "sort": {
-                    "type": "string",
-                    "description": "Sort field",
-                    "enum": ["created", "updated", "popularity", "long-running"]
-                },
-                "direction": {
-                    "type": "string",
-                    "description": "Sort direction",
-                    "enum": ["asc", "desc"]
-                },
-                "page": {
-                    "type": "number",
-                    "description": "Page number for pagination (min 1)",
-                    "minimum": 1
-                },
-                "perPage": {
-                    "type": "number",
-                    "description": "Results per page for pagination (min 1, max 100)",
-                    "minimum": 1,
-                    "maximum": 100
-                }
-            },
-            "required": ["owner", "repo"]
-        }
+        inputSchema=_LIST_PULL_REQUESTS_SCHEMA
     )
 
     return tool, handler
 
 
+_CREATE_PULL_REQUEST_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "owner": {
+            "type": "string",
+            "description": "Repository owner"
+        },
+        "repo": {
+            "type": "string",
+            "description": "Repository name"
+        },
+        "title": {
+            "type": "string",
+            "description": "Pull request title"
+        },
+        "head": {
+            "type": "string",
+            "description": "Head branch name"
+        },
+        "base": {
+            "type": "string",
+            "description": "Base branch name"
+        },
+        "body": {
+            "type": "string",
+            "description": "Pull request body"
+        },
+        "draft": {
+            "type": "boolean",
+            "description": "Whether to create a draft pull request",
+            "default": False
+        }
+    },
+    "required": ["owner", "repo", "title", "head", "base"]
+}
+
+_CREATE_PULL_REQUEST_PARAMS = compile_params(
+    required("owner", str), required("repo", str), required("title", str), required("head", str),
+    required("base", str), optional("body", str), optional_bool("draft", False)
+)
+
+
 def create_pull_request_tool(get_client: GetClientFn, translator: TranslationHelperFunc) -> Tuple[Tool, Callable]:
     """Create the create_pull_request tool."""
 
+    @run_in_thread
+    @tool_handler("create_pull_request")
     def handler(ctx: Any, request: CallToolRequest) -> CallToolResult:
+        # Extract parameters
+        args, err = _CREATE_PULL_REQUEST_PARAMS(request)
+        if err:
+            return error_result(str(err))
+        owner, repo, title, head, base, body, draft = args
+
+        # Get GitHub client
+        client = get_client(ctx)
+
         try:
-            # Extract parameters
-            owner, err = required_param(request, "owner", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            repo, err = required_param(request, "repo", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            title, err = required_param(request, "title", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            head, err = required_param(request, "head", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            base, err = required_param(request, "base", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            body, err = optional_param(request, "body", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            draft, err = optional_bool_param_with_default(request, "draft", False)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            # Get GitHub client
-            client = get_client(ctx)
-
-            try:
-                # Create the pull request
-                repository = client.get_repo(f"{owner}/{repo}")
-                pr = repository.create_pull(
-                    title=title,
-                    body=body or '',
-                    head=head,
-                    base=base,
-                    draft=draft
-                )
-
-                pr_dict = convert_to_pull_request(pr)
-                return marshalled_text_result(pr_dict)
-
-            except Exception as e:
-                logger.error(f"Failed to create pull request: {e}")
-                return CallToolResult(type="error", error={"message": f"Failed to create pull request: {str(e)}"})
+            # Create the pull request
+            repository = get_repository(client, owner, repo)
+            pr = repository.create_pull(
+                title=title,
+                body=body or '',
+                head=head,
+                base=base,
+                draft=draft
+            )
+
+            pr_dict = convert_to_pull_request(pr)
+            return marshalled_text_result(pr_dict)
 
         except Exception as e:
-            logger.error(f"Error in create_pull_request handler: {e}")
-            return CallToolResult(type="error", error={"message": str(e)})
+            logger.error("Failed to create pull request: %s", e)
+            return error_result(f"Failed to create pull request: {str(e)}")
 
     tool = Tool(
         name="create_pull_request",
         description=translator("TOOL_CREATE_PULL_REQUEST_DESCRIPTION", "Create a new GitHub pull request"),
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "owner": {
-                    "type": "string",
-                    "description": "Repository owner"
-                },
-                "repo": {
-                    "type": "string",
-                    "description": "Repository name"
-                },
-                "title": {
-                    "type": "string",
-                    "description": "Pull request title"
-                },
-                "head": {
-                    "type": "string",
-                    "description": "Head branch name"
-                },
-                "base": {
-                    "type": "string",
-                    "description": "Base branch name"
-                },
-                "body": {
-                    "type": "string",
-                    "description": "Pull request body"
-                },
-                "draft": {
-                    "type": "boolean",
-                    "description": "Whether to create a draft pull request",
-                    "default": False
-                }
-            },
-            "required": ["owner", "repo", "title", "head", "base"]
-        }
+        inputSchema=_CREATE_PULL_REQUEST_SCHEMA
     )
 
     return tool, handler
 
 
+_MERGE_PULL_REQUEST_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "owner": {
+            "type": "string",
+            "description": "Repository owner"
+        },
+        "repo": {
+            "type": "string",
+            "description": "Repository name"
+        },
+        "pull_number": {
+            "type": "integer",
+            "description": "Pull request number"
+        },
+        "commit_title": {
+            "type": "string",
+            "description": "Title for the merge commit"
+        },
+        "commit_message": {
+            "type": "string",
+            "description": "Message for the merge commit"
+        },
+        "merge_method": {
+            "type": "string",
+            "description": "Merge method to use",
+            "enum": ["merge", "squash", "rebase"]
+        }
+    },
+    "required": ["owner", "repo", "pull_number"]
+}
+
+_MERGE_PULL_REQUEST_PARAMS = compile_params(
+    required("owner", str), required("repo", str), required("pull_number", int),
+    optional("commit_title", str), optional("commit_message", str), optional("merge_method", str)
+)
+
+
 def merge_pull_request_tool(get_client: GetClientFn, translator: TranslationHelperFunc) -> Tuple[Tool, Callable]:
     """Create the merge_pull_request tool."""
 
+    @run_in_thread
+    @tool_handler("merge_pull_request")
     def handler(ctx: Any, request: CallToolRequest) -> CallToolResult:
+        # Extract parameters
+        args, err = _MERGE_PULL_REQUEST_PARAMS(request)
+        if err:
+            return error_result(str(err))
+        owner, repo, pull_number, commit_title, commit_message, merge_method = args
+
+        # Get GitHub client
+        client = get_client(ctx)
+
         try:
-            # Extract parameters
-            owner, err = required_param(request, "owner", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            repo, err = required_param(request, "repo", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            pull_number, err = required_param(request, "pull_number", int)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            commit_title, err = optional_param(request, "commit_title", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            commit_message, err = optional_param(request, "commit_message", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            merge_method, err = optional_param(request, "merge_method", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            # Get GitHub client
-            client = get_client(ctx)
-
-            try:
-                # Merge the pull request
-                repository = client.get_repo(f"{owner}/{repo}")
-                pr = repository.get_pull(pull_number)
-
-                # Prepare merge options
-                merge_options = {}
-                if commit_title:
-                    merge_options['commit_title'] = commit_title
-                if commit_message:
-                    merge_options['commit_message'] = commit_message
-                if merge_method:
-                    merge_options['merge_method'] = merge_method
-                else:
-                    merge_options['merge_method'] = 'merge'
-
-                result = pr.merge(**merge_options)
-
-                if result.merged:
-                    return marshalled_text_result({
-                        'merged': True,
-                        'message': 'Pull request merged successfully',
-                        'merge_commit_sha': result.sha
-                    })
-                else:
-                    return CallToolResult(type="error", error={"message": "Failed to merge pull request"})
-
-            except Exception as e:
-                logger.error(f"Failed to merge pull request {pull_number}: {e}")
-                return CallToolResult(type="error", error={"message": f"Failed to merge pull request {pull_number}: {str(e)}"})
+            # Merge the pull request
+            repository = get_repository(client, owner, repo)
+            pr = repository.get_pull(pull_number)
+
+            # Prepare merge options
+            merge_options = {}
+            if commit_title:
+                merge_options['commit_title'] = commit_title
+            if commit_message:
+                merge_options['commit_message'] = commit_message
+            if merge_method:
+                merge_options['merge_method'] = merge_method
+            else:
+                merge_options['merge_method'] = 'merge'
+
+            result = pr.merge(**merge_options)
+
+            if result.merged:
+                return marshalled_text_result({
+                    'merged': True,
+                    'message': 'Pull request merged successfully',
+                    'merge_commit_sha': result.sha
+                })
+            else:
+                return error_result("Failed to merge pull request")
 
         except Exception as e:
-            logger.error(f"Error in merge_pull_request handler: {e}")
-            return CallToolResult(type="error", error={"message": str(e)})
+            logger.error("Failed to merge pull request %s: %s", pull_number, e)
+            return error_result(f"Failed to merge pull request {pull_number}: {str(e)}")
 
     tool = Tool(
         name="merge_pull_request",
         description=translator("TOOL_MERGE_PULL_REQUEST_DESCRIPTION", "Merge a GitHub pull request"),
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "owner": {
-                    "type": "string",
-                    "description": "Repository owner"
-                },
-                "repo": {
-                    "type": "string",
-                    "description": "Repository name"
-                },
-                "pull_number": {
-                    "type": "integer",
-                    "description": "Pull request number"
-                },
-                "commit_title": {
-                    "type": "string",
-                    "description": "Title for the merge commit"
-                },
-                "commit_message": {
-                    "type": "string",
-                    "description": "Message for the merge commit"
-                },
-                "merge_method": {
-                    "type": "string",
-                    "description": "Merge method to use",
-                    "enum": ["merge", "squash", "rebase"]
-                }
-            },
-            "required": ["owner", "repo", "pull_number"]
-        }
+        inputSchema=_MERGE_PULL_REQUEST_SCHEMA
     )
 
     return tool, handler
 
 
-def get_pull_request_files_tool(get_client: GetClientFn, translator: TranslationHelperFunc) -> Tuple[Tool, Callable]:
-    """Create the get_pull_request_files tool."""
-
-    def handler(ctx: Any, request: CallToolRequest) -> CallToolResult:
-        try:
-            # Extract parameters
-            owner, err = required_param(request, "owner", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
+_GET_PULL_REQUEST_FILES_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "owner": {
+            "type": "string",
+            "description": "Repository owner"
+        },
+        "repo": {
+            "type": "string",
+            "description": "Repository name"
+        },
+        "pull_number": {
+            "type": "integer",
+            "description": "Pull request number"
+        },
+        "page": {
+            "type": "number",
+            "description": "Page number for pagination (min 1)",
+            "minimum": 1
+        },
+        "perPage": {
+            "type": "number",
+            "description": "Results per page for pagination (min 1, max 100)",
+            "minimum": 1,
+            "maximum": 100
+        }
+    },
+    "required": ["owner", "repo", "pull_number"]
+}
 
-            repo, err = required_param(request, "repo", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
+_GET_PULL_REQUEST_FILES_PARAMS = compile_params(
+    required("owner", str), required("repo", str), required("pull_number", int), pagination()
+)
 
-            pull_number, err = required_param(request, "pull_number", int)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
 
-            pagination, err = optional_pagination_params(request)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
+def get_pull_request_files_tool(get_client: GetClientFn, translator: TranslationHelperFunc) -> Tuple[Tool, Callable]:
+    """Create the get_pull_request_files tool."""
 
-            # Get GitHub client
-            client = get_client(ctx)
+    @run_in_thread
+    @tool_handler("get_pull_request_files")
+    def handler(ctx: Any, request: CallToolRequest) -> CallToolResult:
+        # Extract parameters
+        args, err = _GET_PULL_REQUEST_FILES_PARAMS(request)
+        if err:
+            return error_result(str(err))
+        owner, repo, pull_number, pagination = args
 
-            try:
-                # Get pull request files
-                repository = client.get_repo(f"{owner}/{repo}")
-                pr = repository.get_pull(pull_number)
-                files = pr.get_files()
+        # Get GitHub client
+        client = get_client(ctx)
 
-                # Convert to list of files
-                result = []
-                for file in files:
-                    result.append(convert_to_pr_file(file))
+        try:
+            # Get pull request files
+            repository = get_repository(client, owner, repo)
+            _, files = client.requester.requestJsonAndCheck(
+                "GET", f"{repository.url}/pulls/{pull_number}/files",
+                parameters={'page': pagination.page, 'per_page': pagination.per_page}
+            )
 
-                return marshalled_text_result(result)
+            # Convert to list of files
+            result = [convert_to_pr_file(file) for file in files]
 
-            except Exception as e:
-                logger.error(f"Failed to get pull request files for {pull_number}: {e}")
-                return CallToolResult(type="error", error={"message": f"Failed to get pull request files for {pull_number}: {str(e)}"})
+            return marshalled_text_result(result)
 
         except Exception as e:
-            logger.error(f"Error in get_pull_request_files handler: {e}")
-            return CallToolResult(type="error", error={"message": str(e)})
+            logger.error("Failed to get pull request files for %s: %s", pull_number, e)
+            return error_result(f"Failed to get pull request files for {pull_number}: {str(e)}")
 
     tool = Tool(
         name="get_pull_request_files",
         description=translator("TOOL_GET_PULL_REQUEST_FILES_DESCRIPTION", "Get files changed in a GitHub pull request"),
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "owner": {
-                    "type": "string",
-                    "description": "Repository owner"
-                },
-                "repo": {
-                    "type": "string",
-                    "description": "Repository name"
-                },
-                "pull_number": {
-                    "type": "integer",
-                    "description": "Pull request number"
-                },
-                "page": {
-                    "type": "number",
-                    "description": "Page number for pagination (min 1)",
-                    "minimum": 1
-                },
-                "perPage": {
-                    "type": "number",
-                    "description": "Results per page for pagination (min 1, max 100)",
-                    "minimum": 1,
-                    "maximum": 100
-                }
-            },
-            "required": ["owner", "repo", "pull_number"]
-        }
+        inputSchema=_GET_PULL_REQUEST_FILES_SCHEMA
     )
 
     return tool, handler
 
 
-# Export the main functions for tool registration
-def get_pull_request_tools(get_client: GetClientFn, get_gql_client: Optional[GetGQLClientFn] = None, translator: Optional[TranslationHelperFunc] = None) -> List[Tuple[Tool, Callable]]:
-    """Get all pull request-related tools."""
-    if translator is None:
-        translator = lambda key, default: default
+_TOOL_FACTORIES = (
+    get_pull_request_tool, list_pull_requests_tool, get_pull_request_files_tool,
+    # Write tools (these require write permissions)
+    create_pull_request_tool, merge_pull_request_tool,
+)
 
-    tools = [
-        get_pull_request_tool(get_client, translator),
-        list_pull_requests_tool(get_client, translator),
-        get_pull_request_files_tool(get_client, translator),
-    ]
 
-    # Add write tools (these require write permissions)
-    write_tools = [
-        create_pull_request_tool(get_client, translator),
-        merge_pull_request_tool(get_client, translator),
-    ]
+@functools.lru_cache(maxsize=32)
+def _build_pull_request_tools(get_client: GetClientFn,
+                              translator: Optional[TranslationHelperFunc]) -> Tuple[Tuple[Tool, Callable], ...]:
+    """Build the pull request tools once per (get_client, translator)."""
+    if translator is None:
+        translator = default_translator
+
+    return tuple(factory(get_client, translator) for factory in _TOOL_FACTORIES)
 
-    tools.extend(write_tools)
 
-    return tools
+# Export the main functions for tool registration
+def get_pull_request_tools(get_client: GetClientFn, get_gql_client: Optional[GetGQLClientFn] = None, translator: Optional[TranslationHelperFunc] = None) -> List[Tuple[Tool, Callable]]:
+    """
+    Get all pull request-related tools.
+    Repeated calls with the same callables reuse the tools, and the
+    translated descriptions, built the first time; each call gets its own
+    list.
+    """
+    return list(_build_pull_request_tools(get_client, translator))
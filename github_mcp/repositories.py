@@ -3,389 +3,420 @@ GitHub Repository Tools
 Converted from github-mcp-server/pkg/github/repositories.go
 """
 
+import functools
 import json
-import base64
+import binascii
+import hashlib
+import re
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 from mcp.types import Tool, CallToolRequest, CallToolResult
 from mcp.server.fastmcp import FastMCP
 from .server import (
-    GetClientFn, TranslationHelperFunc, required_param, optional_param,
-    optional_bool_param_with_default, optional_pagination_params,
-    to_bool_ptr, marshalled_text_result
+    GetClientFn, TranslationHelperFunc, default_translator, Fields, compile_params, required,
+    optional, optional_bool, pagination, tool_handler, error_result, run_in_thread,
+    to_bool_ptr, marshalled_text_result, get_repository
 )
 import logging
 
 logger = logging.getLogger(__name__)
 
 # Minimal types for GitHub API responses
+@dataclass(slots=True)
 class MinimalCommit:
     """Minimal representation of a GitHub commit."""
-    def __init__(self, sha: str = "", message: str = "", author: Optional[Dict] = None,
-                 committer: Optional[Dict] = None, url: str = "", html_url: str = "",
-                 files: Optional[List] = None, stats: Optional[Dict] = None):
-        self.sha = sha
-        self.message = message
-        self.author = author
-        self.committer = committer
-        self.url = url
-        self.html_url = html_url
-        self.files = files
-        self.stats = stats
+    sha: str = ""
+    message: str = ""
+    author: Optional[Dict] = None
+    committer: Optional[Dict] = None
+    url: str = ""
+    html_url: str = ""
+    files: Optional[List] = None
+    stats: Optional[Dict] = None
 
-def convert_to_minimal_commit(commit: Any, include_diff: bool = False) -> MinimalCommit:
-    """Convert a GitHub commit to minimal representation."""
-    if not commit:
-        return MinimalCommit()
 
-    # Extract basic commit info
-    sha = getattr(commit, 'sha', '')
-    message = ''
-    author = None
-    committer = None
-    url = getattr(commit, 'url', '')
-    html_url = getattr(commit, 'html_url', '')
-
-    if hasattr(commit, 'commit'):
-        commit_data = commit.commit
-        if hasattr(commit_data, 'message'):
-            message = commit_data.message
-
-        # Extract author info
-        if hasattr(commit_data, 'author'):
-            author_data = commit_data.author
-            if author_data:
-                author = {
-                    'name': getattr(author_data, 'name', ''),
-                    'email': getattr(author_data, 'email', ''),
-                    'date': getattr(author_data, 'date', '').isoformat() if hasattr(author_data, 'date') and author_data.date else None
-                }
-
-        # Extract committer info
-        if hasattr(commit_data, 'committer'):
-            committer_data = commit_data.committer
-            if committer_data:
-                committer = {
-                    'name': getattr(committer_data, 'name', ''),
-                    'email': getattr(committer_data, 'email', ''),
-                    'date': getattr(committer_data, 'date', '').isoformat() if hasattr(committer_data, 'date') and committer_data.date else None
-                }
+_SIGNATURE_FIELDS = Fields(('name', ''), ('email', ''), ('date', None))
 
-    files = None
-    stats = None
-
-    if include_diff:
-        # Extract file changes and stats if requested
-        if hasattr(commit, 'files'):
-            files = []
-            for file in commit.files or []:
-                files.append({
-                    'filename': getattr(file, 'filename', ''),
-                    'status': getattr(file, 'status', ''),
-                    'additions': getattr(file, 'additions', 0),
-                    'deletions': getattr(file, 'deletions', 0),
-                    'changes': getattr(file, 'changes', 0),
-                    'patch': getattr(file, 'patch', '') if hasattr(file, 'patch') else None
-                })
+_COMMIT_FILE_FIELDS = Fields(
+    ('filename', ''), ('status', ''), ('additions', 0), ('deletions', 0), ('changes', 0),
+    ('patch', None)
+)
+
+_COMMIT_STATS_FIELDS = Fields(('additions', 0), ('deletions', 0), ('total', 0))
 
-        if hasattr(commit, 'stats'):
-            stats_data = commit.stats
-            if stats_data:
-                stats = {
-                    'additions': getattr(stats_data, 'additions', 0),
-                    'deletions': getattr(stats_data, 'deletions', 0),
-                    'total': getattr(stats_data, 'total', 0)
-                }
+
+def _commit_data(commit: Any) -> Dict[str, Any]:
+    """Return the raw JSON of a PyGithub Commit, or the dict itself."""
+    return commit if isinstance(commit, dict) else commit.raw_data
+
+def _convert_commit_meta(data: Dict[str, Any]) -> MinimalCommit:
+    """Convert raw commit JSON to minimal representation without files or stats."""
+    get = data.get
+
+    # Extract message, author and committer from the git commit data
+    commit_data = get('commit') or {}
+    author = commit_data.get('author')
+    committer = commit_data.get('committer')
 
     return MinimalCommit(
-        sha=sha,
-        message=message,
-        author=author,
-        committer=committer,
-        url=url,
-        html_url=html_url,
-        files=files,
-        stats=stats
+        sha=get('sha', ''),
+        message=commit_data.get('message', ''),
+        author=_SIGNATURE_FIELDS.extract(author) if author else None,
+        committer=_SIGNATURE_FIELDS.extract(committer) if committer else None,
+        url=get('url', ''),
+        html_url=get('html_url', '')
     )
 
+def _extract_files_and_stats(data: Dict[str, Any]) -> Tuple[Optional[List], Optional[Dict]]:
+    """Extract file changes and stats from raw commit JSON."""
+    files = None
+    if 'files' in data:
+        files = [_COMMIT_FILE_FIELDS.extract(file) for file in data['files'] or ()]
+
+    stats_data = data.get('stats')
+    stats = _COMMIT_STATS_FIELDS.extract(stats_data) if stats_data else None
+    return files, stats
+
+def _convert_commit_full(data: Dict[str, Any]) -> MinimalCommit:
+    """Convert raw commit JSON to minimal representation including files and stats."""
+    result = _convert_commit_meta(data)
+    result.files, result.stats = _extract_files_and_stats(data)
+    return result
+
+def convert_to_minimal_commit(commit: Any, include_diff: bool = False) -> MinimalCommit:
+    """
+    Convert a GitHub commit to minimal representation.
+    Accepts a PyGithub Commit or the raw commit JSON; fields are projected
+    straight from the JSON, so dates keep GitHub's ISO-8601 form.
+    """
+    if not commit:
+        return MinimalCommit()
+
+    data = _commit_data(commit)
+    return _convert_commit_full(data) if include_diff else _convert_commit_meta(data)
+
+_SEARCH_REPOSITORY_FIELDS = Fields(
+    ('id', 0), ('name', ''), ('full_name', ''), ('description', None), ('html_url', ''),
+    ('language', None), ('stargazers_count', 0), ('forks_count', 0)
+)
+
+_SEARCH_OWNER_FIELDS = Fields(('login', None), ('type', None))
+
+
+def _convert_search_repository(repo: Any) -> Dict[str, Any]:
+    """Convert a repository search result to dictionary format."""
+    result = _SEARCH_REPOSITORY_FIELDS.extract(repo)
+    owner = repo.owner
+    result['owner'] = _SEARCH_OWNER_FIELDS.extract(owner) if owner else None
+    return result
+
+# get_commit fetches in progress, keyed by (client, owner/repo, sha)
+_commit_fetches: Dict[Tuple[Any, str, str], Future] = {}
+_commit_fetches_lock = threading.Lock()
+
+
+def _fetch_commit(client: Any, owner: str, repo: str, sha: str) -> Any:
+    """
+    Fetch a commit. Concurrent calls for the same commit on the same client
+    wait for the request already in flight instead of sending their own.
+    """
+    key = (client, f"{owner}/{repo}", sha)
+    with _commit_fetches_lock:
+        future = _commit_fetches.get(key)
+        leader = future is None
+        if leader:
+            future = _commit_fetches[key] = Future()
+
+    if not leader:
+        return future.result()
+
+    try:
+        commit = get_repository(client, owner, repo).get_commit(sha)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(commit)
+        return commit
+    finally:
+        with _commit_fetches_lock:
+            del _commit_fetches[key]
+
+_GET_COMMIT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "owner": {"type": "string", "description": "Repository owner"},
+        "repo": {"type": "string", "description": "Repository name"},
+        "sha": {"type": "string", "description": "Commit SHA, branch name, or tag name"},
+        "include_diff": {"type": "boolean", "description": "Whether to include file diffs and stats", "default": True},
+        "page": {"type": "number", "description": "Page number for pagination (min 1)", "minimum": 1},
+        "perPage": {"type": "number", "description": "Results per page (min 1, max 100)", "minimum": 1, "maximum": 100}
+    },
+    "required": ["owner", "repo", "sha"]
+}
+
+_GET_COMMIT_PARAMS = compile_params(
+    required("owner", str), required("repo", str), required("sha", str), optional_bool("include_diff", True)
+)
+
 def get_commit_tool(get_client: GetClientFn, translator: TranslationHelperFunc) -> Tuple[Tool, Callable]:
     """Create the get_commit tool."""
+    @run_in_thread
+    @tool_handler("get_commit")
     def handler(ctx: Any, request: CallToolRequest) -> CallToolResult:
-        try:
-            owner, err = required_param(request, "owner", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            repo, err = required_param(request, "repo", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            sha, err = required_param(request, "sha", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            include_diff, err = optional_bool_param_with_default(request, "include_diff", True)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            client = get_client(ctx)
-            try:
-                commit = client.get_repo(f"{owner}/{repo}").get_commit(sha)
-                minimal_commit = convert_to_minimal_commit(commit, include_diff)
-                return marshalled_text_result(minimal_commit)
-            except Exception as e:
-                logger.error(f"Failed to get commit {sha}: {e}")
-                return CallToolResult(type="error", error={"message": f"Failed to get commit {sha}: {str(e)}"})
+        args, err = _GET_COMMIT_PARAMS(request)
+        if err:
+            return error_result(str(err))
+        owner, repo, sha, include_diff = args
 
+        client = get_client(ctx)
+        try:
+            data = _fetch_commit(client, owner, repo, sha).raw_data
+            convert = _convert_commit_full if include_diff else _convert_commit_meta
+            return marshalled_text_result(convert(data))
         except Exception as e:
-            logger.error(f"Error in get_commit handler: {e}")
-            return CallToolResult(type="error", error={"message": str(e)})
+            logger.error("Failed to get commit %s: %s", sha, e)
+            return error_result(f"Failed to get commit {sha}: {str(e)}")
 
     tool = Tool(
         name="get_commit",
         description=translator("TOOL_GET_COMMITS_DESCRIPTION", "Get details for a commit from a GitHub repository"),
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "owner": {"type": "string", "description": "Repository owner"},
-                "repo": {"type": "string", "description": "Repository name"},
-                "sha": {"type": "string", "description": "Commit SHA, branch name, or tag name"},
-                "include_diff": {"type": "boolean", "description": "Whether to include file diffs and stats", "default": True},
-                "page": {"type": "number", "description": "Page number for pagination (min 1)", "minimum": 1},
-                "perPage": {"type": "number", "description": "Results per page (min 1, max 100)", "minimum": 1, "maximum": 100}
-            },
-            "required": ["owner", "repo", "sha"]
-        }
+        inputSchema=_GET_COMMIT_SCHEMA
     )
     return tool, handler
 
+_LIST_COMMITS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "owner": {"type": "string", "description": "Repository owner"},
+        "repo": {"type": "string", "description": "Repository name"},
+        "sha": {"type": "string", "description": "Commit SHA, branch or tag name to list commits of"},
+        "author": {"type": "string", "description": "Author username or email address to filter commits by"},
+        "page": {"type": "number", "description": "Page number for pagination (min 1)", "minimum": 1},
+        "perPage": {"type": "number", "description": "Results per page (min 1, max 100)", "minimum": 1, "maximum": 100}
+    },
+    "required": ["owner", "repo"]
+}
+
+_LIST_COMMITS_PARAMS = compile_params(
+    required("owner", str), required("repo", str), optional("sha", str), optional("author", str), pagination()
+)
+
 def list_commits_tool(get_client: GetClientFn, translator: TranslationHelperFunc) -> Tuple[Tool, Callable]:
     """Create the list_commits tool."""
+    @run_in_thread
+    @tool_handler("list_commits")
     def handler(ctx: Any, request: CallToolRequest) -> CallToolResult:
-        try:
-            owner, err = required_param(request, "owner", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            repo, err = required_param(request, "repo", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            sha, err = optional_param(request, "sha", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            author, err = optional_param(request, "author", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            pagination, err = optional_pagination_params(request)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            per_page = pagination.per_page or 30
-            client = get_client(ctx)
+        args, err = _LIST_COMMITS_PARAMS(request)
+        if err:
+            return error_result(str(err))
+        owner, repo, sha, author, pagination = args
 
-            try:
-                repository = client.get_repo(f"{owner}/{repo}")
-                commits = repository.get_commits(sha=sha, author=author, page=pagination.page, per_page=per_page)
-
-                minimal_commits = []
-                for commit in commits:
-                    minimal_commits.append(convert_to_minimal_commit(commit, False))
-
-                return marshalled_text_result(minimal_commits)
-            except Exception as e:
-                logger.error(f"Failed to list commits: {e}")
-                return CallToolResult(type="error", error={"message": f"Failed to list commits: {str(e)}"})
+        client = get_client(ctx)
 
+        try:
+            repository = get_repository(client, owner, repo)
+
+            # Fetch exactly the requested page as raw JSON
+            params = {'page': pagination.page, 'per_page': pagination.per_page}
+            if sha:
+                params['sha'] = sha
+            if author:
+                params['author'] = author
+            _, commits = client.requester.requestJsonAndCheck(
+                "GET", f"{repository.url}/commits", parameters=params
+            )
+
+            return marshalled_text_result([_convert_commit_meta(commit) for commit in commits])
         except Exception as e:
-            logger.error(f"Error in list_commits handler: {e}")
-            return CallToolResult(type="error", error={"message": str(e)})
+            logger.error("Failed to list commits: %s", e)
+            return error_result(f"Failed to list commits: {str(e)}")
 
     tool = Tool(
         name="list_commits",
         description=translator("TOOL_LIST_COMMITS_DESCRIPTION", "Get list of commits of a branch in a GitHub repository"),
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "owner": {"type": "string", "description": "Repository owner"},
-                "repo": {"type": "string", "description": "Repository name"},
-                "sha": {"type": "string", "description": "Commit SHA, branch or tag name to list commits of"},
-                "author": {"type": "string", "description": "Author username or email address to filter commits by"},
-                "page": {"type": "number", "description": "Page number for pagination (min 1)", "minimum": 1},
-                "perPage": {"type": "number", "description": "Results per page (min 1, max 100)", "minimum": 1, "maximum": 100}
-            },
-            "required": ["owner", "repo"]
-        }
+        inputSchema=_LIST_COMMITS_SCHEMA
     )
     return tool, handler
 
+_SEARCH_REPOSITORIES_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "query": {"type": "string", "description": "Search query"},
+        "sort": {"type": "string", "description": "Sort field", "enum": ["best-match", "stars", "forks", "updated"]},
+        "order": {"type": "string", "description": "Sort order", "enum": ["asc", "desc"]},
+        "page": {"type": "number", "description": "Page number for pagination (min 1)", "minimum": 1},
+        "perPage": {"type": "number", "description": "Results per page (min 1, max 100)", "minimum": 1, "maximum": 100}
+    },
+    "required": ["query"]
+}
+
+_SEARCH_REPOSITORIES_PARAMS = compile_params(required("query", str), optional("sort", str), optional("order", str), pagination())
+
 def search_repositories_tool(get_client: GetClientFn, translator: TranslationHelperFunc) -> Tuple[Tool, Callable]:
     """Create the search_repositories tool."""
+    @run_in_thread
+    @tool_handler("search_repositories")
     def handler(ctx: Any, request: CallToolRequest) -> CallToolResult:
+        args, err = _SEARCH_REPOSITORIES_PARAMS(request)
+        if err:
+            return error_result(str(err))
+        query, sort, order, pagination = args
+
+        client = get_client(ctx)
+
         try:
-            query, err = required_param(request, "query", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            sort, err = optional_param(request, "sort", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            order, err = optional_param(request, "order", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            pagination, err = optional_pagination_params(request)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            client = get_client(ctx)
-
-            try:
-                results = client.search_repositories(
-                    query=query,
-                    sort=sort or "best-match",
-                    order=order or "desc",
-                    page=pagination.page,
-                    per_page=pagination.per_page
-                )
-
-                repos = []
-                for repo in results:
-                    repos.append({
-                        'id': repo.id,
-                        'name': repo.name,
-                        'full_name': repo.full_name,
-                        'description': repo.description,
-                        'html_url': repo.html_url,
-                        'language': repo.language,
-                        'stargazers_count': repo.stargazers_count,
-                        'forks_count': repo.forks_count,
-                        'owner': {
-                            'login': repo.owner.login if repo.owner else None,
-                            'type': repo.owner.type if repo.owner else None
-                        } if repo.owner else None
-                    })
-
-                return marshalled_text_result(repos)
-            except Exception as e:
-                logger.error(f"Failed to search repositories: {e}")
-                return CallToolResult(type="error", error={"message": f"Failed to search repositories: {str(e)}"})
+            results = client.search_repositories(
+                query=query,
+                sort=sort or "best-match",
+                order=order or "desc",
+                page=pagination.page,
+                per_page=pagination.per_page
+            )
+
+            repos = [_convert_search_repository(repo) for repo in results]
 
+            return marshalled_text_result(repos)
         except Exception as e:
-            logger.error(f"Error in search_repositories handler: {e}")
-            return CallToolResult(type="error", error={"message": str(e)})
+            logger.error("Failed to search repositories: %s", e)
+            return error_result(f"Failed to search repositories: {str(e)}")
 
     tool = Tool(
         name="search_repositories",
         description=translator("TOOL_SEARCH_REPOSITORIES_DESCRIPTION", "Search for GitHub repositories"),
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "query": {"type": "string", "description": "Search query"},
-                "sort": {"type": "string", "description": "Sort field", "enum": ["best-match", "stars", "forks", "updated"]},
-                "order": {"type": "string", "description": "Sort order", "enum": ["asc", "desc"]},
-                "page": {"type": "number", "description": "Page number for pagination (min 1)", "minimum": 1},
-                "perPage": {"type": "number", "description": "Results per page (min 1, max 100)", "minimum": 1, "maximum": 100}
-            },
-            "required": ["query"]
-        }
+        inputSchema=_SEARCH_REPOSITORIES_SCHEMA
     )
     return tool, handler
 
+_DIRECTORY_ENTRY_FIELDS = Fields(('name', ''), ('path', ''), ('type', ''), ('size', 0), ('download_url', ''))
+
+# Full commit SHAs (SHA-1 or SHA-256); only these name immutable content
+_COMMIT_SHA_RE = re.compile(r'[0-9a-fA-F]{40}(?:[0-9a-fA-F]{24})?')
+
+def _convert_raw_file(path: str, body: bytes, download_url: str) -> Dict[str, Any]:
+    """
+    Convert a file downloaded from the raw host to the get_file_contents shape.
+    The sha is the git blob hash of the bytes, as the contents API reports it.
+    """
+    try:
+        content, encoding = body.decode('utf-8'), 'utf-8'
+    except UnicodeDecodeError:
+        content, encoding = binascii.b2a_base64(body, newline=False).decode('ascii'), 'base64'
+
+    path = path.strip('/')
+    return {
+        'name': path.rpartition('/')[2],
+        'path': path,
+        'content': content,
+        'encoding': encoding,
+        'size': len(body),
+        'sha': hashlib.sha1(b'blob %d\0' % len(body) + body).hexdigest(),
+        'download_url': download_url,
+    }
+
+_GET_FILE_CONTENTS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "owner": {"type": "string", "description": "Repository owner"},
+        "repo": {"type": "string", "description": "Repository name"},
+        "path": {"type": "string", "description": "Path to file or directory"},
+        "ref": {"type": "string", "description": "Branch name, tag, or commit SHA"}
+    },
+    "required": ["owner", "repo", "path"]
+}
+
+_GET_FILE_CONTENTS_PARAMS = compile_params(required("owner", str), required("repo", str), required("path", str), optional("ref", str))
+
 def get_file_contents_tool(get_client: GetClientFn, translator: TranslationHelperFunc, get_raw_client: Optional[Callable] = None) -> Tuple[Tool, Callable]:
     """Create the get_file_contents tool."""
+    @run_in_thread
+    @tool_handler("get_file_contents")
     def handler(ctx: Any, request: CallToolRequest) -> CallToolResult:
+        args, err = _GET_FILE_CONTENTS_PARAMS(request)
+        if err:
+            return error_result(str(err))
+        owner, repo, path, ref = args
+
+        client = get_client(ctx)
+
         try:
-            owner, err = required_param(request, "owner", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            repo, err = required_param(request, "repo", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            path, err = required_param(request, "path", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            ref, err = optional_param(request, "ref", str)
-            if err:
-                return CallToolResult(type="error", error={"message": str(err)})
-
-            client = get_client(ctx)
-
-            try:
-                repository = client.get_repo(f"{owner}/{repo}")
-
-                if ref:
-                    file_content = repository.get_contents(path, ref=ref)
-                else:
-                    file_content = repository.get_contents(path)
-
-                if isinstance(file_content, list):
-                    files = []
-                    for item in file_content:
-                        files.append({
-                            'name': getattr(item, 'name', ''),
-                            'path': getattr(item, 'path', ''),
-                            'type': getattr(item, 'type', ''),
-                            'size': getattr(item, 'size', 0),
-                            'download_url': getattr(item, 'download_url', ''),
-                        })
-                    return marshalled_text_result({'files': files})
-                else:
-                    content = getattr(file_content, 'decoded_content', b'').decode('utf-8')
-                    encoding = getattr(file_content, 'encoding', '')
-
-                    if encoding == 'base64' and not content:
-                        content = base64.b64decode(getattr(file_content, 'content', '')).decode('utf-8')
-
-                    return marshalled_text_result({
-                        'name': getattr(file_content, 'name', ''),
-                        'path': getattr(file_content, 'path', ''),
-                        'content': content,
-                        'encoding': encoding,
-                        'size': getattr(file_content, 'size', 0),
-                        'sha': getattr(file_content, 'sha', ''),
-                        'download_url': getattr(file_content, 'download_url', ''),
-                    })
-
-            except Exception as e:
-                logger.error(f"Failed to get file contents for {path}: {e}")
-                return CallToolResult(type="error", error={"message": f"Failed to get file contents for {path}: {str(e)}"})
+            if get_raw_client is not None and ref and _COMMIT_SHA_RE.fullmatch(ref):
+                # Files at a commit SHA come straight from the raw host, whose
+                # CDN caching can't serve stale content for an immutable ref.
+                # Branches and tags use the contents API, which always reflects
+                # the latest push. Directories fall through.
+                raw = get_raw_client(ctx).get_raw(owner, repo, path, ref)
+                if raw is not None:
+                    return marshalled_text_result(_convert_raw_file(path, raw.content, raw.url))
+
+            repository = get_repository(client, owner, repo)
+
+            if ref:
+                file_content = repository.get_contents(path, ref=ref)
+            else:
+                file_content = repository.get_contents(path)
+
+            if isinstance(file_content, list):
+                files = [_DIRECTORY_ENTRY_FIELDS.extract(item) for item in file_content]
+                return marshalled_text_result({'files': files})
+            else:
+                data = file_content.raw_data
+                get = data.get
+                content = get('content') or ''
+                encoding = get('encoding', '')
+
+                # Decode the base64 payload once; binary files stay base64
+                if encoding == 'base64':
+                    try:
+                        content = binascii.a2b_base64(content).decode('utf-8')
+                        encoding = 'utf-8'
+                    except UnicodeDecodeError:
+                        content = content.replace('\n', '')
+
+                return marshalled_text_result({
+                    'name': get('name', ''),
+                    'path': get('path', ''),
+                    'content': content,
+                    'encoding': encoding,
+                    'size': get('size', 0),
+                    'sha': get('sha', ''),
+                    'download_url': get('download_url', ''),
+                })
 
         except Exception as e:
-            logger.error(f"Error in get_file_contents handler: {e}")
-            return CallToolResult(type="error", error={"message": str(e)})
+            logger.error("Failed to get file contents for %s: %s", path, e)
+            return error_result(f"Failed to get file contents for {path}: {str(e)}")
 
     tool = Tool(
         name="get_file_contents",
         description=translator("TOOL_GET_FILE_CONTENTS_DESCRIPTION", "Get the contents of a file or list directory contents"),
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "owner": {"type": "string", "description": "Repository owner"},
-                "repo": {"type": "string", "description": "Repository name"},
-                "path": {"type": "string", "description": "Path to file or directory"},
-                "ref": {"type": "string", "description": "Branch name, tag, or commit SHA"}
-            },
-            "required": ["owner", "repo", "path"]
-        }
+        inputSchema=_GET_FILE_CONTENTS_SCHEMA
     )
     return tool, handler
 
-# Export the main functions for tool registration
-def get_repository_tools(get_client: GetClientFn, get_raw_client: Optional[Callable] = None, translator: Optional[TranslationHelperFunc] = None) -> List[Tuple[Tool, Callable]]:
-    """Get all repository-related tools."""
+@functools.lru_cache(maxsize=32)
+def _build_repository_tools(get_client: GetClientFn, get_raw_client: Optional[Callable],
+                            translator: Optional[TranslationHelperFunc]) -> Tuple[Tuple[Tool, Callable], ...]:
+    """Build the repository tools once per (get_client, get_raw_client, translator)."""
     if translator is None:
-        translator = lambda key, default: default
+        translator = default_translator
 
-    return [
+    return (
         get_commit_tool(get_client, translator),
         list_commits_tool(get_client, translator),
         search_repositories_tool(get_client, translator),
         get_file_contents_tool(get_client, translator, get_raw_client),
-    ]
+    )
+
+
+# Export the main functions for tool registration
+def get_repository_tools(get_client: GetClientFn, get_raw_client: Optional[Callable] = None, translator: Optional[TranslationHelperFunc] = None) -> List[Tuple[Tool, Callable]]:
+    """
+    Get all repository-related tools.
+    Repeated calls with the same callables reuse the tools built the first
+    time; each call gets its own list.
+    """
+    return list(_build_repository_tools(get_client, get_raw_client, translator))
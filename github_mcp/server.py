@@ -3,12 +3,22 @@ GitHub MCP Server - Core server functionality
 Converted from github-mcp-server/pkg/github/server.go
 """
 
+import asyncio
+import functools
 import json
+import operator
+from dataclasses import asdict, is_dataclass
+from datetime import date, datetime, timedelta
 from typing import Any, Callable, Dict, Optional, Tuple, Type, TypeVar
-from mcp.types import CallToolRequest, CallToolResult
+from mcp.types import CallToolRequest, CallToolResult, TextContent
 from mcp.server.fastmcp import FastMCP
 import logging
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
@@ -19,6 +29,19 @@ GetGQLClientFn = Callable[[Any], Any]  # Context -> GitHub GraphQL Client
 TranslationHelperFunc = Callable[[str, str], str]
 
 
+def default_translator(key: str, default: str) -> str:
+    """Translator used when none is configured: always the default text."""
+    return default
+
+_MISSING = object()
+
+# Zero values used for the "missing required parameter" check
+_EMPTIES: Dict[type, Any] = {
+    str: "", bytes: b"", int: 0, float: 0.0, bool: False,
+    list: [], tuple: (), dict: {}, set: frozenset()
+}
+
+
 class PaginationParams:
     """Parameters for pagination in REST API calls."""
     def __init__(self, page: int = 1, per_page: int = 30, after: str = ""):
@@ -69,7 +92,8 @@ def required_param(request: CallToolRequest, param_name: str, param_type: Type[T
         return None, ValueError(f"parameter {param_name} is not of type {param_type.__name__}, got {type(value).__name__}")
 
     # Check for empty values (comparable types)
-    if hasattr(value, '__eq__') and value == type(value)():
+    empty = _EMPTIES.get(type(value), _MISSING)
+    if empty is not _MISSING and value == empty:
         return None, ValueError(f"missing required parameter: {param_name}")
 
     return value, None
@@ -141,16 +165,13 @@ def optional_bool_param_with_default(request: CallToolRequest, param_name: str,
     """
     Helper function to fetch an optional boolean parameter with a default value.
     """
-    args = request.arguments
-    _, exists = args.get(param_name), param_name in args
-
-    value, err = optional_param(request, param_name, bool)
-    if err:
-        return False, err
-
-    if not exists:
+    value = request.arguments.get(param_name, _MISSING)
+    if value is _MISSING:
         return default, None
 
+    if not isinstance(value, bool):
+        return False, ValueError(f"parameter {param_name} is not of type bool, got {type(value).__name__}")
+
     return value, None
 
 
@@ -173,13 +194,11 @@ def optional_string_array_param(request: CallToolRequest, param_name: str) -> Tu
         if not value:  # empty list
             return [], None
 
-        # Convert all elements to strings
-        result = []
-        for item in value:
-            if not isinstance(item, str):
-                return None, ValueError(f"parameter {param_name} contains non-string element: {type(item).__name__}")
-            result.append(item)
-        return result, None
+        # all() short-circuits in C; only locate the offender on failure
+        if not all(isinstance(item, str) for item in value):
+            bad = next(item for item in value if not isinstance(item, str))
+            return None, ValueError(f"parameter {param_name} contains non-string element: {type(bad).__name__}")
+        return list(value), None
 
     return None, ValueError(f"parameter {param_name} could not be coerced to []string, got {type(value).__name__}")
 
@@ -189,21 +208,11 @@ def optional_pagination_params(request: CallToolRequest) -> Tuple[PaginationPara
     Returns pagination parameters from the request with defaults.
     Default page is 1, default per_page is 30.
     """
-    page, err = optional_int_param_with_default(request, "page", 1)
-    if err:
-        return PaginationParams(), err
-
-    per_page, err = optional_int_param_with_default(request, "perPage", 30)
-    if err:
-        return PaginationParams(), err
-
-    after, err = optional_param(request, "after", str)
+    params, err = _pagination_field(request.arguments)
     if err:
         return PaginationParams(), err
 
-    after = after or ""
-
-    return PaginationParams(page=page, per_page=per_page, after=after), None
+    return params, None
 
 
 def optional_cursor_pagination_params(request: CallToolRequest) -> Tuple[CursorPaginationParams, Optional[Exception]]:
@@ -223,6 +232,162 @@ def optional_cursor_pagination_params(request: CallToolRequest) -> Tuple[CursorP
     return CursorPaginationParams(per_page=per_page, after=after), None
 
 
+# Precompiled parameter parsers.
+#
+# The helpers above re-inspect the request on every call. Tools that parse a
+# fixed set of parameters can instead describe them once with the field
+# builders below and compile them into a single parser at import time:
+#
+#     _parse_args = compile_params(required("owner", str), optional_int("page", 1))
+#     (owner, page), err = _parse_args(request)
+#
+# Each field is a closure over its name, accepted types and default, taking
+# the arguments dict and returning (value, err). Error messages match the
+# helpers above.
+
+ParamField = Callable[[Dict[str, Any]], Tuple[Any, Optional[Exception]]]
+
+
+def _type_name(param_type: Any) -> str:
+    if isinstance(param_type, tuple):
+        return " or ".join(t.__name__ for t in param_type)
+    return param_type.__name__
+
+
+def required(param_name: str, param_type: Any) -> ParamField:
+    """Field for a required parameter that must be non-empty."""
+    type_name = _type_name(param_type)
+    missing = ValueError(f"missing required parameter: {param_name}")
+    to_int = isinstance(param_type, tuple) and float in param_type
+
+    def field(args: Dict[str, Any]) -> Tuple[Any, Optional[Exception]]:
+        value = args.get(param_name, _MISSING)
+        if value is _MISSING:
+            return None, missing
+        if not isinstance(value, param_type):
+            return None, ValueError(f"parameter {param_name} is not of type {type_name}, got {type(value).__name__}")
+        if value == _EMPTIES.get(type(value), _MISSING):
+            return None, missing
+        if to_int and type(value) is float:
+            value = int(value)
+        return value, None
+
+    return field
+
+
+def optional(param_name: str, param_type: Any, default: Any = None) -> ParamField:
+    """Field for an optional parameter, returning default when absent."""
+    type_name = _type_name(param_type)
+    to_int = isinstance(param_type, tuple) and float in param_type
+
+    def field(args: Dict[str, Any]) -> Tuple[Any, Optional[Exception]]:
+        value = args.get(param_name, _MISSING)
+        if value is _MISSING:
+            return default, None
+        if not isinstance(value, param_type):
+            return None, ValueError(f"parameter {param_name} is not of type {type_name}, got {type(value).__name__}")
+        if to_int and type(value) is float:
+            value = int(value)
+        return value, None
+
+    return field
+
+
+def optional_int(param_name: str, default: Optional[int] = None) -> ParamField:
+    """Field for an optional integer parameter; floats are truncated to int."""
+    return optional(param_name, (int, float), default)
+
+
+def optional_bool(param_name: str, default: bool) -> ParamField:
+    """Field for an optional boolean parameter with a default value."""
+    return optional(param_name, bool, default)
+
+
+def optional_string_array(param_name: str) -> ParamField:
+    """Field for an optional list of strings, returning [] when absent."""
+    def field(args: Dict[str, Any]) -> Tuple[Any, Optional[Exception]]:
+        value = args.get(param_name)
+        if value is None:
+            return [], None
+        if type(value) is not list:
+            return None, ValueError(f"parameter {param_name} could not be coerced to []string, got {type(value).__name__}")
+        if not all(isinstance(item, str) for item in value):
+            bad = next(item for item in value if not isinstance(item, str))
+            return None, ValueError(f"parameter {param_name} contains non-string element: {type(bad).__name__}")
+        return list(value), None
+
+    return field
+
+
+def optional_int_array(param_name: str, max_items: Optional[int] = None) -> ParamField:
+    """
+    Field for an optional list of integers, returning [] when absent.
+    Whole-number floats are converted to int; lists longer than max_items
+    are rejected.
+    """
+    def field(args: Dict[str, Any]) -> Tuple[Any, Optional[Exception]]:
+        value = args.get(param_name)
+        if value is None:
+            return [], None
+        if type(value) is not list:
+            return None, ValueError(f"parameter {param_name} could not be coerced to []int, got {type(value).__name__}")
+        if max_items is not None and len(value) > max_items:
+            return None, ValueError(f"parameter {param_name} has {len(value)} elements, at most {max_items} allowed")
+        items = []
+        for item in value:
+            if type(item) is float and item.is_integer():
+                item = int(item)
+            elif type(item) is not int:
+                return None, ValueError(f"parameter {param_name} contains non-integer element: {item!r}")
+            items.append(item)
+        return items, None
+
+    return field
+
+
+def compile_params(*fields: ParamField) -> Callable[[CallToolRequest], Tuple[Optional[tuple], Optional[Exception]]]:
+    """
+    Combine fields into one parser returning (values, err).
+    Values are returned as a tuple in field order; parsing stops at the
+    first error.
+    """
+    def parse(request: CallToolRequest) -> Tuple[Optional[tuple], Optional[Exception]]:
+        args = request.arguments
+        values = []
+        for field in fields:
+            value, err = field(args)
+            if err:
+                return None, err
+            values.append(value)
+        return tuple(values), None
+
+    return parse
+
+
+def pagination() -> ParamField:
+    """Field yielding PaginationParams from page, perPage and after."""
+    page_field = optional_int("page", 1)
+    per_page_field = optional_int("perPage", 30)
+    after_field = optional("after", str)
+
+    def field(args: Dict[str, Any]) -> Tuple[Any, Optional[Exception]]:
+        page, err = page_field(args)
+        if err:
+            return None, err
+        per_page, err = per_page_field(args)
+        if err:
+            return None, err
+        after, err = after_field(args)
+        if err:
+            return None, err
+        return PaginationParams(page=page, per_page=per_page, after=after or ""), None
+
+    return field
+
+
+_pagination_field = pagination()
+
+
 def to_bool_ptr(b: bool) -> Optional[bool]:
     """Convert a bool to a boolean pointer."""
     return b
@@ -233,16 +398,117 @@ def to_string_ptr(s: str) -> Optional[str]:
     return s if s else None
 
 
+def error_result(message: str) -> CallToolResult:
+    """Create an error CallToolResult with the given message."""
+    return CallToolResult(content=[TextContent(type="text", text=message)], isError=True)
+
+
+def tool_handler(name: str) -> Callable[[Callable], Callable]:
+    """
+    Decorator for tool handlers that turns unexpected exceptions into error
+    results, so handlers only need their own try/except around API calls.
+    """
+    def decorator(handler: Callable) -> Callable:
+        @functools.wraps(handler)
+        def wrapper(ctx: Any, request: CallToolRequest) -> CallToolResult:
+            try:
+                return handler(ctx, request)
+            except Exception as e:
+                logger.error("Error in %s handler: %s", name, e)
+                return error_result(str(e))
+        return wrapper
+    return decorator
+
+
+def run_in_thread(handler: Callable) -> Callable:
+    """
+    Make a blocking tool handler awaitable. Each call runs on a worker
+    thread via asyncio.to_thread, so PyGithub's synchronous HTTP requests
+    don't stall the event loop while other tool calls are in flight.
+    """
+    @functools.wraps(handler)
+    async def wrapper(ctx: Any, request: CallToolRequest) -> CallToolResult:
+        return await asyncio.to_thread(handler, ctx, request)
+    return wrapper
+
+
+def get_repository(client: Any, owner: str, repo: str) -> Any:
+    """
+    Return a lazy Repository for owner/repo. Building it sends no request;
+    only the tool's own API call (get_issue, get_contents, ...) does.
+    """
+    return client.get_repo(f"{owner}/{repo}", lazy=True)
+
+
+class Fields:
+    """
+    (name, default) pairs describing how an API object maps to a result dict.
+    All fields are fetched in a single C-level attrgetter call (itemgetter
+    for raw JSON dicts); objects missing a field fall back to per-field
+    lookups with its default.
+    """
+    __slots__ = ('pairs', 'keys', 'getter', 'item_getter')
+
+    def __init__(self, *pairs: Tuple[str, Any]):
+        self.pairs = pairs
+        self.keys = tuple(key for key, _ in pairs)
+        self.getter = operator.attrgetter(*self.keys)
+        self.item_getter = operator.itemgetter(*self.keys)
+
+    def extract(self, obj: Any) -> Dict[str, Any]:
+        """Read the fields of obj, an API object or its JSON dict, into a dictionary."""
+        if isinstance(obj, dict):
+            try:
+                values = self.item_getter(obj)
+            except KeyError:
+                return {key: obj.get(key, default) for key, default in self.pairs}
+        else:
+            try:
+                values = self.getter(obj)
+            except AttributeError:
+                return {key: getattr(obj, key, default) for key, default in self.pairs}
+        if len(self.keys) == 1:
+            values = (values,)
+        return dict(zip(self.keys, values))
+
+
+def get_field(obj: Any, name: str, default: Any = None) -> Any:
+    """Read one field from an API object or its raw JSON dict."""
+    if isinstance(obj, dict):
+        return obj.get(name, default)
+    return getattr(obj, name, default)
+
+
+def _json_default(value: Any) -> Any:
+    """Encode values the JSON encoders don't handle natively."""
+    if isinstance(value, datetime):
+        # UTC as a trailing Z, the form the GitHub API itself returns
+        if value.utcoffset() == timedelta(0):
+            return value.replace(tzinfo=None).isoformat() + 'Z'
+        return value.isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if is_dataclass(value):
+        return asdict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
 def marshalled_text_result(data: Any) -> CallToolResult:
     """
     Create a CallToolResult with JSON-marshalled data.
+    Datetimes are encoded as ISO-8601 strings, with UTC written as Z like
+    the raw API JSON, so converters can pass either through unformatted.
+    Dataclasses are encoded as objects.
     """
     try:
-        json_data = json.dumps(data)
-        return CallToolResult(type="text", text=json_data)
+        if orjson is not None:
+            json_data = orjson.dumps(data, default=_json_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z).decode('utf-8')
+        else:
+            json_data = json.dumps(data, default=_json_default)
+        return CallToolResult(content=[TextContent(type="text", text=json_data)])
     except Exception as e:
-        logger.error(f"Failed to marshal text result to JSON: {e}")
-        return CallToolResult(type="error", error={"message": f"failed to marshal text result to json: {e}"})
+        logger.exception("Failed to marshal text result to JSON: %s", e)
+        return error_result(f"failed to marshal text result to json: {e}")
 
 
 class GitHubMCPServer:
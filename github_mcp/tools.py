@@ -3,7 +3,8 @@ GitHub MCP Tools - Toolset definitions and organization
 Converted from github-mcp-server/pkg/github/tools.go
 """
 
-from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple
+import functools
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Protocol, Tuple
 from mcp import Tool
 import logging
 
@@ -16,9 +17,47 @@ TranslationHelperFunc = Callable[[str, str], str]
 
 DEFAULT_TOOLS = ["all"]
 
+# Tools that modify state, registered as write tools in their toolset
+_REPO_WRITE = frozenset({'create_or_update_file', 'create_branch', 'push_files', 'delete_file'})
+
+_ISSUE_WRITE = frozenset({
+    'create_issue', 'update_issue', 'add_issue_comment', 'add_sub_issue', 'remove_sub_issue',
+    'reprioritize_sub_issue'
+})
+
+_PR_WRITE = frozenset({
+    'create_pull_request', 'merge_pull_request', 'update_pull_request',
+    'create_and_submit_pull_request_review', 'create_pending_pull_request_review',
+    'add_comment_to_pending_review', 'submit_pending_pull_request_review'
+})
+
+_ACTIONS_WRITE = frozenset({
+    'run_workflow', 'rerun_workflow_run', 'rerun_failed_jobs', 'cancel_workflow_run',
+    'delete_workflow_run_logs'
+})
+
+# Miscellaneous tools by name: (toolset name, is write tool). Unlisted tools
+# are notification read tools.
+_MISC_ROUTE: Dict[str, Tuple[str, bool]] = {
+    'list_notifications': ('notifications', False),
+    'get_notification_details': ('notifications', False),
+    'dismiss_notification': ('notifications', True),
+    'mark_all_notifications_read': ('notifications', True),
+    'manage_notification_subscription': ('notifications', True),
+    'manage_repository_notification_subscription': ('notifications', True),
+    'list_gists': ('gists', False),
+    'create_gist': ('gists', True),
+    'update_gist': ('gists', True),
+    'get_discussion': ('discussions', False),
+    'list_discussions': ('discussions', False),
+    'get_discussion_comments': ('discussions', False),
+    'list_discussion_categories': ('discussions', False),
+}
+
 
 class Toolset:
     """Represents a collection of related tools."""
+    __slots__ = ('name', 'description', 'read_tools', 'write_tools', 'resource_templates', 'prompts', 'enabled')
 
     def __init__(self, name: str, description: str):
         self.name = name
@@ -39,6 +78,16 @@ class Toolset:
         self.write_tools.extend(tools_and_handlers)
         return self
 
+    def add_read_tool(self, tool_and_handler: Tuple[Tool, Callable]) -> 'Toolset':
+        """Add a single read-only tool to this toolset."""
+        self.read_tools.append(tool_and_handler)
+        return self
+
+    def add_write_tool(self, tool_and_handler: Tuple[Tool, Callable]) -> 'Toolset':
+        """Add a single write tool to this toolset."""
+        self.write_tools.append(tool_and_handler)
+        return self
+
     def add_resource_templates(self, *templates: Any) -> 'Toolset':
         """Add resource templates to this toolset."""
         self.resource_templates.extend(templates)
@@ -49,9 +98,20 @@ class Toolset:
         self.prompts.extend(prompts)
         return self
 
+    def copy(self) -> 'Toolset':
+        """Return a copy whose lists and enabled flag can change independently of this one."""
+        toolset = Toolset(self.name, self.description)
+        toolset.read_tools = list(self.read_tools)
+        toolset.write_tools = list(self.write_tools)
+        toolset.resource_templates = list(self.resource_templates)
+        toolset.prompts = list(self.prompts)
+        toolset.enabled = self.enabled
+        return toolset
+
 
 class ToolsetGroup:
     """Manages a group of toolsets."""
+    __slots__ = ('read_only', 'toolsets')
 
     def __init__(self, read_only: bool = False):
         self.read_only = read_only
@@ -73,70 +133,75 @@ class ToolsetGroup:
         return [ts for ts in self.toolsets.values() if ts.enabled]
 
 
-def default_toolset_group(
-    read_only: bool,
+@functools.lru_cache(maxsize=8)
+def _build_default_toolsets(
     get_client: GetClientFn,
     get_gql_client: GetGQLClientFn,
-    get_raw_client: Optional[Callable] = None,
-    translator: Optional[TranslationHelperFunc] = None,
-    content_window_size: int = 5000
-) -> ToolsetGroup:
+    get_raw_client: Optional[Callable],
+    translator: Optional[TranslationHelperFunc],
+    wanted: Optional[FrozenSet[str]]
+) -> Tuple[Toolset, ...]:
     """
-    Create the default toolset group with all available GitHub tools.
+    Build the default toolsets once per combination of callables.
+    A missing translator is passed through as None, so each tool module
+    falls back to its own default and its tool cache can still hit.
+    Tool modules are only imported and built for toolsets in wanted (all
+    when None); the other toolsets are still returned, empty.
     """
-    if translator is None:
-        translator = lambda key, default: default
-
-    tsg = ToolsetGroup(read_only=read_only)
-
-    # Import tool modules here when they exist
-    from . import repositories, issues, pullrequests, actions, security, misc_tools
+    def wants(*names: str) -> bool:
+        return wanted is None or not wanted.isdisjoint(names)
 
     repos = Toolset("repos", "GitHub Repository related tools")
     repos.enabled = True  # Enable by default
 
     # Add repository tools
-    try:
-        repo_tools = repositories.get_repository_tools(get_client, None, translator)
-        for tool, handler in repo_tools:
-            # Classify tools as read or write based on their names
-            if tool.name in ['create_or_update_file', 'create_branch', 'push_files', 'delete_file']:
-                repos.add_write_tools((tool, handler))
-            else:
-                repos.add_read_tools((tool, handler))
-    except AttributeError:
-        # repositories module might not have the function yet
-        pass
+    if wants('repos'):
+        try:
+            from . import repositories
+            repo_tools = repositories.get_repository_tools(get_client, get_raw_client, translator)
+            for tool, handler in repo_tools:
+                # Classify tools as read or write based on their names
+                if tool.name in _REPO_WRITE:
+                    repos.add_write_tool((tool, handler))
+                else:
+                    repos.add_read_tool((tool, handler))
+        except AttributeError:
+            # repositories module might not have the function yet
+            pass
 
     issues_toolset = Toolset("issues", "GitHub Issues related tools")
     issues_toolset.enabled = True
 
     # Add issue tools
-    try:
-        issue_tools = issues.get_issue_tools(get_client, get_gql_client, translator)
-        for tool, handler in issue_tools:
-            if tool.name in ['create_issue', 'update_issue', 'add_issue_comment', 'add_sub_issue', 'remove_sub_issue', 'reprioritize_sub_issue']:
-                issues_toolset.add_write_tools((tool, handler))
-            else:
-                issues_toolset.add_read_tools((tool, handler))
-    except AttributeError:
-        # issues module might not have the function yet
-        pass
+    if wants('issues'):
+        try:
+            from . import issues
+            issue_tools = issues.get_issue_tools(get_client, get_gql_client, translator)
+            for tool, handler in issue_tools:
+                if tool.name in _ISSUE_WRITE:
+                    issues_toolset.add_write_tool((tool, handler))
+                else:
+                    issues_toolset.add_read_tool((tool, handler))
+        except AttributeError:
+            # issues module might not have the function yet
+            pass
 
     pull_requests = Toolset("pull_requests", "GitHub Pull Request related tools")
     pull_requests.enabled = True
 
     # Add pull request tools
-    try:
-        pr_tools = pullrequests.get_pull_request_tools(get_client, get_gql_client, translator)
-        for tool, handler in pr_tools:
-            if tool.name in ['create_pull_request', 'merge_pull_request', 'update_pull_request', 'create_and_submit_pull_request_review', 'create_pending_pull_request_review', 'add_comment_to_pending_review', 'submit_pending_pull_request_review']:
-                pull_requests.add_write_tools((tool, handler))
-            else:
-                pull_requests.add_read_tools((tool, handler))
-    except AttributeError:
-        # pullrequests module might not have the function yet
-        pass
+    if wants('pull_requests'):
+        try:
+            from . import pullrequests
+            pr_tools = pullrequests.get_pull_request_tools(get_client, get_gql_client, translator)
+            for tool, handler in pr_tools:
+                if tool.name in _PR_WRITE:
+                    pull_requests.add_write_tool((tool, handler))
+                else:
+                    pull_requests.add_read_tool((tool, handler))
+        except AttributeError:
+            # pullrequests module might not have the function yet
+            pass
 
 
 
@@ -156,23 +221,24 @@ def default_toolset_group(
     dependabot.enabled = True
 
     # Add security tools
-    try:
-        from . import security as security_module
-        security_tools = security_module.get_security_tools(get_client, translator)
-
-        # Distribute tools to appropriate toolsets
-        for tool, handler in security_tools:
-            if 'dependabot' in tool.name:
-                dependabot.add_read_tools((tool, handler))
-            elif 'code_scanning' in tool.name:
-                code_security.add_read_tools((tool, handler))
-            else:
-                # Add to both toolsets if not specific
-                code_security.add_read_tools((tool, handler))
-                dependabot.add_read_tools((tool, handler))
-    except (AttributeError, ImportError):
-        # security module might not have the function yet
-        pass
+    if wants('dependabot', 'code_security'):
+        try:
+            from . import security as security_module
+            security_tools = security_module.get_security_tools(get_client, translator)
+
+            # Distribute tools to appropriate toolsets
+            for tool, handler in security_tools:
+                if 'dependabot' in tool.name:
+                    dependabot.add_read_tool((tool, handler))
+                elif 'code_scanning' in tool.name:
+                    code_security.add_read_tool((tool, handler))
+                else:
+                    # Add to both toolsets if not specific
+                    code_security.add_read_tool((tool, handler))
+                    dependabot.add_read_tool((tool, handler))
+        except (AttributeError, ImportError):
+            # security module might not have the function yet
+            pass
 
     notifications = Toolset("notifications", "GitHub Notifications related tools")
     notifications.enabled = True
@@ -184,17 +250,18 @@ def default_toolset_group(
     actions.enabled = True
 
     # Add actions tools
-    try:
-        from . import actions as actions_module
-        action_tools = actions_module.get_actions_tools(get_client, translator)
-        for tool, handler in action_tools:
-            if tool.name in ['run_workflow', 'rerun_workflow_run', 'rerun_failed_jobs', 'cancel_workflow_run', 'delete_workflow_run_logs']:
-                actions.add_write_tools((tool, handler))
-            else:
-                actions.add_read_tools((tool, handler))
-    except (AttributeError, ImportError):
-        # actions module might not have the function yet
-        pass
+    if wants('actions'):
+        try:
+            from . import actions as actions_module
+            action_tools = actions_module.get_actions_tools(get_client, translator)
+            for tool, handler in action_tools:
+                if tool.name in _ACTIONS_WRITE:
+                    actions.add_write_tool((tool, handler))
+                else:
+                    actions.add_read_tool((tool, handler))
+        except (AttributeError, ImportError):
+            # actions module might not have the function yet
+            pass
 
     security_advisories = Toolset("security_advisories", "Security advisories related tools")
     security_advisories.enabled = True
@@ -207,48 +274,72 @@ def default_toolset_group(
     gists.enabled = True
 
     # Add miscellaneous tools after all toolsets are defined
-    try:
-        misc_tools_list = misc_tools.get_misc_tools(get_client, get_gql_client, translator)
-
-        # Distribute tools to appropriate toolsets
-        for tool, handler in misc_tools_list:
-            if tool.name in ['list_notifications', 'get_notification_details']:
-                notifications.add_read_tools((tool, handler))
-            elif tool.name in ['list_gists']:
-                gists.add_read_tools((tool, handler))
-            elif tool.name in ['create_gist', 'update_gist']:
-                gists.add_write_tools((tool, handler))
-            elif tool.name in ['get_discussion', 'list_discussions', 'get_discussion_comments', 'list_discussion_categories']:
-                discussions.add_read_tools((tool, handler))
-            elif tool.name in ['dismiss_notification', 'mark_all_notifications_read', 'manage_notification_subscription', 'manage_repository_notification_subscription']:
-                notifications.add_write_tools((tool, handler))
-            else:
-                # Add to notifications by default for other notification-related tools
-                notifications.add_read_tools((tool, handler))
-    except (AttributeError, ImportError):
-        # misc_tools module might not have the function yet
-        pass
+    if wants('notifications', 'gists', 'discussions'):
+        try:
+            from . import misc_tools
+            misc_tools_list = misc_tools.get_misc_tools(get_client, get_gql_client, translator)
+
+            # Distribute tools to appropriate toolsets
+            misc_toolsets = {'notifications': notifications, 'gists': gists, 'discussions': discussions}
+            for tool, handler in misc_tools_list:
+                toolset_name, is_write = _MISC_ROUTE.get(tool.name, ('notifications', False))
+                if is_write:
+                    misc_toolsets[toolset_name].add_write_tool((tool, handler))
+                else:
+                    misc_toolsets[toolset_name].add_read_tool((tool, handler))
+        except (AttributeError, ImportError):
+            # misc_tools module might not have the function yet
+            pass
 
     # Experiments toolset (placeholder)
     experiments = Toolset("experiments", "Experimental features")
     experiments.enabled = False
 
-    # Add all toolsets to the group
-    tsg.add_toolset(context_tools)
-    tsg.add_toolset(repos)
-    tsg.add_toolset(issues_toolset)
-    tsg.add_toolset(orgs)
-    tsg.add_toolset(users)
-    tsg.add_toolset(pull_requests)
-    tsg.add_toolset(actions)
-    tsg.add_toolset(code_security)
-    tsg.add_toolset(secret_protection)
-    tsg.add_toolset(dependabot)
-    tsg.add_toolset(notifications)
-    tsg.add_toolset(experiments)
-    tsg.add_toolset(discussions)
-    tsg.add_toolset(gists)
-    tsg.add_toolset(security_advisories)
+    # All toolsets, in the order they are added to the group
+    return (
+        context_tools,
+        repos,
+        issues_toolset,
+        orgs,
+        users,
+        pull_requests,
+        actions,
+        code_security,
+        secret_protection,
+        dependabot,
+        notifications,
+        experiments,
+        discussions,
+        gists,
+        security_advisories,
+    )
+
+
+def default_toolset_group(
+    read_only: bool,
+    get_client: GetClientFn,
+    get_gql_client: GetGQLClientFn,
+    get_raw_client: Optional[Callable] = None,
+    translator: Optional[TranslationHelperFunc] = None,
+    content_window_size: int = 5000,
+    enabled_toolsets: Optional[Iterable[str]] = None
+) -> ToolsetGroup:
+    """
+    Create the default toolset group with all available GitHub tools.
+    Tools are built once per combination of callables; each group gets its
+    own Toolset copies, so enabling toolsets on one group leaves others alone.
+    When enabled_toolsets names the toolsets the caller will enable (without
+    "all"), tools are only built for those; every toolset name still exists.
+    """
+    wanted = None
+    if enabled_toolsets is not None:
+        wanted = frozenset(enabled_toolsets)
+        if not wanted or "all" in wanted:
+            wanted = None
+
+    tsg = ToolsetGroup(read_only=read_only)
+    for toolset in _build_default_toolsets(get_client, get_gql_client, get_raw_client, translator, wanted):
+        tsg.add_toolset(toolset.copy())
 
     return tsg
 
@@ -262,7 +353,8 @@ def init_dynamic_toolset(
     Create a dynamic toolset for enabling other toolsets.
     """
     if translator is None:
-        translator = lambda key, default: default
+        from .server import default_translator
+        translator = default_translator
 
     dynamic_toolset = Toolset(
         "dynamic",
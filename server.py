@@ -1,16 +1,34 @@
 import os
 import sys
 import argparse
+import functools
 import logging
-from mcp.server.fastmcp import FastMCP
-from github_mcp.server import GitHubMCPServer
-from github_mcp.clients import GitHubClientConfig, get_rest_client_factory, get_graphql_client_factory
-from github_mcp.tools import default_toolset_group
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=8)
+def _client_factories(tokens, host):
+    """
+    Build the REST, GraphQL and raw client factories once per (tokens, host).
+    Reusing the same factories lets repeated create_server calls share
+    clients and hit the toolset cache, which is keyed on the factories.
+    """
+    from github_mcp.clients import GitHubClientConfig, get_rest_client_factory, get_graphql_client_factory, get_raw_client_factory
+
+    # Create GitHub client configuration
+    client_config = GitHubClientConfig(
+        token=tokens[0],
+        host=host,
+        version="1.0.0",
+        tokens=list(tokens)
+    )
+
+    return (
+        get_rest_client_factory(client_config),
+        get_graphql_client_factory(client_config),
+        get_raw_client_factory(client_config)
+    )
+
 def create_server(args):
     """Create the GitHub MCP server with the given configuration."""
 
@@ -20,43 +38,44 @@ def create_server(args):
         logger.error("GitHub token is required. Set GITHUB_PERSONAL_ACCESS_TOKEN environment variable or use --token")
         sys.exit(1)
 
-    # Create GitHub client configuration
-    client_config = GitHubClientConfig(
-        token=token,
-        host=args.host,
-        version="1.0.0"
-    )
+    # Import the MCP stack only once a server is actually being built, so
+    # --help and configuration errors don't pay for loading it
+    from mcp.server.fastmcp import FastMCP
+    from github_mcp.tools import default_toolset_group
 
     # Create client factories
-    get_client = get_rest_client_factory(client_config)
-    get_gql_client = get_graphql_client_factory(client_config)
+    # Several comma-separated tokens are used in rotation
+    tokens = tuple(t.strip() for t in token.split(",") if t.strip()) or (token,)
+    get_client, get_gql_client, get_raw_client = _client_factories(tokens, args.host)
+
+    # Requested toolset names, deduplicated
+    requested = frozenset(args.toolsets or ())
 
     # Create toolset group
     toolset_group = default_toolset_group(
         read_only=args.read_only,
         get_client=get_client,
-        get_gql_client=get_gql_client
+        get_gql_client=get_gql_client,
+        get_raw_client=get_raw_client,
+        enabled_toolsets=requested
     )
 
     # Enable specified toolsets or all by default
-    if args.toolsets and args.toolsets != ["all"]:
-        # First disable all toolsets
-        for toolset in toolset_group.toolsets.values():
-            toolset.enabled = False
-
-        # Enable only specified toolsets
-        for toolset_name in args.toolsets:
-            if toolset_name == "all":
-                # Enable all toolsets
-                for toolset in toolset_group.toolsets.values():
-                    toolset.enabled = True
-                logger.info("Enabled all toolsets (explicit 'all' specified)")
-                break
-            elif toolset_name in toolset_group.toolsets:
-                toolset_group.toolsets[toolset_name].enabled = True
-                logger.info(f"Enabled toolset: {toolset_name}")
-            else:
-                logger.warning(f"Toolset '{toolset_name}' not found")
+    if requested and requested != {"all"}:
+        toolsets = toolset_group.toolsets
+        if "all" in requested:
+            # "all" alongside other names enables every toolset
+            enabled_names = toolsets.keys()
+            logger.info("Enabled all toolsets (explicit 'all' specified)")
+        else:
+            enabled_names = requested & toolsets.keys()
+            for toolset_name in sorted(requested - enabled_names):
+                logger.warning("Toolset '%s' not found", toolset_name)
+            logger.info("Enabled toolsets: %s", ", ".join(sorted(enabled_names)))
+
+        # One pass sets every toolset's state
+        for toolset_name, toolset in toolsets.items():
+            toolset.enabled = toolset_name in enabled_names
     else:
         # Enable all toolsets by default (this is the default behavior)
         logger.info("Enabled all toolsets by default")
@@ -64,41 +83,28 @@ def create_server(args):
     # Create FastMCP server
     mcp = FastMCP(name="github-mcp-server")
 
-    # Register tools from enabled toolsets
+    # Flatten the enabled toolsets into (handler, name, description) records;
+    # write tools only when not read-only
+    enabled_toolsets = toolset_group.get_enabled_toolsets()
+    read_only = toolset_group.read_only
+    plan = tuple(
+        (handler, tool_obj.name, tool_obj.description)
+        for toolset in enabled_toolsets
+        for tool_obj, handler in (toolset.read_tools if read_only else (*toolset.read_tools, *toolset.write_tools))
+    )
+
+    # Register them in one pass
     tool_count = 0
-    for toolset in toolset_group.get_enabled_toolsets():
-        logger.info(f"Registering tools from toolset: {toolset.name}")
-
-        # Register read tools
-        for tool_obj, handler in toolset.read_tools:
-            logger.info(f"Registering read tool: {tool_obj.name}")
-            try:
-                # FastMCP expects the handler function, not the Tool object
-                # Use the tool metadata from the Tool object
-                mcp.add_tool(
-                    handler,
-                    name=tool_obj.name,
-                    description=tool_obj.description
-                )
-                tool_count += 1
-            except Exception as e:
-                logger.error(f"Failed to register tool {tool_obj.name}: {e}")
-
-        # Register write tools if not in read-only mode
-        if not toolset_group.read_only:
-            for tool_obj, handler in toolset.write_tools:
-                logger.info(f"Registering write tool: {tool_obj.name}")
-                try:
-                    mcp.add_tool(
-                        handler,
-                        name=tool_obj.name,
-                        description=tool_obj.description
-                    )
-                    tool_count += 1
-                except Exception as e:
-                    logger.error(f"Failed to register tool {tool_obj.name}: {e}")
-
-    logger.info(f"Successfully registered {tool_count} tools total")
+    for handler, name, description in plan:
+        logger.debug("Registering tool: %s", name)
+        try:
+            # FastMCP expects the handler function, not the Tool object
+            mcp.add_tool(handler, name=name, description=description)
+            tool_count += 1
+        except Exception as e:
+            logger.error("Failed to register tool %s: %s", name, e)
+
+    logger.info("Successfully registered %d tools from %d toolsets", tool_count, len(enabled_toolsets))
 
     logger.info("GitHub MCP server initialized successfully")
     return mcp
@@ -106,26 +112,34 @@ def create_server(args):
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(description="GitHub MCP Server")
-    parser.add_argument("--token", help="GitHub Personal Access Token")
+    parser.add_argument("--token", help="GitHub Personal Access Token (comma-separated for several)")
     parser.add_argument("--host", default="github.com", help="GitHub hostname (default: github.com)")
     parser.add_argument("--read-only", action="store_true", help="Restrict to read-only operations")
-    parser.add_argument("--toolsets", nargs="*", help="List of toolsets to enable")
+    parser.add_argument("--toolsets", nargs="*", type=sys.intern, help="List of toolsets to enable")
+    parser.add_argument("--transport", default="stdio", choices=["stdio", "streamable-http"],
+                       help="MCP transport to serve on (default: stdio)")
     parser.add_argument("--log-level", default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"],
                        help="Set logging level")
 
     args = parser.parse_args()
 
-    # Configure logging
+    # Fail fast on a missing token, before configuring logging or loading the MCP stack
+    args.token = args.token or os.getenv("GITHUB_PERSONAL_ACCESS_TOKEN")
+    if not args.token:
+        parser.error("GitHub token is required. Set GITHUB_PERSONAL_ACCESS_TOKEN environment variable or use --token")
+
+    # Configure logging; force replaces any handlers a dependency installed on the root logger
     logging.basicConfig(
         level=getattr(logging, args.log_level),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        force=True
     )
 
     try:
         mcp = create_server(args)
         if mcp:
-            # Start the server with stdio transport (matching Go version)
-            mcp.run(transport="streamable-http")
+            # Start the server; stdio by default, matching the Go version
+            mcp.run(transport=args.transport)
         else:
             logger.error("Failed to initialize MCP server")
             sys.exit(1)
@@ -134,6 +148,11 @@ def main():
     except Exception as e:
         logger.error(f"Server startup failed: {e}")
         sys.exit(1)
+    finally:
+        # Close the pooled HTTP sessions if the client module was loaded
+        clients = sys.modules.get("github_mcp.clients")
+        if clients is not None:
+            clients.close_sessions()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+Tests for the GitHub client plumbing, run against a local HTTP server
+"""
+
+import gzip
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+import requests
+from github import Github
+from github_mcp.clients import (
+    CachingHTTPAdapter, ETagCache, GraphQLClient, _install_etag_cache, _PooledClientFactory,
+    _remaining, pick_by_remaining
+)
+from github_mcp.repositories import _fetch_commit
+from github_mcp.server import get_repository
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    """Answers every request with its own method, path and body, after a short delay."""
+
+    def _echo(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length).decode() if length else None
+        time.sleep(0.01)
+        payload = json.dumps({'method': self.command, 'path': self.path, 'body': body}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = _echo
+    do_PUT = _echo
+
+    def log_message(self, *args):
+        pass
+
+
+class ETagHandler(BaseHTTPRequestHandler):
+    """Serves a gzip-encoded JSON body with an ETag, and 304 once the ETag is sent back."""
+    body = json.dumps({'hello': 'world'}).encode()
+    seen = []
+
+    def do_GET(self):
+        type(self).seen.append((self.headers.get('Authorization'), self.headers.get('If-None-Match')))
+        if self.headers.get('If-None-Match') == '"v1"':
+            self.send_response(304)
+            self.send_header('ETag', '"v1"')
+            self.send_header('X-RateLimit-Remaining', '4999')
+            self.end_headers()
+            return
+        payload = gzip.compress(self.body)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(payload)))
+        self.send_header('ETag', '"v1"')
+        self.send_header('X-RateLimit-Remaining', '5000')
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeAPIHandler(BaseHTTPRequestHandler):
+    """Serves canned JSON per path from routes, after delay seconds, and records every request path in seen."""
+    routes = {}
+    seen = []
+    delay = 0
+
+    def do_GET(self):
+        type(self).seen.append(self.path)
+        time.sleep(self.delay)
+        status, data = self.routes.get(self.path.partition('?')[0], (404, {'message': 'Not Found'}))
+        payload = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class GraphQLHandler(BaseHTTPRequestHandler):
+    """Answers GraphQL POSTs slowly with a fixed result and ETag, or 304 when revalidated."""
+    result = {'data': {'viewer': {'login': 'octocat'}}}
+    posts = []
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        type(self).posts.append(self.headers.get('If-None-Match'))
+        time.sleep(0.2)
+        if self.headers.get('If-None-Match') == '"g1"':
+            self.send_response(304)
+            self.send_header('ETag', '"g1"')
+            self.end_headers()
+            return
+        payload = json.dumps(self.result).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.send_header('ETag', '"g1"')
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_server(handler):
+    """Start a threaded HTTP server on a free port and return it with its base URL."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_shared_client_across_threads():
+    """Concurrent calls on one client must each get their own response"""
+    server, base_url = start_server(EchoHandler)
+    try:
+        # No request spacing, so calls overlap on the shared connection
+        client = Github(base_url=base_url, pool_size=16, lazy=True,
+                        seconds_between_requests=None, seconds_between_writes=None)
+        _install_etag_cache(client, base_url)
+
+        # Widen the gap between request() and getresponse() so the calls interleave
+        connection_class = client.requester._Requester__connectionClass
+
+        class SlowConnection(connection_class):
+            def getresponse(self):
+                time.sleep(0.005)
+                return super().getresponse()
+
+        client.requester._Requester__connectionClass = SlowConnection
+
+        def call(i):
+            if i % 2:
+                _, data = client.requester.requestJsonAndCheck("PUT", f"/items/{i}", input={'n': i})
+                return data['method'] == 'PUT' and data['path'] == f"/items/{i}" and json.loads(data['body']) == {'n': i}
+            _, data = client.requester.requestJsonAndCheck("GET", f"/items/{i}")
+            return data['method'] == 'GET' and data['path'] == f"/items/{i}"
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(call, range(200)))
+        assert all(results)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def caching_session(cache):
+    """Return a requests session whose http:// requests go through CachingHTTPAdapter."""
+    session = requests.Session()
+    session.mount("http://", CachingHTTPAdapter(cache=cache))
+    return session
+
+
+def test_etag_replay():
+    """A 304 is replayed as a 200 with the cached body and the fresh headers"""
+    ETagHandler.seen = []
+    server, base_url = start_server(ETagHandler)
+    cache = ETagCache(16)
+    try:
+        session = caching_session(cache)
+        headers = {'Authorization': 'token one'}
+        first = session.get(f"{base_url}/doc", headers=headers)
+        second = session.get(f"{base_url}/doc", headers=headers)
+
+        assert [inm for _, inm in ETagHandler.seen] == [None, '"v1"']
+        assert first.status_code == second.status_code == 200
+        assert second.json() == {'hello': 'world'}
+        # Fresh rate limit headers from the 304; the cached body is already decoded
+        assert second.headers['X-RateLimit-Remaining'] == '4999'
+        assert second.headers['Content-Type'] == 'application/json'
+        assert 'Content-Encoding' not in second.headers
+        assert 'Content-Length' not in second.headers
+        assert cache.stats()['hits'] == 1
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_etag_cache_keyed_by_credentials():
+    """A cached response is never revalidated on behalf of a different token"""
+    ETagHandler.seen = []
+    server, base_url = start_server(ETagHandler)
+    try:
+        session = caching_session(ETagCache(16))
+        session.get(f"{base_url}/doc", headers={'Authorization': 'token one'})
+        session.get(f"{base_url}/doc", headers={'Authorization': 'token two'})
+        session.get(f"{base_url}/doc", headers={'Authorization': 'token two'})
+
+        assert ETagHandler.seen == [('token one', None), ('token two', None), ('token two', '"v1"')]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_etag_cache_byte_limits():
+    """Oversized bodies are not cached, and the total body size is bounded"""
+    cache = ETagCache(16, max_bytes=10, max_entry_bytes=6)
+    cache.put(('a', '', ''), ('"a"', b'12345', {}, None))
+    cache.put(('big', '', ''), ('"big"', b'1234567', {}, None))
+    assert cache.get(('big', '', '')) is None
+
+    cache.put(('b', '', ''), ('"b"', b'123456', {}, None))
+    assert cache.get(('a', '', '')) is None
+    assert cache.get(('b', '', '')) is not None
+    assert cache.stats()['bytes'] == 6
+
+    # Replacing an entry with an oversized body drops the stale one
+    cache.put(('b', '', ''), ('"b2"', b'1234567', {}, None))
+    assert cache.get(('b', '', '')) is None
+    assert cache.stats()['bytes'] == 0
+
+
+def start_fake_api(routes, delay=0):
+    """Start a FakeAPIHandler server with the given routes and return it with a lazy client."""
+    FakeAPIHandler.routes = routes
+    FakeAPIHandler.seen = []
+    FakeAPIHandler.delay = delay
+    server, base_url = start_server(FakeAPIHandler)
+    client = Github(base_url=base_url, lazy=True, seconds_between_requests=None, seconds_between_writes=None)
+    return server, client
+
+
+def test_get_repository_is_lazy():
+    """Chained lookups through get_repository cost only the final request"""
+    server, client = start_fake_api({'/repos/o/r/issues/1': (200, {'number': 1, 'title': 'Bug'})})
+    try:
+        issue = get_repository(client, 'o', 'r').get_issue(1)
+        assert issue.title == 'Bug'
+        assert FakeAPIHandler.seen == ['/repos/o/r/issues/1']
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def start_graphql(result):
+    """Start a GraphQLHandler server answering with result and return it with a client."""
+    GraphQLHandler.result = result
+    GraphQLHandler.posts = []
+    server, base_url = start_server(GraphQLHandler)
+    return server, GraphQLClient(requests.Session(), f"{base_url}/graphql")
+
+
+def run_together(count, fn):
+    """Call fn from count threads released at the same moment; return results or exceptions."""
+    barrier = threading.Barrier(count)
+
+    def call(_):
+        barrier.wait()
+        try:
+            return fn()
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        return list(executor.map(call, range(count)))
+
+
+def test_graphql_concurrent_queries_share_one_request():
+    """Identical concurrent queries make one request, and each caller gets its own copy"""
+    server, client = start_graphql({'data': {'viewer': {'login': 'octocat'}}})
+    try:
+        results = run_together(8, lambda: client.execute("query { viewer { login } }"))
+
+        assert GraphQLHandler.posts == [None]
+        assert all(result == {'data': {'viewer': {'login': 'octocat'}}} for result in results)
+        results[0]['data']['viewer']['login'] = 'changed'
+        assert all(result['data']['viewer']['login'] == 'octocat' for result in results[1:])
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_graphql_etag_revalidation_returns_copies():
+    """A repeated query is revalidated by ETag and the cached body decoded afresh"""
+    server, client = start_graphql({'data': {'viewer': {'login': 'octocat'}}})
+    try:
+        first = client.execute("query { viewer { login } }")
+        first['data']['viewer']['login'] = 'changed'
+        second = client.execute("query { viewer { login } }")
+
+        assert GraphQLHandler.posts == [None, '"g1"']
+        assert second == {'data': {'viewer': {'login': 'octocat'}}}
+
+        # Mutations are neither shared nor revalidated
+        client.execute("mutation { addStar(input: {}) { clientMutationId } }")
+        assert GraphQLHandler.posts[-1] is None
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_graphql_errors_reach_every_caller():
+    """A failing query raises in the leader and in every caller waiting on it"""
+    server, client = start_graphql({'errors': [{'message': 'boom'}]})
+    try:
+        results = run_together(4, lambda: client.execute("query { viewer { login } }"))
+
+        assert len(GraphQLHandler.posts) == 1
+        assert all(isinstance(result, Exception) and 'boom' in str(result) for result in results)
+        # Failed results are not cached
+        with pytest.raises(Exception):
+            client.execute("query { viewer { login } }")
+        assert GraphQLHandler.posts == [None, None]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_concurrent_commit_fetches_share_one_request():
+    """Concurrent get_commit fetches of one commit send a single request"""
+    commit = {'sha': 'abc', 'commit': {'message': 'Fix'}, 'files': []}
+    server, client = start_fake_api({'/repos/o/r/commits/abc': (200, commit)}, delay=0.2)
+    try:
+        results = run_together(6, lambda: _fetch_commit(client, 'o', 'r', 'abc'))
+
+        assert FakeAPIHandler.seen == ['/repos/o/r/commits/abc']
+        assert all(result.raw_data['sha'] == 'abc' for result in results)
+
+        # Finished fetches are not cached
+        _fetch_commit(client, 'o', 'r', 'abc')
+        assert len(FakeAPIHandler.seen) == 2
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_concurrent_commit_fetch_errors_reach_every_caller():
+    """A failed commit fetch raises in every caller that waited on it"""
+    server, client = start_fake_api({}, delay=0.2)
+    try:
+        results = run_together(6, lambda: _fetch_commit(client, 'o', 'r', 'missing'))
+
+        assert FakeAPIHandler.seen == ['/repos/o/r/commits/missing']
+        assert all(isinstance(result, Exception) and getattr(result, 'status', None) == 404 for result in results)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def budgets(*remaining):
+    """Return stand-in clients with the given remaining rate limit budgets."""
+    return [SimpleNamespace(name=i, rate_limit_remaining=r) for i, r in enumerate(remaining)]
+
+
+def test_pick_by_remaining():
+    """The client with the most budget wins; unknown budgets and ties follow the rotation"""
+    assert pick_by_remaining(budgets(5, 50, 10)).name == 1
+    assert pick_by_remaining(budgets(5, 50, 10), start=2).name == 1
+
+    # A client that has not made a request yet (-1) counts as a full budget
+    assert pick_by_remaining(budgets(5, -1, 10)).name == 1
+    assert pick_by_remaining(budgets(-1, 5, -1), start=1).name == 2
+
+    # Ties go to the first client at or after start
+    assert pick_by_remaining(budgets(10, 10, 10), start=1).name == 1
+    assert pick_by_remaining(budgets(10, 3, 10), start=1).name == 2
+
+
+def test_remaining_of_fresh_github_client_is_unknown():
+    """A PyGithub client that has not made a request reports an unknown budget"""
+    assert _remaining(Github(lazy=True)) == -1
+
+
+def test_pooled_client_factory_rotates():
+    """Successive calls start from the next client, so equal budgets are spread evenly"""
+    factory = _PooledClientFactory(budgets(-1, -1, -1))
+    assert [factory().name for _ in range(4)] == [0, 1, 2, 0]
+
+    factory = _PooledClientFactory(budgets(100, 4000, 100))
+    assert [factory().name for _ in range(3)] == [1, 1, 1]
+
+
+if __name__ == "__main__":
+    test_shared_client_across_threads()
+    test_etag_replay()
+    test_etag_cache_keyed_by_credentials()
+    test_etag_cache_byte_limits()
+    test_get_repository_is_lazy()
+    test_graphql_concurrent_queries_share_one_request()
+    test_graphql_etag_revalidation_returns_copies()
+    test_graphql_errors_reach_every_caller()
+    test_concurrent_commit_fetches_share_one_request()
+    test_concurrent_commit_fetch_errors_reach_every_caller()
+    test_pick_by_remaining()
+    test_remaining_of_fresh_github_client_is_unknown()
+    test_pooled_client_factory_rotates()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared tool helpers in github_mcp.server
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import github_mcp.server as server
+from github_mcp.server import (
+    compile_params, required, optional, optional_int, optional_bool, optional_string_array,
+    optional_int_array, pagination, marshalled_text_result
+)
+
+
+def marshal(data):
+    """Return the JSON text marshalled_text_result produces for data."""
+    return marshalled_text_result(data).content[0].text
+
+
+def test_timestamps_use_utc_z(monkeypatch):
+    """UTC datetimes are written with Z, matching raw API timestamps, on both encoders"""
+    data = {
+        'utc': datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        'offset': datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=2))),
+        'raw': '2024-01-02T03:04:05Z'
+    }
+    expected = {'utc': '2024-01-02T03:04:05Z', 'offset': '2024-01-02T03:04:05+02:00', 'raw': '2024-01-02T03:04:05Z'}
+    assert json.loads(marshal(data)) == expected
+
+    monkeypatch.setattr(server, 'orjson', None)
+    assert json.loads(marshal(data)) == expected
+
+
+def parse(parser, **arguments):
+    """Run a compiled parser on a request carrying arguments."""
+    return parser(SimpleNamespace(arguments=arguments))
+
+
+def test_required_fields():
+    """Required fields reject missing, empty and wrongly typed values"""
+    parser = compile_params(required("owner", str), required("number", (int, float)))
+
+    assert parse(parser, owner="o", number=3) == (("o", 3), None)
+    # Floats are truncated to int when int is accepted
+    assert parse(parser, owner="o", number=3.0) == (("o", 3), None)
+
+    values, err = parse(parser, number=3)
+    assert values is None and str(err) == "missing required parameter: owner"
+    _, err = parse(parser, owner="", number=3)
+    assert str(err) == "missing required parameter: owner"
+    _, err = parse(parser, owner="o", number=0)
+    assert str(err) == "missing required parameter: number"
+    _, err = parse(parser, owner=1, number=3)
+    assert str(err) == "parameter owner is not of type str, got int"
+
+
+def test_optional_fields():
+    """Optional fields fall back to their defaults and still check types"""
+    parser = compile_params(optional("ref", str), optional_int("page", 1), optional_bool("draft", False))
+
+    assert parse(parser) == ((None, 1, False), None)
+    assert parse(parser, ref="main", page=2.0, draft=True) == (("main", 2, True), None)
+
+    _, err = parse(parser, page="2")
+    assert str(err) == "parameter page is not of type int or float, got str"
+    _, err = parse(parser, draft="yes")
+    assert str(err) == "parameter draft is not of type bool, got str"
+
+
+def test_array_fields():
+    """Array fields default to [], check element types and enforce max_items"""
+    parser = compile_params(optional_string_array("labels"), optional_int_array("ids", 3))
+
+    assert parse(parser) == (([], []), None)
+    assert parse(parser, labels=["bug"], ids=[1, 2.0]) == ((["bug"], [1, 2]), None)
+
+    _, err = parse(parser, labels="bug")
+    assert str(err) == "parameter labels could not be coerced to []string, got str"
+    _, err = parse(parser, labels=["bug", 1])
+    assert str(err) == "parameter labels contains non-string element: int"
+    _, err = parse(parser, ids=["abc"])
+    assert str(err) == "parameter ids contains non-integer element: 'abc'"
+    _, err = parse(parser, ids=[1.5])
+    assert str(err) == "parameter ids contains non-integer element: 1.5"
+    _, err = parse(parser, ids=[True])
+    assert str(err) == "parameter ids contains non-integer element: True"
+    _, err = parse(parser, ids=[1, 2, 3, 4])
+    assert str(err) == "parameter ids has 4 elements, at most 3 allowed"
+
+
+def test_pagination_field():
+    """pagination() defaults to page 1 of 30 and validates its parameters"""
+    parser = compile_params(pagination())
+
+    (params,), err = parse(parser)
+    assert err is None
+    assert (params.page, params.per_page, params.after) == (1, 30, "")
+
+    (params,), err = parse(parser, page=3, perPage=50.0, after="cursor")
+    assert err is None
+    assert (params.page, params.per_page, params.after) == (3, 50, "cursor")
+
+    _, err = parse(parser, perPage="50")
+    assert str(err) == "parameter perPage is not of type int or float, got str"
+
+
+def test_compile_params_stops_at_first_error():
+    """Parsing stops at the first failing field"""
+    calls = []
+
+    def tracking(args):
+        calls.append(args)
+        return None, None
+
+    parser = compile_params(required("owner", str), tracking)
+    values, err = parse(parser)
+    assert values is None and err is not None
+    assert calls == []
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__])
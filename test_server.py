@@ -3,6 +3,7 @@
 Test script for GitHub MCP server configurations
 """
 
+from types import SimpleNamespace
 from server import create_server
 
 def test_server_configs():
@@ -18,15 +19,13 @@ def test_server_configs():
     for test_case in test_cases:
         print(f"\n=== Testing: {test_case['name']} ===")
 
-        class MockArgs:
-            def __init__(self, toolsets, read_only):
-                self.token = 'fake_token'
-                self.host = 'github.com'
-                self.toolsets = toolsets
-                self.read_only = read_only
-                self.log_level = 'ERROR'  # Reduce log noise
-
-        args = MockArgs(test_case['toolsets'], test_case['read_only'])
+        args = SimpleNamespace(
+            token='fake_token',
+            host='github.com',
+            toolsets=test_case['toolsets'],
+            read_only=test_case['read_only'],
+            log_level='ERROR'  # Reduce log noise
+        )
         try:
             mcp = create_server(args)
             print(f'✅ {test_case["name"]}: Success')
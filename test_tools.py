@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Tests for tool handlers, run against a local fake GitHub API
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+from github_mcp.actions import list_workflow_runs_tool, list_workflows_tool
+from github_mcp.security import get_code_scanning_alert_tool, list_dependabot_alerts_tool
+from github_mcp.server import default_translator
+from test_clients import FakeAPIHandler, start_fake_api
+
+
+def call_tool(tool_factory, client, **arguments):
+    """Build a tool around client, call it with arguments and return (is_error, text)."""
+    _, handler = tool_factory(lambda ctx: client, default_translator)
+    result = asyncio.run(handler(None, SimpleNamespace(arguments=arguments)))
+    return result.isError, result.content[0].text
+
+
+def test_get_code_scanning_alert():
+    """The alert is fetched as raw JSON in one request and converted"""
+    alert = {
+        'number': 7, 'state': 'open', 'created_at': '2024-01-02T03:04:05Z', 'updated_at': None,
+        'html_url': 'https://github.com/o/r/security/code-scanning/7',
+        'rule': {'id': 'py/sql-injection', 'severity': 'error', 'description': 'SQL injection'},
+        'tool': {'name': 'CodeQL', 'version': '2.15.0'}
+    }
+    server, client = start_fake_api({'/repos/o/r/code-scanning/alerts/7': (200, alert)})
+    try:
+        is_error, text = call_tool(get_code_scanning_alert_tool, client, owner='o', repo='r', alert_number=7)
+        assert not is_error, text
+        data = json.loads(text)
+        assert data['number'] == 7
+        assert data['rule']['id'] == 'py/sql-injection'
+        assert data['tool']['name'] == 'CodeQL'
+        assert FakeAPIHandler.seen == ['/repos/o/r/code-scanning/alerts/7']
+
+        is_error, text = call_tool(get_code_scanning_alert_tool, client, owner='o', repo='r', alert_number=8)
+        assert is_error
+        assert 'Failed to get code scanning alert 8' in text
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_list_dependabot_alerts():
+    """One page is fetched with its filters, without a repository GET first"""
+    alerts = [{'number': 1, 'state': 'open', 'security_advisory': {'ghsa_id': 'GHSA-1'}}]
+    server, client = start_fake_api({'/repos/o/r/dependabot/alerts': (200, alerts)})
+    try:
+        is_error, text = call_tool(list_dependabot_alerts_tool, client, owner='o', repo='r',
+                                   state='open', page=2, perPage=5)
+        assert not is_error, text
+        assert [alert['number'] for alert in json.loads(text)] == [1]
+        assert len(FakeAPIHandler.seen) == 1
+        path, _, query = FakeAPIHandler.seen[0].partition('?')
+        assert path == '/repos/o/r/dependabot/alerts'
+        assert sorted(query.split('&')) == ['page=2', 'per_page=5', 'state=open']
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def query_of(path):
+    """Return the sorted query parameters of a recorded request path."""
+    return sorted(path.partition('?')[2].split('&'))
+
+
+def test_list_workflows_pages():
+    """list_workflows sends page and per_page instead of reading the first page"""
+    workflows = {'total_count': 3, 'workflows': [{'id': 2, 'name': 'Second', 'state': 'active'}]}
+    server, client = start_fake_api({'/repos/o/r/actions/workflows': (200, workflows)})
+    try:
+        is_error, text = call_tool(list_workflows_tool, client, owner='o', repo='r', page=2, perPage=1)
+        assert not is_error, text
+        assert [workflow['id'] for workflow in json.loads(text)] == [2]
+        assert len(FakeAPIHandler.seen) == 1
+        assert query_of(FakeAPIHandler.seen[0]) == ['page=2', 'per_page=1']
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_list_workflow_runs_filters():
+    """list_workflow_runs sends its filters and page, per workflow when given"""
+    runs = {'total_count': 1, 'workflow_runs': [
+        {'id': 9, 'status': 'completed', 'triggering_actor': {'login': 'octocat', 'id': 1}}
+    ]}
+    server, client = start_fake_api({
+        '/repos/o/r/actions/runs': (200, runs),
+        '/repos/o/r/actions/workflows/ci.yml/runs': (200, runs),
+    })
+    try:
+        is_error, text = call_tool(list_workflow_runs_tool, client, owner='o', repo='r',
+                                   branch='main', status='completed', page=3, perPage=10)
+        assert not is_error, text
+        data = json.loads(text)
+        assert data[0]['id'] == 9
+        assert data[0]['triggering_actor']['login'] == 'octocat'
+
+        is_error, text = call_tool(list_workflow_runs_tool, client, owner='o', repo='r', workflow_id='ci.yml')
+        assert not is_error, text
+
+        paths = [path.partition('?')[0] for path in FakeAPIHandler.seen]
+        assert paths == ['/repos/o/r/actions/runs', '/repos/o/r/actions/workflows/ci.yml/runs']
+        assert query_of(FakeAPIHandler.seen[0]) == ['branch=main', 'page=3', 'per_page=10', 'status=completed']
+        assert query_of(FakeAPIHandler.seen[1]) == ['page=1', 'per_page=30']
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    test_get_code_scanning_alert()
+    test_list_dependabot_alerts()
+    test_list_workflows_pages()
+    test_list_workflow_runs_filters()